@@ -18,6 +18,7 @@ import time
 import re
 import pandas as pd
 import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -27,9 +28,17 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from dotenv import load_dotenv
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from rpa.snapshot_dom import snapshot_texto
+from rpa.cache_urls import CacheUrlsEventos, pagina_evento_valida
+
 # Cargar variables de entorno
 load_dotenv()
 
+# Evento que extrae este script
+CODIGO_EVENTO_BUSCADO = "33069"
+
 def get_driver():
     """Configurar y retornar el driver de Chrome"""
     options = webdriver.ChromeOptions()
@@ -165,7 +174,7 @@ def buscar_codigos_evento(driver):
     
     return codigos_5_digitos
 
-def hacer_clic_en_codigo(driver, codigos_5_digitos, codigo_buscado="33069"):
+def hacer_clic_en_codigo(driver, codigos_5_digitos, codigo_buscado=CODIGO_EVENTO_BUSCADO):
     """Hacer clic en un código específico"""
     print(f"\n=== PASO 7: HACER CLIC EN CÓDIGO {codigo_buscado} ===")
     
@@ -189,8 +198,8 @@ def hacer_clic_en_codigo(driver, codigos_5_digitos, codigo_buscado="33069"):
     
     return codigo_buscado
 
-def capturar_url_evento(driver):
-    """Capturar URL del evento"""
+def capturar_url_evento(driver, cache_urls=None, codigo_evento=None, fecha_texto=None):
+    """Capturar URL del evento (y guardarla en la caché de URLs)"""
     print(f"\n=== PASO 8: CAPTURAR URL DEL EVENTO ===")
     
     enlaces_evento = driver.find_elements(By.XPATH, "//a[contains(@href, 'ver_evento.php')]")
@@ -204,8 +213,25 @@ def capturar_url_evento(driver):
     url_evento = enlace_evento.get_attribute('href')
     print(f"✓ URL del evento capturada: {url_evento}")
     
+    if cache_urls is not None and codigo_evento:
+        cache_urls.registrar(codigo_evento, url_evento, fecha_texto)
+    
     return url_evento
 
+def navegar_desde_cache(driver, cache_urls, codigo_evento):
+    """Ir directo a la página del evento con la URL guardada en una corrida anterior"""
+    entrada = cache_urls.obtener(codigo_evento)
+    if not entrada:
+        return None
+    
+    print(f"\n=== ACCESO DIRECTO: URL EN CACHÉ PARA {codigo_evento} ===")
+    if navegar_a_evento_individual(driver, entrada['url']) and pagina_evento_valida(driver, codigo_evento):
+        return entrada
+    
+    print(f"✗ La URL guardada ya no lleva al evento {codigo_evento}, se usa el calendario")
+    cache_urls.invalidar(codigo_evento)
+    return None
+
 def navegar_a_evento_individual(driver, url_evento):
     """Navegar directamente a la URL del evento"""
     print(f"\n=== PASO 9: NAVEGAR A EVENTO INDIVIDUAL ===")
@@ -243,19 +269,8 @@ def extraer_datos_completos(driver, fecha_texto, codigo_evento):
         'tipo_pack': None,
     }
     
-    # Obtener todos los elementos de texto de la página
-    todos_elementos = driver.find_elements(By.XPATH, "//*[text()]")
-    elementos_relevantes = []
-    
-    for elem in todos_elementos:
-        if elem.is_displayed() and elem.text.strip():
-            texto = elem.text.strip()
-            if len(texto) > 0 and len(texto) < 500:
-                elementos_relevantes.append({
-                    'tag': elem.tag_name,
-                    'texto': texto,
-                    'elemento': elem
-                })
+    # Snapshot de todos los textos visibles en una sola llamada al navegador
+    elementos_relevantes = snapshot_texto(driver)
     
     print(f"Total de elementos con texto: {len(elementos_relevantes)}")
     
@@ -372,6 +387,7 @@ def main():
     print("Objetivo: Extraer todos los datos requeridos del evento")
     
     driver = None
+    cache_urls = CacheUrlsEventos()
     
     try:
         # Configurar driver
@@ -381,36 +397,44 @@ def main():
         # PASO 1: LOGIN
         login(driver, wait)
         
-        # PASO 2: NAVEGAR A ADICIONALES
-        navegar_a_adicionales(driver, wait)
+        # Con la URL en caché se saltean los pasos 2 a 9
+        entrada_cache = navegar_desde_cache(driver, cache_urls, CODIGO_EVENTO_BUSCADO)
         
-        # PASO 3: APLICAR FILTROS
-        aplicar_filtros(driver, wait)
-        
-        # PASO 4: BUSCAR FECHAS CORAL
-        fechas_coral = buscar_fechas_coral(driver)
-        
-        # PASO 5: HACER CLIC EN FECHA
-        fecha_texto = hacer_clic_en_fecha(driver, wait, fechas_coral)
-        if not fecha_texto:
-            return None
-        
-        # PASO 6: BUSCAR CÓDIGOS DE EVENTO
-        codigos_5_digitos = buscar_codigos_evento(driver)
-        
-        # PASO 7: HACER CLIC EN CÓDIGO
-        codigo_evento = hacer_clic_en_codigo(driver, codigos_5_digitos)
-        if not codigo_evento:
-            return None
-        
-        # PASO 8: CAPTURAR URL DEL EVENTO
-        url_evento = capturar_url_evento(driver)
-        if not url_evento:
-            return None
-        
-        # PASO 9: NAVEGAR A EVENTO INDIVIDUAL
-        if not navegar_a_evento_individual(driver, url_evento):
-            return None
+        if entrada_cache:
+            fecha_texto = entrada_cache.get('fecha')
+            codigo_evento = CODIGO_EVENTO_BUSCADO
+        else:
+            # PASO 2: NAVEGAR A ADICIONALES
+            navegar_a_adicionales(driver, wait)
+            
+            # PASO 3: APLICAR FILTROS
+            aplicar_filtros(driver, wait)
+            
+            # PASO 4: BUSCAR FECHAS CORAL
+            fechas_coral = buscar_fechas_coral(driver)
+            
+            # PASO 5: HACER CLIC EN FECHA
+            fecha_texto = hacer_clic_en_fecha(driver, wait, fechas_coral)
+            if not fecha_texto:
+                return None
+            
+            # PASO 6: BUSCAR CÓDIGOS DE EVENTO
+            codigos_5_digitos = buscar_codigos_evento(driver)
+            
+            # PASO 7: HACER CLIC EN CÓDIGO
+            codigo_evento = hacer_clic_en_codigo(driver, codigos_5_digitos)
+            if not codigo_evento:
+                return None
+            
+            # PASO 8: CAPTURAR URL DEL EVENTO
+            url_evento = capturar_url_evento(driver, cache_urls, codigo_evento, fecha_texto)
+            if not url_evento:
+                return None
+            
+            # PASO 9: NAVEGAR A EVENTO INDIVIDUAL
+            if not navegar_a_evento_individual(driver, url_evento):
+                cache_urls.invalidar(codigo_evento)
+                return None
         
         # PASO 10: EXTRAER DATOS COMPLETOS
         datos_evento = extraer_datos_completos(driver, fecha_texto, codigo_evento)
@@ -443,6 +467,8 @@ def main():
         return None
     
     finally:
+        cache_urls.guardar()
+        
         if driver:
             print("\nManteniendo navegador abierto para verificación manual...")
             print("Verifica que se pueden acceder a todos los datos específicos:")
@@ -28,17 +28,27 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
 
 # Cargar variables de entorno
 load_dotenv()
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from utils.config import config
+from cargador_masivo_csv import (
+    RegistroResultados, cargar_formularios_en_paralelo, filas_fallidas, ruta_chromedriver
+)
+
 class RPAIntegracionCoordis:
-    def __init__(self):
+    def __init__(self, csv_file="todos_los_eventos_extraidos.csv", solo_fallidos=False):
         self.driver = None
         self.wait = None
         self.datos_eventos = []
+        self.csv_file = csv_file
+        # Resultado por fila junto al CSV de entrada (para reintentar las fallidas)
+        self.solo_fallidos = solo_fallidos
+        self.ruta_resultados = f"{os.path.splitext(csv_file)[0]}_resultados_carga.csv"
         
     def configurar_driver(self):
         """Configurar el driver de Chrome para la integración"""
@@ -52,7 +62,7 @@ class RPAIntegracionCoordis:
         # chrome_options.add_argument("--headless")  # Comentado para ver el proceso
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(ruta_chromedriver())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.wait = WebDriverWait(self.driver, 20)
             print("✅ Driver configurado correctamente")
@@ -67,8 +77,8 @@ class RPAIntegracionCoordis:
         
         try:
             # Cargar datos extraídos previamente
-            if os.path.exists('todos_los_eventos_extraidos.csv'):
-                df = pd.read_csv('todos_los_eventos_extraidos.csv')
+            if os.path.exists(self.csv_file):
+                df = pd.read_csv(self.csv_file)
                 print(f"✅ Cargados {len(df)} eventos desde CSV")
                 return df
             else:
@@ -274,61 +284,99 @@ class RPAIntegracionCoordis:
             print(f"❌ Error guardando coordinación: {e}")
             return False
     
-    def procesar_todos_los_eventos(self):
-        """Procesar todos los eventos extraídos"""
-        print("🚀 Iniciando procesamiento de todos los eventos...")
+    def procesar_evento(self, evento):
+        """Cargar un evento: abrir el formulario, llenarlo y guardarlo"""
+        # Hacer clic en "NUEVA COORDINACIÓN"
+        if not self.hacer_clic_nueva_coordinacion():
+            print("❌ No se pudo acceder al formulario")
+            return False
         
-        # 1. Extraer datos
-        df = self.extraer_datos_janos()
-        if df is None or len(df) == 0:
-            print("❌ No hay datos para procesar")
+        # Llenar formulario
+        if not self.llenar_formulario_coordinacion(evento):
+            print("❌ Error llenando formulario")
             return False
         
+        # Guardar coordinación
+        if not self.guardar_coordinacion():
+            print("❌ Error guardando coordinación")
+            return False
+        
+        return True
+    
+    def procesar_en_paralelo(self, df, registro):
+        """Repartir los eventos entre varios navegadores, cada uno con su formulario"""
+        resumenes = cargar_formularios_en_paralelo(df, RPAIntegracionCoordis, config.coordis_ui_workers, registro)
+        
+        for resumen in resumenes:
+            print(f"   Navegador #{resumen['worker']}: {resumen['exitosas']}/{resumen['filas']} exitosos")
+        
+        return registro.exitosas > 0
+    
+    def procesar_en_secuencia(self, df, registro):
+        """Cargar los eventos uno por uno en el navegador propio"""
         # 2. Navegar a COORDIS
         if not self.navegar_a_coordis():
+            for index, evento in df.iterrows():
+                registro.registrar(index, evento, False, 'COORDIS no disponible', mostrar=False)
             return False
         
-        eventos_procesados = 0
-        eventos_exitosos = 0
-        
-        for index, evento in df.iterrows():
-            print(f"\n📋 Procesando evento {index + 1}/{len(df)}: {evento.get('codigo_evento', 'N/A')}")
+        for numero, (index, evento) in enumerate(df.iterrows(), start=1):
+            print(f"\n📋 Procesando evento {numero}/{len(df)}: {evento.get('codigo_evento', 'N/A')}")
             
             try:
-                # Hacer clic en "NUEVA COORDINACIÓN"
-                if not self.hacer_clic_nueva_coordinacion():
-                    print("❌ No se pudo acceder al formulario")
-                    continue
-                
-                # Llenar formulario
-                if not self.llenar_formulario_coordinacion(evento):
-                    print("❌ Error llenando formulario")
-                    continue
-                
-                # Guardar coordinación
-                if not self.guardar_coordinacion():
-                    print("❌ Error guardando coordinación")
-                    continue
-                
-                eventos_exitosos += 1
-                print(f"✅ Evento {index + 1} procesado exitosamente")
-                
-                # Esperar antes del siguiente evento
-                time.sleep(2)
-                
+                exito = self.procesar_evento(evento)
+                error = '' if exito else 'no se pudo completar el formulario'
             except Exception as e:
-                print(f"❌ Error procesando evento {index + 1}: {e}")
-                continue
+                print(f"❌ Error procesando evento {numero}: {e}")
+                exito, error = False, str(e)
+            
+            registro.registrar(index, evento, exito, error)
             
-            eventos_procesados += 1
+            if exito:
+                # Esperar antes del siguiente evento
+                time.sleep(2)
+        
+        return registro.exitosas > 0
+    
+    def procesar_todos_los_eventos(self):
+        """Procesar todos los eventos extraídos"""
+        print("🚀 Iniciando procesamiento de todos los eventos...")
+        
+        # 1. Extraer datos
+        df = self.extraer_datos_janos()
+        if df is None or len(df) == 0:
+            print("❌ No hay datos para procesar")
+            return False
+        
+        if self.solo_fallidos:
+            fallidas = filas_fallidas(self.ruta_resultados)
+            if fallidas is None:
+                print(f"⚠️ No hay resultados previos en {self.ruta_resultados}, se carga todo el CSV")
+            else:
+                df = df[df.index.isin(fallidas)]
+                print(f"🔁 Reintentando {len(df)} filas fallidas")
+                if df.empty:
+                    return True
+        
+        # El resultado de cada fila se escribe apenas se carga, en ambos modos
+        registro = RegistroResultados(self.ruta_resultados, len(df), continuar=self.solo_fallidos)
+        try:
+            # Con varios navegadores cada uno carga su porción de filas
+            if config.coordis_ui_workers > 1 and len(df) > 1:
+                exito = self.procesar_en_paralelo(df, registro)
+            else:
+                exito = self.procesar_en_secuencia(df, registro)
+        finally:
+            registro.cerrar()
         
         print(f"\n📊 RESUMEN FINAL:")
         print(f"   Total eventos: {len(df)}")
-        print(f"   Procesados: {eventos_procesados}")
-        print(f"   Exitosos: {eventos_exitosos}")
-        print(f"   Fallidos: {eventos_procesados - eventos_exitosos}")
+        print(f"   Procesados: {registro.procesadas}")
+        print(f"   Exitosos: {registro.exitosas}")
+        print(f"   Fallidos: {registro.fallidas}")
+        print(f"   Resultado por fila: {registro.ruta}")
         
-        return eventos_exitosos > 0
+        return exito
     
     def cerrar_driver(self):
         """Cerrar el driver"""
@@ -341,11 +389,12 @@ def main():
     print("🤖 RPA INTEGRACIÓN JANOS + COORDIS")
     print("=" * 50)
     
-    rpa = RPAIntegracionCoordis()
+    # --reintentar-fallidos: solo las filas que fallaron en la carga anterior
+    rpa = RPAIntegracionCoordis(solo_fallidos='--reintentar-fallidos' in sys.argv)
     
     try:
-        # Configurar driver
-        if not rpa.configurar_driver():
+        # Configurar driver (con varios navegadores cada uno abre el suyo)
+        if config.coordis_ui_workers == 1 and not rpa.configurar_driver():
             return False
         
         # Procesar todos los eventos
@@ -22,6 +22,61 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Módulos compartidos del sistema de producción
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from utils.config import config
+from rpa.formulario_coordis import llenar_formulario
+
+# Selectores SOLO para campos seguros (sin tiempo)
+SELECTORES_SEGUROS = {
+    'title': [
+        "input[name='title']",
+        "input[placeholder*='título']",
+        "input[placeholder*='Título']"
+    ],
+    'event_date': [
+        "input[name='event_date']",
+        "input[type='date']"
+    ],
+    'client_name': [
+        "input[name='client_name']",
+        "input[placeholder*='cliente']",
+        "input[placeholder*='Cliente']"
+    ],
+    'client_phone': [
+        "input[name='client_phone']",
+        "input[type='tel']",
+        "input[placeholder*='teléfono']"
+    ],
+    'codigo_evento': [
+        "input[name='codigo_evento']",
+        "input[placeholder*='código']",
+        "input[placeholder*='Código']"
+    ],
+    'pack': [
+        "input[name='pack']",
+        "input[placeholder*='pack']",
+        "input[placeholder*='Pack']"
+    ],
+    'salon': [
+        "input[name='salon']",
+        "input[placeholder*='salón']",
+        "input[placeholder*='Salón']"
+    ],
+    'honoree_name': [
+        "input[name='honoree_name']",
+        "input[placeholder*='agasajado']",
+        "input[placeholder*='Agasajado']"
+    ],
+    'total_invitados': [
+        "input[name='total_invitados']",
+        "input[type='number']",
+        "input[placeholder*='invitados']"
+    ]
+    # NO incluir selectores de tiempo
+}
+
 class RPAIntegracionSinTiempo:
     def __init__(self):
         self.driver = None
@@ -131,15 +186,26 @@ class RPAIntegracionSinTiempo:
                 # NO incluir campos de tiempo para evitar errores
             }
             
+            pendientes = {campo: valor for campo, valor in campos_seguros.items() if valor and valor != ''}
+            
+            # Todos los campos en una sola llamada; los que no quedaron se llenan uno por uno
+            if config.coordis_fill_strategy == 'script':
+                try:
+                    resultado = llenar_formulario(self.driver, SELECTORES_SEGUROS, pendientes)
+                    for campo in resultado['llenados']:
+                        print(f"  ✅ Campo '{campo}': {pendientes[campo]}")
+                    pendientes = {campo: pendientes[campo] for campo in resultado['pendientes']}
+                except Exception as e:
+                    print(f"  ⚠️ Error llenando por script, se llena campo por campo: {e}")
+            
             # Llenar solo campos seguros
-            for campo, valor in campos_seguros.items():
-                if valor and valor != '':
-                    try:
-                        self.llenar_campo_seguro(campo, valor)
-                        time.sleep(0.5)
-                    except Exception as e:
-                        print(f"  ⚠️ Error llenando campo '{campo}': {e}")
-                        continue
+            for campo, valor in pendientes.items():
+                try:
+                    self.llenar_campo_seguro(campo, valor)
+                    time.sleep(0.5)
+                except Exception as e:
+                    print(f"  ⚠️ Error llenando campo '{campo}': {e}")
+                    continue
             
             print("✅ Formulario llenado correctamente (sin campos de tiempo)")
             return True
@@ -151,57 +217,8 @@ class RPAIntegracionSinTiempo:
     def llenar_campo_seguro(self, campo, valor):
         """Llenar un campo específico del formulario (sin campos de tiempo)"""
         try:
-            # Selectores SOLO para campos seguros (sin tiempo)
-            selectors = {
-                'title': [
-                    "input[name='title']",
-                    "input[placeholder*='título']",
-                    "input[placeholder*='Título']"
-                ],
-                'event_date': [
-                    "input[name='event_date']",
-                    "input[type='date']"
-                ],
-                'client_name': [
-                    "input[name='client_name']",
-                    "input[placeholder*='cliente']",
-                    "input[placeholder*='Cliente']"
-                ],
-                'client_phone': [
-                    "input[name='client_phone']",
-                    "input[type='tel']",
-                    "input[placeholder*='teléfono']"
-                ],
-                'codigo_evento': [
-                    "input[name='codigo_evento']",
-                    "input[placeholder*='código']",
-                    "input[placeholder*='Código']"
-                ],
-                'pack': [
-                    "input[name='pack']",
-                    "input[placeholder*='pack']",
-                    "input[placeholder*='Pack']"
-                ],
-                'salon': [
-                    "input[name='salon']",
-                    "input[placeholder*='salón']",
-                    "input[placeholder*='Salón']"
-                ],
-                'honoree_name': [
-                    "input[name='honoree_name']",
-                    "input[placeholder*='agasajado']",
-                    "input[placeholder*='Agasajado']"
-                ],
-                'total_invitados': [
-                    "input[name='total_invitados']",
-                    "input[type='number']",
-                    "input[placeholder*='invitados']"
-                ]
-                # NO incluir selectores de tiempo
-            }
-            
-            if campo in selectors:
-                for selector in selectors[campo]:
+            if campo in SELECTORES_SEGUROS:
+                for selector in SELECTORES_SEGUROS[campo]:
                     try:
                         elemento = self.driver.find_element(By.CSS_SELECTOR, selector)
                         elemento.clear()
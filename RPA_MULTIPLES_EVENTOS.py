@@ -6,9 +6,9 @@ Script que procesa todas las fechas coral del calendario y extrae datos de todos
 """
 
 import time
-import re
 import pandas as pd
 import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -18,9 +18,43 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from dotenv import load_dotenv
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from rpa.esperas import MotorEsperas
+from rpa.snapshot_dom import snapshot_texto
+from rpa.campos_evento import extraer_campos
+from rpa.cache_urls import CacheUrlsEventos, pagina_evento_valida
+from rpa.control_concurrencia import LimiteTasa
+from rpa.pestanas import LectorPestanas
+from rpa.perfil_navegador import medir_navegacion, resumir_navegaciones
+from utils.config import config
+from utils.telefonos import extraer_celulares
+
 # Cargar variables de entorno
 load_dotenv()
 
+# XPath de los códigos de evento (5 dígitos) que aparecen al clickear una fecha
+XPATH_CODIGOS_5_DIGITOS = "//*[text() and string-length(normalize-space(text())) = 5 and translate(text(), '0123456789', '0000000000') = '00000']"
+
+# Códigos distintos (en orden de aparición) de los elementos que matchean el XPath, en una sola llamada
+SCRIPT_CODIGOS_DISTINTOS = """
+var nodos = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var codigos = [];
+for (var i = 0; i < nodos.snapshotLength; i++) {
+    var codigo = (nodos.snapshotItem(i).textContent || '').trim();
+    if (/^\\d{5}$/.test(codigo) && codigos.indexOf(codigo) === -1) codigos.push(codigo);
+}
+return codigos;
+"""
+
+# hrefs de los enlaces a ver_evento.php visibles en el documento
+SCRIPT_ENLACES_EVENTO = """
+var anclas = document.querySelectorAll("a[href*='ver_evento.php']");
+var hrefs = [];
+for (var i = 0; i < anclas.length; i++) hrefs.push(anclas[i].href);
+return hrefs;
+"""
+
 def get_driver():
     """Configurar y retornar el driver de Chrome"""
     options = webdriver.ChromeOptions()
@@ -144,70 +178,206 @@ def obtener_todas_fechas_coral(driver):
     
     return fechas_info
 
-def procesar_fecha_coral(driver, wait, fecha_info):
-    """Procesar una fecha coral específica"""
+def capturar_urls_fecha(driver, esperas, fecha_info, cache_urls=None, codigos_buscados=None):
+    """Clickear una fecha coral y obtener la URL de ver_evento.php de cada evento distinto (sin navegar)"""
     fecha_texto = fecha_info['fecha']
     print(f"\n=== PROCESANDO FECHA {fecha_texto} ===")
     
-    try:
-        # Hacer clic en la fecha
-        fecha_elemento = fecha_info['elemento']
-        fecha_elemento.click()
-        time.sleep(3)
-        print(f"✓ Clic en fecha {fecha_texto}")
-        
-        # Buscar códigos de 5 dígitos
-        codigos_5_digitos = driver.find_elements(By.XPATH, "//*[text() and string-length(normalize-space(text())) = 5 and translate(text(), '0123456789', '0000000000') = '00000']")
-        print(f"  Códigos de 5 dígitos encontrados: {len(codigos_5_digitos)}")
+    # Hacer clic en la fecha y esperar a que aparezcan los códigos
+    fecha_elemento = fecha_info['elemento']
+    fecha_elemento.click()
+    print(f"✓ Clic en fecha {fecha_texto}")
+    
+    esperas.hasta(
+        "codigos_fecha",
+        EC.presence_of_element_located((By.XPATH, XPATH_CODIGOS_5_DIGITOS)),
+        timeout=10,
+        obligatoria=False
+    )
+    
+    # Un mismo código aparece repetido: se toma el conjunto de códigos distintos
+    codigos = driver.execute_script(SCRIPT_CODIGOS_DISTINTOS, XPATH_CODIGOS_5_DIGITOS) or []
+    if codigos_buscados is not None:
+        # Recaptura: solo los códigos pedidos
+        codigos = [codigo for codigo in codigos if codigo in codigos_buscados]
+    print(f"  Códigos de evento distintos: {len(codigos)} {codigos}")
+    
+    if not codigos:
+        print(f"  ✗ No se encontraron códigos para fecha {fecha_texto}")
+        return []
+    
+    enlaces = []
+    vistos = set(driver.execute_script(SCRIPT_ENLACES_EVENTO) or [])
+    
+    for codigo_evento in codigos:
+        # URL conocida de una corrida anterior: no hace falta clickear el código
+        entrada_cache = cache_urls.obtener(codigo_evento) if cache_urls else None
         
-        if not codigos_5_digitos:
-            print(f"  ✗ No se encontraron códigos para fecha {fecha_texto}")
-            return None
+        if entrada_cache:
+            url_evento = entrada_cache['url']
+            print(f"  ✓ URL en caché de {codigo_evento}: {url_evento}")
+        else:
+            # Hacer clic en el código (cualquiera de los repetidos)
+            elementos = driver.find_elements(By.XPATH, f"//*[normalize-space(text())='{codigo_evento}']")
+            if not elementos:
+                print(f"  ✗ El código {codigo_evento} ya no está visible")
+                continue
+            elementos[0].click()
+            print(f"  ✓ Clic en código {codigo_evento}")
+            
+            # Capturar el enlace que apareció con este código
+            nuevos = esperas.hasta(
+                "enlace_evento",
+                lambda d: [href for href in (d.execute_script(SCRIPT_ENLACES_EVENTO) or []) if href not in vistos],
+                timeout=10,
+                obligatoria=False
+            )
+            if not nuevos:
+                print(f"  ✗ No se encontraron enlaces para código {codigo_evento}")
+                continue
+            
+            url_evento = nuevos[0]
+            vistos.add(url_evento)
+            print(f"  ✓ URL capturada: {url_evento}")
         
-        # Obtener el primer código único (todos los demás son repetidos)
-        codigo_evento = codigos_5_digitos[0].text.strip()
-        print(f"  ✓ Código de evento: {codigo_evento}")
+        enlaces.append({
+            'url': url_evento,
+            'codigo': codigo_evento,
+            'fecha': fecha_texto,
+            'desde_cache': bool(entrada_cache)
+        })
+    
+    return enlaces
+
+def visitar_enlaces(driver, esperas, enlaces, fecha_texto, eventos, cache_urls=None, navegaciones=None):
+    """Navegar a cada URL de la fecha, extraer sus datos en `eventos` y volver al calendario.
+    Las métricas de carga de cada página se agregan a `navegaciones`.
+    Devuelve los códigos cuya URL en caché ya no lleva al evento"""
+    vencidos = []
+    navegadas = 0
+    
+    try:
+        for enlace in enlaces:
+            codigo_evento = enlace['codigo']
+            
+            # Navegar al evento individual
+            driver.get(enlace['url'])
+            navegadas += 1
+            esperas.documento_listo("pagina_evento")
+            metricas = medir_navegacion(driver, "evento", detalle=False)
+            if metricas and navegaciones is not None:
+                navegaciones.append(metricas)
+            
+            if enlace['desde_cache'] and not pagina_evento_valida(driver, codigo_evento):
+                # La URL guardada ya no lleva al evento: se descarta y se recaptura desde el calendario
+                print(f"  ✗ URL en caché vencida para el evento {codigo_evento}")
+                cache_urls.invalidar(codigo_evento)
+                vencidos.append(codigo_evento)
+                continue
+            
+            if "ver_evento.php" not in driver.current_url:
+                print(f"  ✗ No se pudo acceder al evento {codigo_evento}")
+                continue
+            
+            if cache_urls and not enlace['desde_cache']:
+                cache_urls.registrar(codigo_evento, enlace['url'], fecha_texto)
+            
+            print(f"  ✓ Acceso exitoso al evento {codigo_evento}")
+            
+            # Extraer datos del evento
+            eventos.append(extraer_datos_evento(driver, fecha_texto, codigo_evento))
+    
+    finally:
+        if navegadas:
+            # Volver al calendario (una entrada del historial por evento visitado)
+            driver.execute_script("window.history.go(arguments[0]);", -navegadas)
+            esperas.documento_listo("volver_calendario")
+            
+            # Volver al frame principal
+            esperas.main_frame()
+    
+    return vencidos
+
+def procesar_fecha_coral(driver, esperas, fecha_info, cache_urls=None, navegaciones=None):
+    """Procesar todos los eventos de una fecha coral"""
+    fecha_texto = fecha_info['fecha']
+    eventos = []
+    
+    try:
+        enlaces = capturar_urls_fecha(driver, esperas, fecha_info, cache_urls)
+        vencidos = visitar_enlaces(driver, esperas, enlaces, fecha_texto, eventos, cache_urls, navegaciones)
         
-        # Hacer clic en el primer código (cualquiera de los repetidos)
-        codigos_5_digitos[0].click()
-        time.sleep(5)
-        print(f"  ✓ Clic en código {codigo_evento}")
+        if vencidos:
+            # Mismo recorrido que sin caché: clic en la fecha y en cada código, y se guarda la URL nueva
+            print(f"  ↻ Recapturando desde el calendario {len(vencidos)} URL(s) vencida(s)")
+            enlaces = capturar_urls_fecha(driver, esperas, fecha_info, cache_urls, codigos_buscados=vencidos)
+            visitar_enlaces(driver, esperas, enlaces, fecha_texto, eventos, cache_urls, navegaciones)
         
-        # Capturar URL del evento
-        enlaces_evento = driver.find_elements(By.XPATH, "//a[contains(@href, 'ver_evento.php')]")
-        if not enlaces_evento:
-            print(f"  ✗ No se encontraron enlaces para código {codigo_evento}")
+    except Exception as e:
+        print(f"  ✗ Error procesando fecha {fecha_texto}: {str(e)}")
+    
+    return eventos
+
+def procesar_fechas_en_pestanas(driver, esperas, fechas_info, cache_urls, limite_tasa, navegaciones):
+    """Recolectar las URLs de todas las fechas y leer los eventos en pestañas del mismo navegador"""
+    print(f"\n=== PASO 5: RECOLECTANDO URLS DE {len(fechas_info)} FECHAS CORAL ===")
+    
+    # El calendario no se abandona: se clickea cada fecha solo para tomar sus URLs
+    enlaces = []
+    fecha_de_codigo = {}
+    for i, fecha_info in enumerate(fechas_info):
+        limite_tasa.tomar()
+        try:
+            capturados = capturar_urls_fecha(driver, esperas, fecha_info, cache_urls)
+        except Exception as e:
+            print(f"  ✗ Error procesando fecha {fecha_info['fecha']}: {str(e)}")
+            continue
+        enlaces.extend(capturados)
+        for enlace in capturados:
+            fecha_de_codigo[enlace['codigo']] = i
+    
+    vencidos = []
+    
+    def leer_evento(driver, enlace):
+        if enlace['desde_cache'] and not pagina_evento_valida(driver, enlace['codigo']):
+            print(f"  ✗ URL en caché vencida para el evento {enlace['codigo']}")
+            cache_urls.invalidar(enlace['codigo'])
+            vencidos.append(enlace['codigo'])
             return None
-        
-        url_evento = enlaces_evento[0].get_attribute('href')
-        print(f"  ✓ URL capturada: {url_evento}")
-        
-        # Navegar al evento individual
-        driver.get(url_evento)
-        time.sleep(8)
-        
         if "ver_evento.php" not in driver.current_url:
-            print(f"  ✗ No se pudo acceder al evento {codigo_evento}")
+            print(f"  ✗ No se pudo acceder al evento {enlace['codigo']}")
             return None
+        if not enlace['desde_cache']:
+            cache_urls.registrar(enlace['codigo'], enlace['url'], enlace['fecha'])
+        return extraer_datos_evento(driver, enlace['fecha'], enlace['codigo'])
+    
+    print(f"\n=== PASO 6: LEYENDO {len(enlaces)} EVENTOS EN {config.tab_pool_size} PESTAÑAS ===")
+    lector = LectorPestanas(driver, esperas=esperas)
+    resultados = lector.leer(enlaces, leer_evento)
+    esperas.main_frame()
+    
+    if vencidos:
+        # URLs en caché vencidas: se vuelven a clickear sus fechas y códigos en esta misma corrida
+        print(f"\n=== RECAPTURANDO {len(vencidos)} URL(S) VENCIDA(S) DESDE EL CALENDARIO ===")
+        por_fecha = {}
+        for codigo in vencidos:
+            por_fecha.setdefault(fecha_de_codigo[codigo], []).append(codigo)
         
-        print(f"  ✓ Acceso exitoso al evento {codigo_evento}")
-        
-        # Extraer datos del evento
-        datos_evento = extraer_datos_evento(driver, fecha_texto, codigo_evento)
-        
-        # Volver al calendario para procesar la siguiente fecha
-        driver.back()
-        time.sleep(3)
-        
-        # Volver al frame principal
-        driver.switch_to.frame(driver.find_element(By.ID, "mainFrame"))
-        time.sleep(2)
+        recapturados = []
+        for i, codigos in sorted(por_fecha.items()):
+            limite_tasa.tomar()
+            try:
+                recapturados.extend(capturar_urls_fecha(driver, esperas, fechas_info[i], cache_urls, codigos_buscados=codigos))
+            except Exception as e:
+                print(f"  ✗ Error procesando fecha {fechas_info[i]['fecha']}: {str(e)}")
         
-        return datos_evento
-        
-    except Exception as e:
-        print(f"  ✗ Error procesando fecha {fecha_texto}: {str(e)}")
-        return None
+        resultados.extend(lector.leer(recapturados, leer_evento))
+        esperas.main_frame()
+    
+    resumen = lector.resumen()
+    print(f"✓ Pestañas leídas: {resumen['leidas']} (fallidas: {resumen['fallidas']}) en {resumen['duracion']}s")
+    navegaciones.extend(lector.navegaciones)
+    return [datos for datos in resultados if datos]
 
 def extraer_datos_evento(driver, fecha_texto, codigo_evento):
     """Extraer datos de un evento específico"""
@@ -228,83 +398,20 @@ def extraer_datos_evento(driver, fecha_texto, codigo_evento):
         'tipo_pack': None,
     }
     
-    # Obtener todos los elementos de texto de la página
-    todos_elementos = driver.find_elements(By.XPATH, "//*[text()]")
-    elementos_relevantes = []
-    
-    for elem in todos_elementos:
-        if elem.is_displayed() and elem.text.strip():
-            texto = elem.text.strip()
-            if len(texto) > 0 and len(texto) < 500:
-                elementos_relevantes.append({
-                    'tag': elem.tag_name,
-                    'texto': texto,
-                    'elemento': elem
-                })
-    
-    # 1. HOMENAJEADA/O
-    for i, elem in enumerate(elementos_relevantes):
-        if "Homenajeada/o/os:" in elem['texto']:
-            if i + 1 < len(elementos_relevantes):
-                siguiente_elem = elementos_relevantes[i + 1]
-                if siguiente_elem['texto'] and siguiente_elem['tag'] == 'td':
-                    datos_evento['homenajeada'] = siguiente_elem['texto']
-                    break
-    
-    # 2. TIPO DE EVENTO
-    for i, elem in enumerate(elementos_relevantes):
-        if "Tipo de Evento" in elem['texto']:
-            if i + 1 < len(elementos_relevantes):
-                siguiente_elem = elementos_relevantes[i + 1]
-                if siguiente_elem['texto'] and siguiente_elem['tag'] == 'td':
-                    datos_evento['tipo_evento'] = siguiente_elem['texto']
-                    break
-    
-    # 3. FECHA DEL EVENTO
-    for i, elem in enumerate(elementos_relevantes):
-        if "Fecha del Evento" in elem['texto']:
-            if i + 1 < len(elementos_relevantes):
-                siguiente_elem = elementos_relevantes[i + 1]
-                if siguiente_elem['texto'] and siguiente_elem['tag'] == 'td':
-                    datos_evento['fecha_evento'] = siguiente_elem['texto']
-                    break
-    
-    # 4. SALÓN
-    for i, elem in enumerate(elementos_relevantes):
-        if "Salon" in elem['texto'] and elem['tag'] == 'td':
-            if i + 1 < len(elementos_relevantes):
-                siguiente_elem = elementos_relevantes[i + 1]
-                if siguiente_elem['texto'] and siguiente_elem['tag'] == 'td':
-                    datos_evento['salon'] = siguiente_elem['texto']
-                    break
-    
-    # 5. CLIENTE
-    for i, elem in enumerate(elementos_relevantes):
-        if "Cliente" in elem['texto'] and elem['tag'] == 'td':
-            if i + 1 < len(elementos_relevantes):
-                siguiente_elem = elementos_relevantes[i + 1]
-                if siguiente_elem['texto'] and siguiente_elem['tag'] == 'td':
-                    datos_evento['cliente'] = siguiente_elem['texto']
-                    break
-    
-    # 6. CELULAR Y CELULAR 2
-    page_html = driver.page_source
-    patrones_busqueda = [
-        r'5411\d{8}',
-        r'54\s*11\s*\d{8}',
-        r'\+54\s*11\s*\d{8}',
-        r'011\s*\d{8}',
-        r'11\s*\d{8}',
-        r'\d{10,11}'
-    ]
-    
-    numeros_encontrados = []
-    for patron in patrones_busqueda:
-        matches = re.findall(patron, page_html)
-        for match in matches:
-            numero_limpio = re.sub(r'[^\d+]', '', match)
-            if len(numero_limpio) >= 10 and numero_limpio not in numeros_encontrados:
-                numeros_encontrados.append(numero_limpio)
+    # Snapshot de todos los textos visibles en una sola llamada al navegador
+    elementos_relevantes = snapshot_texto(driver)
+    
+    # Campos del esquema (homenajeada, tipo, fecha, salón, cliente, pack) en una sola pasada
+    valores, faltantes = extraer_campos(
+        elementos_relevantes,
+        campos=['homenajeada', 'tipo_evento', 'fecha_evento', 'salon', 'cliente', 'tipo_pack']
+    )
+    datos_evento.update(valores)
+    if faltantes:
+        print(f"    ⚠ Campos no encontrados: {', '.join(faltantes)}")
+    
+    # CELULAR Y CELULAR 2 (solo cerca de los rótulos "Celular")
+    numeros_encontrados = extraer_celulares(driver.page_source)
     
     if len(numeros_encontrados) >= 1:
         datos_evento['celular'] = numeros_encontrados[0]
@@ -313,15 +420,6 @@ def extraer_datos_evento(driver, fecha_texto, codigo_evento):
     elif len(numeros_encontrados) == 1:
         datos_evento['celular_2'] = numeros_encontrados[0]
     
-    # 7. TIPO DE PACK
-    for i, elem in enumerate(elementos_relevantes):
-        if "Pack 1" in elem['texto'] and elem['tag'] == 'td':
-            datos_evento['tipo_pack'] = elem['texto']
-            break
-        elif "Pack 2" in elem['texto'] and elem['tag'] == 'td':
-            datos_evento['tipo_pack'] = elem['texto']
-            break
-    
     # Mostrar datos extraídos
     print(f"    ✓ Homenajeada/o: {datos_evento['homenajeada']}")
     print(f"    ✓ Tipo evento: {datos_evento['tipo_evento']}")
@@ -340,12 +438,17 @@ def main():
     print("Objetivo: Procesar todas las fechas coral y extraer datos de todos los eventos")
     
     driver = None
+    cache_urls = None
     todos_eventos = []
+    navegaciones = []
     
     try:
         # Configurar driver
         driver = get_driver()
         wait = WebDriverWait(driver, 20)
+        esperas = MotorEsperas(driver, timeout=20)
+        cache_urls = CacheUrlsEventos()
+        limite_tasa = LimiteTasa()
         
         # PASO 1: LOGIN
         login(driver, wait)
@@ -364,27 +467,33 @@ def main():
             return None
         
         # PASO 5: PROCESAR CADA FECHA CORAL
-        print(f"\n=== PASO 5: PROCESANDO {len(fechas_info)} FECHAS CORAL ===")
-        
-        for i, fecha_info in enumerate(fechas_info):
-            print(f"\n--- PROCESANDO FECHA {i+1}/{len(fechas_info)} ---")
-            
-            datos_evento = procesar_fecha_coral(driver, wait, fecha_info)
-            
-            if datos_evento:
-                todos_eventos.append(datos_evento)
-                print(f"✓ Evento procesado exitosamente")
-            else:
-                print(f"✗ Error procesando evento")
+        if config.tab_batch_enabled:
+            # Modo por pestañas: URLs de todo el calendario y lectura con cargas solapadas
+            todos_eventos = procesar_fechas_en_pestanas(driver, esperas, fechas_info, cache_urls, limite_tasa, navegaciones)
+        else:
+            print(f"\n=== PASO 5: PROCESANDO {len(fechas_info)} FECHAS CORAL ===")
             
-            # Pausa entre eventos para evitar sobrecarga
-            time.sleep(2)
+            for i, fecha_info in enumerate(fechas_info):
+                print(f"\n--- PROCESANDO FECHA {i+1}/{len(fechas_info)} ---")
+                
+                # Límite de pedidos a Janos para evitar sobrecarga
+                limite_tasa.tomar()
+                
+                eventos_fecha = procesar_fecha_coral(driver, esperas, fecha_info, cache_urls, navegaciones)
+                
+                if eventos_fecha:
+                    todos_eventos.extend(eventos_fecha)
+                    print(f"✓ {len(eventos_fecha)} evento(s) procesado(s) exitosamente")
+                else:
+                    print(f"✗ Error procesando eventos de la fecha")
+        
+        print(f"\nURLs de eventos desde caché: {cache_urls.aciertos} (invalidadas: {cache_urls.invalidadas})")
         
         # Mostrar resumen final
         print(f"\n=== RESUMEN FINAL ===")
         print(f"Total de fechas coral encontradas: {len(fechas_info)}")
         print(f"Total de eventos procesados exitosamente: {len(todos_eventos)}")
-        print(f"Eventos con errores: {len(fechas_info) - len(todos_eventos)}")
+        print(f"Promedio de eventos por fecha: {len(todos_eventos) / len(fechas_info):.2f}")
         
         if todos_eventos:
             # Crear DataFrame con todos los eventos
@@ -402,6 +511,16 @@ def main():
             print(f"Fechas diferentes: {len(set([e['fecha'] for e in todos_eventos]))}")
             print(f"Códigos únicos: {len(set([e['codigo_evento'] for e in todos_eventos]))}")
             
+            print(f"\n=== TIEMPOS DE ESPERA ===")
+            for nombre, metricas in esperas.resumen().items():
+                print(f"  {nombre}: {metricas['cantidad']} esperas, promedio {metricas['promedio']}s, máximo {metricas['maximo']}s")
+            
+            medidas = resumir_navegaciones(navegaciones)
+            print(f"Páginas de eventos medidas: {medidas['cantidad']}, promedio {medidas['promedio_ms']} ms, {medidas['bytes'] / 1024:.1f} KB en total")
+            
+            tasa = limite_tasa.resumen()
+            print(f"Límite de tasa: {tasa['tasa_por_segundo']}/s, {tasa['espera_total']}s esperados por el límite")
+            
             return todos_eventos
         else:
             print("✗ No se procesaron eventos exitosamente")
@@ -412,6 +531,10 @@ def main():
         return None
     
     finally:
+        # Las URLs capturadas antes de un error también se conservan
+        if cache_urls:
+            cache_urls.guardar()
+        
         if driver:
             print("\nManteniendo navegador abierto para verificación manual...")
             time.sleep(300)  # Mantener abierto por 5 minutos
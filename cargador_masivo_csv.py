@@ -10,7 +10,10 @@ desde archivo CSV al software COORDIS.
 Características:
 - Lee CSV con datos de eventos
 - Valida datos antes de procesar
-- Carga masivamente en COORDIS
+- Carga masivamente en COORDIS por el API (/api/coordinations/bulk)
+  o, como respaldo, por el formulario web (con varios navegadores en paralelo)
+- Registra el resultado de cada fila para reintentar solo las fallidas
+- Omite las filas que COORDIS ya tiene sin cambios
 - Reporta resultados detallados
 - Manejo robusto de errores
 
@@ -19,9 +22,15 @@ Fecha: 05/10/2025
 """
 
 import pandas as pd
+import requests
 import time
 import os
+import sys
+import csv
+import functools
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -30,29 +39,218 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from utils.config import config
+from rpa.pool_navegadores import PoolNavegadores
+from rpa.formulario_coordis import llenar_formulario
+from sync.indice_coordinaciones import IndiceCoordinaciones
+
+_lock_chromedriver = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _instalar_chromedriver():
+    """Ubica (o descarga) chromedriver"""
+    return ChromeDriverManager().install()
+
+def ruta_chromedriver():
+    """Ubica (o descarga) chromedriver una sola vez por proceso; los navegadores
+    que arrancan a la vez esperan a la misma descarga"""
+    with _lock_chromedriver:
+        return _instalar_chromedriver()
+
+def crear_driver_coordis(id_navegador=None):
+    """Crear un driver de Chrome para cargar coordinaciones"""
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    
+    service = Service(ruta_chromedriver())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+def crear_pool_coordis(tamano=None):
+    """Pool de navegadores calientes para procesos de larga vida (API de control)"""
+    return PoolNavegadores(fabrica=crear_driver_coordis, nombre="coordis", tamano=tamano)
+
+# Selectores de los campos del formulario "Nueva Coordinación"
+SELECTORES_FORMULARIO = {
+    'title': ["input[placeholder='Título de la coordinación']"],
+    'event_date': ["input[type='date']"],
+    'client_name': ["input[placeholder='Nombre completo del cliente']"],
+    'celular': ["input[placeholder='541157526518']"],
+    'celular_2': ["input[placeholder='1157526518']"]
+}
+
+COLUMNAS_RESULTADO = ['fila', 'codigo_evento', 'estado', 'error', 'worker', 'timestamp']
+
+class RegistroResultados:
+    """Resultado de cada fila del CSV, escrito apenas se carga"""
+    
+    def __init__(self, ruta, total, continuar=False):
+        """
+        Abre el archivo de resultados
+        
+        Args:
+            ruta: CSV de resultados
+            total: Filas a cargar en esta corrida (para el progreso)
+            continuar: Agregar al archivo existente (reintento de fallidas)
+        """
+        self.ruta = ruta
+        self.total = total
+        self.procesadas = 0
+        self.exitosas = 0
+        self.fallidas = 0
+        self.errores = []
+        self._lock = threading.Lock()
+        
+        nuevo = not (continuar and os.path.exists(ruta))
+        self._archivo = open(ruta, 'w' if nuevo else 'a', newline='', encoding='utf-8')
+        self._escritor = csv.writer(self._archivo)
+        if nuevo:
+            self._escritor.writerow(COLUMNAS_RESULTADO)
+            self._archivo.flush()
+    
+    def registrar(self, fila, evento, exito, error='', worker=None, mostrar=True):
+        """Escribe el resultado de una fila y muestra el progreso agregado"""
+        codigo = evento.get('codigo_evento') or 'N/A'
+        with self._lock:
+            self._escritor.writerow([
+                fila, codigo, 'ok' if exito else 'error', error,
+                '' if worker is None else worker, datetime.now().isoformat()
+            ])
+            self._archivo.flush()
+            
+            self.procesadas += 1
+            if exito:
+                self.exitosas += 1
+            else:
+                self.fallidas += 1
+                self.errores.append({'evento': codigo, 'error': error})
+            
+            if not mostrar:
+                return
+            origen = f" (navegador #{worker})" if worker is not None else ""
+            estado = "✅" if exito else f"❌ {error}"
+            print(f"📈 [{self.procesadas}/{self.total}] Fila {fila} - {codigo}{origen}: {estado}")
+    
+    def cerrar(self):
+        """Cierra el archivo de resultados"""
+        with self._lock:
+            if not self._archivo.closed:
+                self._archivo.close()
+
+def filas_fallidas(ruta):
+    """
+    Filas cuyo último resultado registrado no fue exitoso
+    
+    Returns:
+        Conjunto de números de fila o None si no hay resultados previos
+    """
+    if not os.path.exists(ruta):
+        return None
+    
+    ultimo = {}
+    with open(ruta, newline='', encoding='utf-8') as f:
+        for registro in csv.DictReader(f):
+            ultimo[int(registro['fila'])] = registro['estado']
+    return {fila for fila, estado in ultimo.items() if estado != 'ok'}
+
+def cargar_formularios_en_paralelo(df, fabrica, workers, registro):
+    """
+    Reparte las filas del CSV entre varios navegadores que completan el
+    formulario de COORDIS a la vez, cada uno con su propia porción
+    
+    Args:
+        df: Filas a cargar (el índice es el número de fila del CSV)
+        fabrica: Crea un cargador con configurar_driver(), navegar_a_coordis(),
+                 procesar_evento(evento) y cerrar_driver()
+        workers: Cantidad de navegadores
+        registro: RegistroResultados donde se escribe cada fila
+    
+    Returns:
+        Resumen por navegador: {worker, filas, exitosas, fallidas, exito}
+    """
+    total_workers = max(1, min(workers, len(df)))
+    porciones = [df.iloc[i::total_workers] for i in range(total_workers)]
+    print(f"👥 Cargando {len(df)} eventos con {total_workers} navegadores en paralelo")
+    
+    def ejecutar(worker_id):
+        porcion = porciones[worker_id]
+        resumen = {'worker': worker_id, 'filas': len(porcion), 'exitosas': 0, 'fallidas': 0, 'exito': False}
+        cargador = fabrica()
+        
+        try:
+            if not (cargador.configurar_driver() and cargador.navegar_a_coordis()):
+                for fila, evento in porcion.iterrows():
+                    registro.registrar(fila, evento, False, 'navegador no disponible', worker_id)
+                resumen['fallidas'] = len(porcion)
+                return resumen
+            
+            for fila, evento in porcion.iterrows():
+                try:
+                    exito = cargador.procesar_evento(evento)
+                    error = '' if exito else 'no se pudo completar el formulario'
+                except Exception as e:
+                    exito, error = False, str(e)
+                
+                registro.registrar(fila, evento, exito, error, worker_id)
+                resumen['exitosas' if exito else 'fallidas'] += 1
+            
+            resumen['exito'] = True
+            return resumen
+        
+        except Exception as e:
+            print(f"❌ Error en navegador #{worker_id}: {e}")
+            return resumen
+        
+        finally:
+            cargador.cerrar_driver()
+    
+    with ThreadPoolExecutor(max_workers=total_workers) as executor:
+        return list(executor.map(ejecutar, range(total_workers)))
+
 class CargadorMasivoCSV:
-    def __init__(self, csv_file="todos_los_eventos_extraidos.csv"):
+    def __init__(self, csv_file="todos_los_eventos_extraidos.csv", pool=None, modo=None,
+                 workers=None, solo_fallidos=False):
         self.csv_file = csv_file
         self.driver = None
         self.wait = None
+        self.pool = pool
+        self.navegador = None
+        # 'api': carga por lotes; 'ui': formulario web de COORDIS
+        self.modo = modo or config.coordis_load_mode
         self.eventos_procesados = 0
         self.eventos_exitosos = 0
         self.eventos_fallidos = 0
+        self.eventos_creados = 0
+        self.eventos_actualizados = 0
+        self.eventos_sin_cambios = 0
+        self.eventos_formulario = 0
+        self.eventos_omitidos = 0
         self.errores_detallados = []
+        # Navegadores del formulario y resultado por fila (para reintentar las fallidas)
+        self.workers = workers or config.coordis_ui_workers
+        self.solo_fallidos = solo_fallidos
+        self.ruta_resultados = f"{os.path.splitext(csv_file)[0]}_resultados_carga.csv"
+        self.resumen_workers = []
         
     def configurar_driver(self):
-        """Configurar el driver de Chrome"""
-        print("🔧 Configurando driver de Chrome...")
+        """Configurar el driver de Chrome (o tomar uno caliente del pool)"""
+        if self.pool is not None:
+            self.navegador = self.pool.tomar(timeout=60)
+            if self.navegador:
+                self.driver = self.navegador.driver
+                self.wait = WebDriverWait(self.driver, 20)
+                print(f"♻️ Usando navegador #{self.navegador.id} del pool")
+                return True
+            print("⚠️ Pool sin navegadores libres, se abre uno nuevo")
         
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
+        print("🔧 Configurando driver de Chrome...")
         
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver = crear_driver_coordis()
             self.wait = WebDriverWait(self.driver, 20)
             print("✅ Driver configurado correctamente")
             return True
@@ -69,8 +267,8 @@ class CargadorMasivoCSV:
                 print(f"❌ Archivo CSV no encontrado: {self.csv_file}")
                 return None
             
-            # Cargar CSV
-            df = pd.read_csv(self.csv_file)
+            # Cargar CSV (como texto: los celulares no deben leerse como números)
+            df = pd.read_csv(self.csv_file, dtype=str, keep_default_na=False)
             print(f"✅ CSV cargado: {len(df)} eventos encontrados")
             
             # Validar columnas requeridas
@@ -149,17 +347,8 @@ class CargadorMasivoCSV:
     def llenar_campo(self, campo, valor):
         """Llenar un campo del formulario"""
         try:
-            # Selectores optimizados
-            selectors = {
-                'title': ["input[placeholder='Título de la coordinación']"],
-                'event_date': ["input[type='date']"],
-                'client_name': ["input[placeholder='Nombre completo del cliente']"],
-                'celular': ["input[placeholder='541157526518']"],
-                'celular_2': ["input[placeholder='1157526518']"]
-            }
-            
-            if campo in selectors:
-                for selector in selectors[campo]:
+            if campo in SELECTORES_FORMULARIO:
+                for selector in SELECTORES_FORMULARIO[campo]:
                     try:
                         elemento = self.driver.find_element(By.CSS_SELECTOR, selector)
                         elemento.clear()
@@ -188,18 +377,31 @@ class CargadorMasivoCSV:
                 'celular_2': evento.get('celular_2', '')
             }
             
-            # Llenar campos esenciales
+            pendientes = {}
             for campo, valor in campos_esenciales.items():
                 if valor and valor != '':
-                    try:
-                        self.llenar_campo(campo, valor)
-                        time.sleep(0.5)
-                    except Exception as e:
-                        print(f"  ⚠️ Error llenando campo '{campo}': {e}")
-                        continue
+                    pendientes[campo] = valor
                 else:
                     print(f"  ⏭️ Saltando campo '{campo}' (sin valor válido)")
             
+            # Todos los campos en una sola llamada; los que no quedaron se llenan uno por uno
+            if pendientes and config.coordis_fill_strategy == 'script':
+                try:
+                    resultado = llenar_formulario(self.driver, SELECTORES_FORMULARIO, pendientes)
+                    print(f"  ⚡ {len(resultado['llenados'])} campos llenados por script ({resultado['duracion'] * 1000:.0f} ms)")
+                    pendientes = {campo: pendientes[campo] for campo in resultado['pendientes']}
+                except Exception as e:
+                    print(f"  ⚠️ Error llenando por script, se llena campo por campo: {e}")
+            
+            # Llenar campos esenciales
+            for campo, valor in pendientes.items():
+                try:
+                    self.llenar_campo(campo, valor)
+                    time.sleep(0.5)
+                except Exception as e:
+                    print(f"  ⚠️ Error llenando campo '{campo}': {e}")
+                    continue
+            
             return True
             
         except Exception as e:
@@ -213,7 +415,7 @@ class CargadorMasivoCSV:
                 return ''
             
             # Convertir a datetime y formatear como YYYY-MM-DD
-            fecha = pd.to_datetime(fecha_str)
+            fecha = pd.to_datetime(fecha_str, dayfirst=True)
             return fecha.strftime('%Y-%m-%d')
         except:
             return ''
@@ -267,13 +469,110 @@ class CargadorMasivoCSV:
             
         except Exception as e:
             print(f"❌ Error procesando evento: {e}")
-            self.eventos_fallidos += 1
             self.errores_detallados.append({
                 'evento': evento.get('codigo_evento', 'N/A'),
                 'error': str(e)
             })
             return False
     
+    def evento_a_coordinacion(self, evento):
+        """Mapear una fila del CSV al esquema de coordinación del API"""
+        return {
+            'title': f"{evento.get('tipo_evento', '')} de {evento.get('homenajeada', '')}",
+            'client_name': evento.get('cliente', ''),
+            'celular': evento.get('celular', ''),
+            'celular_2': evento.get('celular_2', ''),
+            'event_date': self.formatear_fecha(evento.get('fecha_evento', '')),
+            'honoree_name': evento.get('homenajeada', ''),
+            'codigo_evento': evento.get('codigo_evento', ''),
+            'pack': evento.get('tipo_pack', ''),
+            'salon': evento.get('salon', ''),
+            'event_type': evento.get('tipo_evento', '')
+        }
+    
+    def omitir_sin_cambios(self, df):
+        """Descartar, antes de cualquier carga, las filas que el API ya tiene sin cambios"""
+        indice = IndiceCoordinaciones.desde_api()
+        if indice is None:
+            print("⚠️ No se pudieron leer las coordinaciones existentes, se cargan todas las filas")
+            return df
+        
+        pendientes = [not indice.sin_cambios(self.evento_a_coordinacion(evento)) for _, evento in df.iterrows()]
+        self.eventos_omitidos += indice.omitidas
+        print(f"⏭️ {indice.omitidas} filas sin cambios omitidas, {len(df) - indice.omitidas} por cargar")
+        return df[pendientes]
+    
+    def errores_por_fila(self, lote, detalles):
+        """Número de fila -> error de las coordinaciones del lote que el API no aceptó"""
+        filas = list(lote.index)
+        errores = {}
+        for detalle in detalles:
+            indice = detalle.get('indice')
+            if isinstance(indice, int) and 0 <= indice < len(filas):
+                errores[filas[indice]] = detalle.get('error', '')
+        return errores
+    
+    def cargar_por_api(self, df, registro):
+        """
+        Cargar el CSV con POST /api/coordinations/bulk en lotes
+        
+        El resultado de cada fila se escribe en el registro (las de lotes
+        rechazados como error), para que --reintentar-fallidos las encuentre.
+        Devuelve las filas de los lotes que el API no aceptó (error de red o
+        de servidor), para cargarlas por el formulario si está habilitado
+        """
+        url = f"{config.api_coordis}/api/coordinations/bulk"
+        tamano = config.bulk_chunk_size
+        pendientes = []
+        
+        print(f"\n📤 Cargando {len(df)} eventos por API en lotes de {tamano}...")
+        print("=" * 50)
+        
+        with requests.Session() as session:
+            for inicio in range(0, len(df), tamano):
+                lote = df.iloc[inicio:inicio + tamano]
+                coordinaciones = [self.evento_a_coordinacion(evento) for _, evento in lote.iterrows()]
+                numero = inicio // tamano + 1
+                
+                try:
+                    response = session.post(url, json={'coordinations': coordinaciones}, timeout=config.browser_timeout)
+                    response.raise_for_status()
+                    resultado = response.json()
+                    if not resultado.get('success'):
+                        raise ValueError(resultado.get('message', 'respuesta sin éxito'))
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    print(f"❌ Lote {numero} rechazado: {e}")
+                    for fila, evento in lote.iterrows():
+                        registro.registrar(fila, evento, False, f"lote rechazado por el API: {e}", mostrar=False)
+                    pendientes.append(lote)
+                    continue
+                
+                resultados = resultado.get('resultados', {})
+                self.eventos_procesados += len(lote)
+                self.eventos_creados += resultados.get('creadas', 0)
+                self.eventos_actualizados += resultados.get('actualizadas', 0)
+                self.eventos_sin_cambios += resultados.get('sin_cambios', 0)
+                self.eventos_fallidos += resultados.get('errores', 0)
+                for detalle in resultados.get('detalles', []):
+                    self.errores_detallados.append({
+                        'evento': detalle.get('codigo') or 'N/A',
+                        'error': detalle.get('error', '')
+                    })
+                
+                errores = self.errores_por_fila(lote, resultados.get('detalles', []))
+                for fila, evento in lote.iterrows():
+                    registro.registrar(fila, evento, fila not in errores, errores.get(fila, ''), mostrar=fila in errores)
+                
+                print(
+                    f"✅ Lote {numero}: {resultados.get('creadas', 0)} creadas, "
+                    f"{resultados.get('actualizadas', 0)} actualizadas, "
+                    f"{resultados.get('sin_cambios', 0)} sin cambios, "
+                    f"{resultados.get('errores', 0)} errores"
+                )
+        
+        self.eventos_exitosos += self.eventos_creados + self.eventos_actualizados + self.eventos_sin_cambios
+        return pendientes
+    
     def procesar_csv_masivamente(self):
         """Procesar todo el CSV masivamente"""
         print("🚀 Iniciando carga masiva desde CSV...")
@@ -283,6 +582,83 @@ class CargadorMasivoCSV:
         if df is None:
             return False
         
+        if self.solo_fallidos:
+            fallidas = filas_fallidas(self.ruta_resultados)
+            if fallidas is None:
+                print(f"⚠️ No hay resultados previos en {self.ruta_resultados}, se carga todo el CSV")
+            else:
+                df = df[df.index.isin(fallidas)]
+                print(f"🔁 Reintentando {len(df)} filas fallidas")
+                if df.empty:
+                    return True
+        
+        if config.coordis_skip_unchanged:
+            df = self.omitir_sin_cambios(df)
+            if df.empty:
+                print("✅ Todas las filas ya están en COORDIS sin cambios")
+                return True
+        
+        if self.modo != 'api':
+            return self.cargar_por_formulario(df)
+        
+        registro = RegistroResultados(self.ruta_resultados, len(df), continuar=self.solo_fallidos)
+        try:
+            pendientes = self.cargar_por_api(df, registro)
+        finally:
+            registro.cerrar()
+            print(f"📝 Resultado por fila: {self.ruta_resultados}")
+        if not pendientes:
+            return True
+        
+        rechazados = pd.concat(pendientes)
+        if not config.bulk_ui_fallback:
+            print(f"❌ {len(rechazados)} eventos no se pudieron cargar por API")
+            self.eventos_procesados += len(rechazados)
+            self.eventos_fallidos += len(rechazados)
+            for _, evento in rechazados.iterrows():
+                self.errores_detallados.append({
+                    'evento': evento.get('codigo_evento') or 'N/A',
+                    'error': 'lote rechazado por el API'
+                })
+            return False
+        
+        print(f"⚠️ {len(rechazados)} eventos rechazados por el API, se cargan por el formulario")
+        # El resultado del formulario se agrega después del error del lote
+        return self.cargar_por_formulario(rechazados, continuar=True)
+    
+    def cargar_por_formulario(self, df, continuar=False):
+        """Cargar las filas completando el formulario web de COORDIS"""
+        registro = RegistroResultados(self.ruta_resultados, len(df), continuar=self.solo_fallidos or continuar)
+        try:
+            if self.workers > 1 and len(df) > 1:
+                return self.cargar_por_formulario_paralelo(df, registro)
+            return self.cargar_filas(df, registro)
+        finally:
+            registro.cerrar()
+            print(f"📝 Resultado por fila: {self.ruta_resultados}")
+    
+    def cargar_por_formulario_paralelo(self, df, registro):
+        """Cargar las filas repartidas entre varios navegadores"""
+        self.resumen_workers = cargar_formularios_en_paralelo(
+            df,
+            lambda: CargadorMasivoCSV(self.csv_file, pool=self.pool, modo='ui', workers=1),
+            self.workers,
+            registro
+        )
+        
+        self.eventos_procesados += registro.procesadas
+        self.eventos_formulario += registro.procesadas
+        self.eventos_exitosos += registro.exitosas
+        self.eventos_fallidos += registro.fallidas
+        self.errores_detallados.extend(registro.errores)
+        
+        return any(resumen['exito'] for resumen in self.resumen_workers)
+    
+    def cargar_filas(self, df, registro):
+        """Cargar las filas una por una en el navegador propio"""
+        if self.driver is None and not self.configurar_driver():
+            return False
+        
         # Navegar a COORDIS
         if not self.navegar_a_coordis():
             return False
@@ -290,20 +666,29 @@ class CargadorMasivoCSV:
         print(f"\n📋 Procesando {len(df)} eventos...")
         print("=" * 50)
         
+        total = self.eventos_procesados + len(df)
+        
         # Procesar cada evento
         for index, evento in df.iterrows():
             self.eventos_procesados += 1
+            self.eventos_formulario += 1
             
-            print(f"\n🔄 EVENTO {self.eventos_procesados}/{len(df)}")
+            print(f"\n🔄 EVENTO {self.eventos_procesados}/{total}")
             print(f"   Código: {evento.get('codigo_evento', 'N/A')}")
             print(f"   Cliente: {evento.get('cliente', 'N/A')}")
             print(f"   Fecha: {evento.get('fecha_evento', 'N/A')}")
             
+            errores_previos = len(self.errores_detallados)
             if self.procesar_evento(evento):
                 print(f"✅ Evento {self.eventos_procesados} procesado exitosamente")
+                registro.registrar(index, evento, True)
             else:
                 print(f"❌ Evento {self.eventos_procesados} falló")
                 self.eventos_fallidos += 1
+                error = (self.errores_detallados[errores_previos]['error']
+                         if len(self.errores_detallados) > errores_previos
+                         else 'no se pudo completar el formulario')
+                registro.registrar(index, evento, False, error)
         
         return True
     
@@ -313,20 +698,39 @@ class CargadorMasivoCSV:
         print("=" * 50)
         print(f"Total eventos: {self.eventos_procesados}")
         print(f"Exitosos: {self.eventos_exitosos}")
+        if self.modo == 'api':
+            print(f"  - Creados: {self.eventos_creados}")
+            print(f"  - Actualizados: {self.eventos_actualizados}")
+            print(f"  - Sin cambios: {self.eventos_sin_cambios}")
+            print(f"  - Por formulario: {self.eventos_formulario}")
         print(f"Fallidos: {self.eventos_fallidos}")
+        print(f"Omitidos (sin cambios en COORDIS): {self.eventos_omitidos}")
         
         if self.eventos_procesados > 0:
             tasa_exito = (self.eventos_exitosos / self.eventos_procesados) * 100
             print(f"Tasa de éxito: {tasa_exito:.1f}%")
         
+        if self.resumen_workers:
+            print(f"\n👥 Navegadores:")
+            for resumen in self.resumen_workers:
+                print(f"  - #{resumen['worker']}: {resumen['exitosas']}/{resumen['filas']} exitosos, "
+                      f"{resumen['fallidas']} fallidos")
+        
         if self.errores_detallados:
             print(f"\n❌ ERRORES DETALLADOS:")
             for error in self.errores_detallados:
                 print(f"  - Evento {error['evento']}: {error['error']}")
     
     def cerrar_driver(self):
-        """Cerrar el driver"""
-        if self.driver:
+        """Cerrar el driver (o devolverlo al pool)"""
+        if self.navegador:
+            # Cada evento carga el formulario y guarda: ~2 páginas
+            self.navegador.registrar_paginas(2 * self.eventos_formulario + 1)
+            self.pool.devolver(self.navegador)
+            self.navegador = None
+            self.driver = None
+            print("♻️ Driver devuelto al pool")
+        elif self.driver:
             self.driver.quit()
             print("🔒 Driver cerrado")
 
@@ -337,18 +741,15 @@ def main():
     print("📋 Características:")
     print("   ✅ Lee CSV con datos de eventos")
     print("   ✅ Valida datos antes de procesar")
-    print("   ✅ Carga masivamente en COORDIS")
+    print("   ✅ Carga masivamente en COORDIS (API por lotes)")
     print("   ✅ Reporta resultados detallados")
     print("   ✅ Manejo robusto de errores")
     print("=" * 60)
     
-    cargador = CargadorMasivoCSV()
+    # --reintentar-fallidos: solo las filas que fallaron en la carga anterior
+    cargador = CargadorMasivoCSV(solo_fallidos='--reintentar-fallidos' in sys.argv)
     
     try:
-        # Configurar driver
-        if not cargador.configurar_driver():
-            return False
-        
         # Procesar CSV masivamente
         if not cargador.procesar_csv_masivamente():
             return False
@@ -10,14 +10,23 @@ import json
 import subprocess
 import threading
 import time
+import shutil
 from datetime import datetime
 from flask import Flask, jsonify, request, send_file
 from flask_cors import CORS
 import pandas as pd
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from utils.config import config
+
 app = Flask(__name__)
 CORS(app)
 
+# Pools de navegadores calientes (DRIVER_POOL_ENABLED=true)
+pool_janos = None
+pool_coordis = None
+
 # Estado global del sistema
 system_status = {
     'rpa': {
@@ -33,6 +42,11 @@ system_status = {
         'logs': [],
         'workflow_status': 'ready'
     },
+    'cargador': {
+        'status': 'stopped',
+        'last_execution': None,
+        'logs': []
+    },
     'system': {
         'uptime': time.time(),
         'coordinations_count': 0,
@@ -57,6 +71,38 @@ def log_message(service, message, level='info'):
     # También imprimir en consola para debugging
     print(f"[{timestamp}] [{service.upper()}] [{level.upper()}] {message}")
 
+def iniciar_pools():
+    """Abrir los navegadores calientes que usan los trabajos"""
+    global pool_janos, pool_coordis
+    from rpa.pool_navegadores import crear_pool_janos
+    from cargador_masivo_csv import crear_pool_coordis
+    
+    pool_janos = crear_pool_janos()
+    pool_janos.iniciar()
+    pool_coordis = crear_pool_coordis()
+    pool_coordis.iniciar()
+
+def execute_rpa_pool():
+    """Ejecutar la extracción en este proceso con los navegadores del pool"""
+    from rpa.extractor_eventos import crear_extractor
+    
+    log_message('rpa', '♻️ Usando navegadores calientes del pool...', 'info')
+    # El extractor (y cada worker o combinación de filtros) toma su navegador
+    # del pool y al devolverlo registra las páginas que cargó
+    extractor = crear_extractor(pool=pool_janos)
+    exito = extractor.extraer_todos_eventos()
+    stats = extractor.obtener_estadisticas()
+    
+    if not exito:
+        log_message('rpa', '❌ Error en RPA: extracción fallida', 'error')
+        return
+    
+    # El workflow lee el CSV con el nombre del script RPA
+    shutil.copyfile(config.csv_output_path, 'todos_los_eventos_extraidos.csv')
+    system_status['rpa']['csv_available'] = True
+    system_status['rpa']['csv_path'] = 'todos_los_eventos_extraidos.csv'
+    log_message('rpa', f"📊 Extraídos {stats['total_eventos']} eventos exitosamente", 'success')
+
 def execute_rpa():
     """Ejecutar el RPA de extracción"""
     try:
@@ -71,6 +117,10 @@ def execute_rpa():
         
         log_message('rpa', '🔗 Conectando al sistema Janos...', 'info')
         
+        if pool_janos is not None:
+            execute_rpa_pool()
+            return
+        
         # Ejecutar el script RPA
         log_message('rpa', '⚙️ Ejecutando script de extracción...', 'info')
         result = subprocess.run([
@@ -166,6 +216,33 @@ def execute_n8n():
         system_status['n8n']['last_execution'] = datetime.now().isoformat()
         log_message('n8n', '🏁 Workflow N8N finalizado', 'info')
 
+def execute_cargador(solo_fallidos=False):
+    """Cargar el CSV en COORDIS por el API (o desde la UI con un navegador del pool)"""
+    from cargador_masivo_csv import CargadorMasivoCSV
+    
+    cargador = CargadorMasivoCSV(pool=pool_coordis, solo_fallidos=solo_fallidos)
+    try:
+        log_message('cargador', '🚀 Iniciando carga masiva desde CSV...', 'info')
+        system_status['cargador']['status'] = 'running'
+        
+        if cargador.procesar_csv_masivamente():
+            log_message('cargador', f'✅ {cargador.eventos_exitosos}/{cargador.eventos_procesados} eventos cargados', 'success')
+            if cargador.eventos_omitidos:
+                log_message('cargador', f'⏭️ {cargador.eventos_omitidos} eventos sin cambios omitidos', 'info')
+            if cargador.modo == 'api':
+                log_message('cargador', f'📦 {cargador.eventos_creados} creados, {cargador.eventos_actualizados} actualizados, '
+                            f'{cargador.eventos_sin_cambios} sin cambios, {cargador.eventos_fallidos} con error', 'info')
+        else:
+            log_message('cargador', '❌ Error en la carga masiva', 'error')
+    
+    except Exception as e:
+        log_message('cargador', f'💥 Error en la carga masiva: {str(e)}', 'error')
+    finally:
+        cargador.cerrar_driver()
+        system_status['cargador']['status'] = 'stopped'
+        system_status['cargador']['last_execution'] = datetime.now().isoformat()
+        log_message('cargador', '🏁 Carga masiva finalizada', 'info')
+
 # Rutas de la API
 @app.route('/api/system/status', methods=['GET'])
 def get_system_status():
@@ -201,6 +278,35 @@ def execute_n8n_endpoint():
     
     return jsonify({'message': 'N8N iniciado'})
 
+@app.route('/api/system/cargador/execute', methods=['POST'])
+def execute_cargador_endpoint():
+    """Ejecutar carga masiva del CSV en COORDIS"""
+    if system_status['cargador']['status'] == 'running':
+        return jsonify({'error': 'La carga masiva ya está ejecutándose'}), 400
+    
+    if not system_status['rpa']['csv_available']:
+        return jsonify({'error': 'No hay CSV disponible. Ejecute RPA primero'}), 400
+    
+    # {"solo_fallidos": true} reintenta solo las filas que fallaron en la carga anterior
+    opciones = request.get_json(silent=True) or {}
+    thread = threading.Thread(target=execute_cargador, args=(bool(opciones.get('solo_fallidos')),))
+    thread.daemon = True
+    thread.start()
+    
+    return jsonify({'message': 'Carga masiva iniciada'})
+
+@app.route('/api/system/pool', methods=['GET'])
+def get_pool_status():
+    """Estado de los pools de navegadores"""
+    if pool_janos is None:
+        return jsonify({'enabled': False})
+    
+    return jsonify({
+        'enabled': True,
+        'janos': pool_janos.estado(),
+        'coordis': pool_coordis.estado()
+    })
+
 @app.route('/api/system/csv/download', methods=['GET'])
 def download_csv():
     """Descargar archivo CSV"""
@@ -253,6 +359,13 @@ if __name__ == '__main__':
     print("   GET  /api/system/logs/<service> - Logs del servicio")
     print("   GET  /api/system/coordinations/count - Contar coordinaciones")
     print("   GET  /api/system/health - Salud del sistema")
+    print("   POST /api/system/cargador/execute - Cargar CSV en COORDIS")
+    print("   GET  /api/system/pool - Estado del pool de navegadores")
     print("🌐 API disponible en: http://localhost:3003")
     
-    app.run(host='0.0.0.0', port=3003, debug=True)
+    if config.driver_pool_enabled:
+        iniciar_pools()
+    
+    # El reloader de Flask abre un segundo proceso: con el pool se desactiva
+    # para no duplicar los navegadores
+    app.run(host='0.0.0.0', port=3003, debug=True, use_reloader=not config.driver_pool_enabled)
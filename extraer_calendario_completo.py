@@ -2,8 +2,8 @@
 # -*- coding: utf-8 -*-
 """
 Script para navegar por todo el calendario anual y extraer fechas resaltadas
-- Navega por los 12 meses del año
-- Identifica fechas con fondo naranja (eventos)
+- Lee los 12 meses del año en un solo recorrido del calendario
+- Identifica fechas resaltadas (eventos)
 - Extrae datos de cada evento
 """
 
@@ -18,11 +18,17 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+# Módulos compartidos del sistema de producción
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from rpa.calendario import MESES, leer_calendario, resumen_por_mes
+
 def extraer_calendario_completo():
     """Extraer eventos de todo el calendario anual"""
     
     print("=== EXTRACCIÓN DEL CALENDARIO ANUAL COMPLETO ===")
-    print("Navegando por los 12 meses del año...")
+    print("Leyendo los 12 meses del año en un solo recorrido...")
     print("Identificando fechas resaltadas en naranja...")
     
     driver = None
@@ -140,78 +146,23 @@ def extraer_calendario_completo():
         except Exception as e:
             print(f"✗ Error aplicando filtros: {str(e)}")
         
-        # PASO 4: Navegar por todo el calendario
-        print("\n=== PASO 4: NAVEGANDO POR EL CALENDARIO ANUAL ===")
-        
-        # Función para extraer fechas resaltadas de un mes
-        def extraer_fechas_mes(mes_nombre):
-            print(f"\n--- Procesando {mes_nombre} ---")
-            fechas_mes = []
-            
-            try:
-                # Buscar el mes específico
-                mes_element = driver.find_element(By.XPATH, f"//*[contains(text(), '{mes_nombre}')]")
-                print(f"✓ Mes {mes_nombre} encontrado")
-                
-                # Buscar la tabla del mes
-                tabla_mes = mes_element.find_element(By.XPATH, "./following-sibling::table")
-                print(f"✓ Tabla de {mes_nombre} encontrada")
-                
-                # Buscar fechas resaltadas (con fondo naranja)
-                fechas_resaltadas = tabla_mes.find_elements(By.CSS_SELECTOR, "td[style*='background-color: orange'], td[style*='background-color:orange'], td[bgcolor='orange'], td[class*='orange'], td[style*='background: orange'], td[style*='background:orange']")
-                
-                print(f"✓ Fechas resaltadas en {mes_nombre}: {len(fechas_resaltadas)}")
-                
-                for fecha_elem in fechas_resaltadas:
-                    try:
-                        fecha_numero = fecha_elem.text.strip()
-                        if fecha_numero.isdigit():
-                            fecha_completa = f"{fecha_numero}/{mes_nombre}/2025"
-                            fechas_mes.append(fecha_completa)
-                            print(f"  - Fecha resaltada: {fecha_completa}")
-                    except Exception as e:
-                        print(f"✗ Error procesando fecha: {str(e)}")
-                
-            except Exception as e:
-                print(f"✗ Error procesando {mes_nombre}: {str(e)}")
-            
-            return fechas_mes
-        
-        # Lista de todos los meses
-        meses = [
-            "ENERO", "FEBRERO", "MARZO", "ABRIL", "MAYO", "JUNIO",
-            "JULIO", "AGOSTO", "SEPTIEMBRE", "OCTUBRE", "NOVIEMBRE", "DICIEMBRE"
-        ]
+        # PASO 4: Leer todo el calendario
+        print("\n=== PASO 4: LEYENDO EL CALENDARIO ANUAL ===")
         
+        # Un solo recorrido del documento: cada día resaltado en naranja con el mes de su título
         todas_fechas_eventos = []
+        fechas_resaltadas = leer_calendario(driver, ano="2025", color='orange', estricto=True)
         
-        # Scroll hacia arriba para ver los primeros meses
-        print("Haciendo scroll hacia arriba para ver Enero-Junio...")
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        for mes, cantidad in resumen_por_mes(fechas_resaltadas).items():
+            print(f"✓ Fechas resaltadas en {mes}: {cantidad}")
         
-        # Procesar primeros 6 meses (Enero-Junio)
-        for mes in meses[:6]:
-            fechas_mes = extraer_fechas_mes(mes)
-            todas_fechas_eventos.extend(fechas_mes)
-            
-            # Scroll hacia abajo para ver el siguiente mes
-            driver.execute_script("window.scrollBy(0, 200);")
-            time.sleep(1)
-        
-        # Scroll hacia abajo para ver los últimos meses
-        print("Haciendo scroll hacia abajo para ver Julio-Diciembre...")
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        
-        # Procesar últimos 6 meses (Julio-Diciembre)
-        for mes in meses[6:]:
-            fechas_mes = extraer_fechas_mes(mes)
-            todas_fechas_eventos.extend(fechas_mes)
-            
-            # Scroll hacia arriba para ver el siguiente mes
-            driver.execute_script("window.scrollBy(0, -200);")
-            time.sleep(1)
+        for fecha_info in fechas_resaltadas:
+            if not fecha_info['mes']:
+                print(f"✗ Fecha {fecha_info['dia']} sin mes reconocido, se omite")
+                continue
+            fecha_completa = f"{fecha_info['dia']}/{MESES[fecha_info['mes'] - 1]}/2025"
+            todas_fechas_eventos.append(fecha_completa)
+            print(f"  - Fecha resaltada: {fecha_completa}")
         
         # PASO 5: Procesar fechas encontradas
         print(f"\n=== PASO 5: PROCESANDO FECHAS ENCONTRADAS ===")
@@ -244,7 +195,7 @@ def extraer_calendario_completo():
             
             # Mostrar resumen por mes
             print(f"\nResumen por mes:")
-            for mes in meses:
+            for mes in MESES:
                 eventos_mes = [e for e in eventos_extraidos if mes in e['Fecha']]
                 if eventos_mes:
                     print(f"  {mes}: {len(eventos_mes)} eventos")
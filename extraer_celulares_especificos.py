@@ -5,7 +5,8 @@ Script específico para extraer los números de celular exactos: 541157526518
 """
 
 import time
-import re
+import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -13,6 +14,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from utils.telefonos import extraer_celulares, normalizar_celular
+
 def extraer_celulares_especificos():
     """Extraer los números de celular específicos: 541157526518"""
     
@@ -206,60 +211,14 @@ def extraer_celulares_especificos():
         else:
             print(f"✗ Número {numero_especifico} NO encontrado en el HTML")
         
-        # Buscar patrones similares
-        patrones_busqueda = [
-            r'541157526518',
-            r'5411\d{8}',
-            r'54\s*11\s*57526518',
-            r'\+54\s*11\s*57526518',
-            r'011\s*57526518',
-            r'11\s*57526518',
-            r'57526518'
-        ]
-        
-        numeros_encontrados = []
-        for patron in patrones_busqueda:
-            matches = re.findall(patron, page_html)
-            for match in matches:
-                if match not in numeros_encontrados:
-                    numeros_encontrados.append(match)
-                    print(f"✓ Número encontrado con patrón {patron}: {match}")
-        
-        # Buscar en elementos específicos
-        print(f"\n=== BÚSQUEDA EN ELEMENTOS ESPECÍFICOS ===")
-        
-        # Buscar elementos que contengan "Celular"
-        elementos_celular = driver.find_elements(By.XPATH, "//*[contains(text(), 'Celular')]")
-        print(f"Elementos con 'Celular' encontrados: {len(elementos_celular)}")
-        
-        for elem in elementos_celular:
-            texto = elem.text.strip()
-            print(f"Elemento Celular: {texto}")
-            
-            # Buscar números en el texto
-            for patron in patrones_busqueda:
-                matches = re.findall(patron, texto)
-                for match in matches:
-                    if match not in numeros_encontrados:
-                        numeros_encontrados.append(match)
-                        print(f"✓ Número encontrado en elemento: {match}")
-        
-        # Buscar en todas las celdas de tabla
-        print(f"\n=== BÚSQUEDA EN TABLAS ===")
-        celdas_tabla = driver.find_elements(By.TAG_NAME, "td")
-        print(f"Celdas de tabla encontradas: {len(celdas_tabla)}")
-        
-        for i, celda in enumerate(celdas_tabla):
-            texto_celda = celda.text.strip()
-            if texto_celda and any(char.isdigit() for char in texto_celda):
-                # Buscar números en el texto de la celda
-                for patron in patrones_busqueda:
-                    matches = re.findall(patron, texto_celda)
-                    for match in matches:
-                        if match not in numeros_encontrados:
-                            numeros_encontrados.append(match)
-                            print(f"✓ Número encontrado en celda {i}: {match}")
-                            print(f"  Texto de la celda: {texto_celda}")
+        # Buscar los celulares junto a los rótulos "Celular" (ya normalizados)
+        print(f"\n=== BÚSQUEDA JUNTO A LOS RÓTULOS 'Celular' ===")
+        numeros_encontrados = extraer_celulares(page_html)
+        for numero in numeros_encontrados:
+            print(f"✓ Número encontrado: {numero}")
+        
+        if normalizar_celular(numero_especifico) in numeros_encontrados:
+            print(f"✓ Número {numero_especifico} encontrado junto a un rótulo Celular")
         
         # Resultado final
         print(f"\n=== RESULTADO FINAL ===")
@@ -4,12 +4,18 @@ Script para probar el workflow completo de N8N
 Simula el procesamiento de todos los eventos del CSV
 """
 
+import os
+import sys
 import pandas as pd
 import requests
 import json
 import time
 from datetime import datetime
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from sync.indice_coordinaciones import IndiceCoordinaciones
+
 def procesar_csv_completo():
     """Procesa todos los eventos del CSV y los envía al API"""
     
@@ -30,6 +36,11 @@ def procesar_csv_completo():
     fallidos = 0
     errores = []
     
+    # Coordinaciones existentes: las filas sin cambios no se vuelven a enviar
+    indice = IndiceCoordinaciones.desde_api("http://localhost:3002", timeout=10)
+    if indice is None:
+        print("⚠️ No se pudieron leer las coordinaciones existentes, se envían todas")
+    
     print("\n📤 PROCESANDO EVENTOS:")
     print("-" * 30)
     
@@ -49,6 +60,10 @@ def procesar_csv_completo():
                 "salon": row['salon']
             }
             
+            if indice and indice.sin_cambios(evento_data):
+                print(f"⏭️ Evento {index+1}: sin cambios, se omite")
+                continue
+            
             # Enviar al API
             response = requests.post(api_url, json=evento_data, headers=headers, timeout=10)
             
@@ -71,6 +86,7 @@ def procesar_csv_completo():
         time.sleep(0.1)
     
     # Generar reporte
+    omitidos = indice.omitidas if indice else 0
     total = exitosos + fallidos
     tasa_exito = (exitosos / total * 100) if total > 0 else 0
     
@@ -79,6 +95,7 @@ def procesar_csv_completo():
             "total_eventos": total,
             "exitosos": exitosos,
             "fallidos": fallidos,
+            "omitidos_sin_cambios": omitidos,
             "tasa_exito": f"{tasa_exito:.1f}%",
             "timestamp": datetime.now().isoformat()
         },
@@ -94,6 +111,7 @@ def procesar_csv_completo():
     print(f"   Total eventos: {total}")
     print(f"   Exitosos: {exitosos}")
     print(f"   Fallidos: {fallidos}")
+    print(f"   Omitidos (sin cambios): {omitidos}")
     print(f"   Tasa de éxito: {tasa_exito:.1f}%")
     print(f"   Reporte guardado en: reporte_carga_masiva.json")
     
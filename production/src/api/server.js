@@ -402,13 +402,14 @@ app.post('/api/coordinations/bulk', async (req, res) => {
       detalles: []
     };
     
-    for (const coord of coords) {
+    for (const [indice, coord] of coords.entries()) {
       try {
         // Simular POST individual
         const validation = validarCoordinacion(coord);
         if (!validation.valid) {
           resultados.errores++;
           resultados.detalles.push({
+            indice,
             codigo: coord.codigo_evento,
             error: validation.errors.join(', ')
           });
@@ -444,6 +445,7 @@ app.post('/api/coordinations/bulk', async (req, res) => {
       } catch (err) {
         resultados.errores++;
         resultados.detalles.push({
+          indice,
           codigo: coord.codigo_evento,
           error: err.message
         });
@@ -18,7 +18,7 @@ sys.path.append(str(Path(__file__).parent))
 
 from utils.config import config
 from utils.logger import logger
-from rpa.extractor_eventos import ExtractorEventos
+from rpa.extractor_eventos import crear_extractor
 from sync.sincronizador import Sincronizador
 
 
@@ -28,9 +28,17 @@ class RPAJanosManager:
     Orquesta todos los componentes del sistema
     """
     
-    def __init__(self):
-        """Inicializa el gestor"""
+    def __init__(self, refresco_completo: bool = False, reanudar: bool = False):
+        """
+        Inicializa el gestor
+        
+        Args:
+            refresco_completo: Releer todas las fechas del calendario
+            reanudar: Retomar la extracción desde el último checkpoint
+        """
         self.extractor = None
+        self.refresco_completo = refresco_completo
+        self.reanudar = reanudar
         self.sincronizador = None
         self.start_time = None
         
@@ -54,7 +62,10 @@ class RPAJanosManager:
         logger.info("="*60)
         
         try:
-            self.extractor = ExtractorEventos()
+            self.extractor = crear_extractor(
+                refresco_completo=self.refresco_completo,
+                reanudar=self.reanudar
+            )
             exito = self.extractor.extraer_todos_eventos()
             
             if exito:
@@ -63,7 +74,49 @@ class RPAJanosManager:
                 logger.info(f"   - Eventos extraídos: {stats['total_eventos']}")
                 logger.info(f"   - Errores: {stats['total_errores']}")
                 logger.info(f"   - Duración: {stats['duracion']:.2f}s")
-            
+                logger.info(f"   - Fechas sin cambios omitidas: {stats['fechas_omitidas']}")
+                if stats['concurrencia']:
+                    concurrencia = stats['concurrencia']
+                    logger.info(
+                        f"   - Concurrencia ({concurrencia['nombre']}): {concurrencia['limite_actual']} "
+                        f"[{concurrencia['minimo']}-{concurrencia['maximo']}], "
+                        f"{concurrencia['aumentos']} aumentos, {concurrencia['reducciones']} reducciones"
+                    )
+                if stats['limite_tasa']:
+                    logger.info(
+                        f"   - Límite de tasa: {stats['limite_tasa']['tasa_por_segundo']}/s "
+                        f"({stats['limite_tasa']['espera_total']}s de espera)"
+                    )
+                if stats['relogins']:
+                    logger.info(f"   - Reingresos por sesión vencida: {stats['relogins']}")
+                if self.reanudar:
+                    logger.info(f"   - Fechas reanudadas: {stats['fechas_reanudadas']}")
+                for particion in stats['particiones']:
+                    logger.info(
+                        f"   - Combinación {particion['combinacion']}: "
+                        f"{particion['total_eventos']} eventos"
+                        f"{'' if particion['exito'] else ' (fallida)'}"
+                    )
+                for worker in stats['workers']:
+                    logger.info(
+                        f"   - Worker #{worker['worker_id']}: "
+                        f"{worker['total_eventos']} eventos en {worker['fechas_procesadas']} fechas "
+                        f"({worker['duracion']:.2f}s)"
+                    )
+                tiempo_esperas = sum(e['total'] for e in stats['esperas'].values())
+                logger.info(f"   - Tiempo en esperas: {tiempo_esperas:.2f}s")
+                navegaciones = stats['navegaciones']
+                logger.info(
+                    f"   - Navegaciones: {navegaciones['cantidad']} "
+                    f"({navegaciones['bytes'] / 1024:.1f} KB, {navegaciones['duracion_ms']} ms)"
+                )
+                eventos = navegaciones['eventos']
+                if eventos['cantidad']:
+                    logger.info(
+                        f"   - Páginas de eventos: {eventos['cantidad']} "
+                        f"(promedio {eventos['promedio_ms']} ms, {eventos['bytes'] / 1024:.1f} KB)"
+                    )
+
             return exito
             
         except Exception as e:
@@ -232,6 +285,8 @@ Ejemplos de uso:
   python main.py                    # Ejecuta flujo completo
   python main.py --extract          # Solo extracción
   python main.py --sync             # Solo sincronización
+  python main.py --full-refresh     # Relee todas las fechas (sin incremental)
+  python main.py --resume           # Continúa una extracción interrumpida
   python main.py --health           # Verifica salud del sistema
         """
     )
@@ -254,6 +309,18 @@ Ejemplos de uso:
         help='Verificar salud del sistema'
     )
     
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Releer todas las fechas aunque no hayan cambiado'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continuar desde el último checkpoint de extracción'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -263,7 +330,7 @@ Ejemplos de uso:
     args = parser.parse_args()
     
     # Crear gestor
-    manager = RPAJanosManager()
+    manager = RPAJanosManager(refresco_completo=args.full_refresh, reanudar=args.resume)
     
     # Verificar salud si se solicita
     if args.health:
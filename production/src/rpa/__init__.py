@@ -3,6 +3,16 @@ Módulos RPA
 """
 
 from .extractor_eventos import ExtractorEventos
+from .sesion_cache import SesionCache, sesion_activa
+from .esperas import MotorEsperas
+from .snapshot_dom import snapshot_texto
+from .campos_evento import ESQUEMA_CAMPOS, extraer_campos
+from .pool_navegadores import PoolNavegadores, crear_pool_janos
+from .cache_urls import CacheUrlsEventos, pagina_evento_valida
+from .pestanas import LectorPestanas
 
-__all__ = ['ExtractorEventos']
+__all__ = ['ExtractorEventos', 'SesionCache', 'sesion_activa', 'MotorEsperas',
+           'snapshot_texto', 'ESQUEMA_CAMPOS', 'extraer_campos', 'PoolNavegadores',
+           'crear_pool_janos', 'CacheUrlsEventos', 'pagina_evento_valida',
+           'LectorPestanas']
 
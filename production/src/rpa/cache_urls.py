@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché de URLs de Eventos - RPA Jano's Eventos
+==============================================
+Guarda la URL de ver_evento.php de cada codigo_evento para ir directo a la
+página del evento sin clickear la fecha, el código y el enlace. Las URLs que
+dejan de cargar el evento se invalidan
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+from rpa.sesion_cache import sesion_activa
+
+
+def pagina_evento_valida(driver, codigo_evento: str) -> bool:
+    """
+    Verifica que la página cargada sea la del evento buscado
+    
+    Args:
+        driver: Driver de Selenium ya navegado a la URL
+        codigo_evento: Código que debe mostrar la página
+    
+    Returns:
+        True si la página es ver_evento.php y muestra el código
+    """
+    try:
+        if "ver_evento.php" not in driver.current_url:
+            return False
+        if not sesion_activa(driver):
+            return False
+        return str(codigo_evento) in driver.page_source
+    except Exception as e:
+        logger.debug(f"No se pudo verificar la página del evento {codigo_evento}: {e}")
+        return False
+
+
+class CacheUrlsEventos:
+    """
+    Mapa persistente codigo_evento -> URL de ver_evento.php
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Carga la caché
+        
+        Args:
+            path: Archivo JSON (por defecto config.event_url_cache_path)
+        """
+        self.path = Path(path) if path else config.event_url_cache_path
+        self.urls: Dict[str, Dict] = {}
+        self.aciertos = 0
+        self.invalidadas = 0
+        self._modificada = False
+        self._lock = threading.Lock()
+        
+        if config.event_url_cache_enabled:
+            self._cargar()
+    
+    def _cargar(self):
+        """Lee la caché si existe"""
+        if not self.path.exists():
+            return
+        
+        try:
+            self.urls = json.loads(self.path.read_text(encoding='utf-8'))
+            logger.debug(f"Caché de URLs de eventos: {len(self.urls)} códigos")
+        except Exception as e:
+            logger.warning(f"⚠️ Caché de URLs de eventos inválida, se descarta: {e}")
+            self.urls = {}
+    
+    def obtener(self, codigo_evento: str) -> Optional[Dict]:
+        """
+        Busca la URL guardada de un evento
+        
+        Args:
+            codigo_evento: Código de 5 dígitos
+        
+        Returns:
+            {'url', 'fecha', 'actualizada'} o None si no está en la caché
+        """
+        if not config.event_url_cache_enabled:
+            return None
+        
+        with self._lock:
+            entrada = self.urls.get(str(codigo_evento))
+            if entrada:
+                self.aciertos += 1
+            return entrada
+    
+    def registrar(self, codigo_evento: str, url: str, fecha: Optional[str] = None):
+        """
+        Guarda la URL capturada de un evento
+        
+        Args:
+            codigo_evento: Código de 5 dígitos
+            url: URL de ver_evento.php
+            fecha: Fecha del calendario donde aparece el evento
+        """
+        if not url or not codigo_evento:
+            return
+        
+        with self._lock:
+            anterior = self.urls.get(str(codigo_evento))
+            if anterior and anterior['url'] == url:
+                return
+            self.urls[str(codigo_evento)] = {
+                'url': url,
+                'fecha': fecha,
+                'actualizada': time.time()
+            }
+            self._modificada = True
+    
+    def invalidar(self, codigo_evento: str):
+        """Descarta la URL de un evento que no cargó"""
+        with self._lock:
+            if self.urls.pop(str(codigo_evento), None):
+                self.invalidadas += 1
+                self._modificada = True
+                logger.info(f"🗑️ URL del evento {codigo_evento} invalidada")
+    
+    def guardar(self):
+        """Persiste la caché si hubo cambios (escritura atómica)"""
+        if not config.event_url_cache_enabled:
+            return
+        
+        with self._lock:
+            if not self._modificada:
+                return
+            contenido = json.dumps(self.urls, ensure_ascii=False, indent=2)
+            self._modificada = False
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            tmp_path.write_text(contenido, encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            logger.debug(f"💾 Caché de URLs de eventos guardada ({len(self.urls)} códigos)")
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo guardar la caché de URLs de eventos: {e}")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lector del Calendario Anual - RPA Jano's Eventos
+=================================================
+Recorre el calendario de Adicionales en una sola llamada execute_script y
+devuelve todas las fechas resaltadas del año con su mes y su día, en lugar
+de buscar cada mes por XPath y scrollear entre meses
+"""
+
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.logger import logger
+
+
+MESES = [
+    "ENERO", "FEBRERO", "MARZO", "ABRIL", "MAYO", "JUNIO",
+    "JULIO", "AGOSTO", "SEPTIEMBRE", "OCTUBRE", "NOVIEMBRE", "DICIEMBRE"
+]
+
+# Celdas de día del calendario (div.boton en Adicionales, td en la vista anual)
+SELECTOR_DIAS = "div.boton, td"
+
+# Recorre el documento en orden: los títulos de mes fijan el mes vigente y
+# cada celda de día resaltada se devuelve con ese mes
+SCRIPT_CALENDARIO = """
+var selectorDias = arguments[0];
+var patronMes = new RegExp(arguments[1], 'i');
+var mesActual = null;
+var anoActual = null;
+var resultado = [];
+
+function textoPropio(el) {
+    var texto = '';
+    for (var n = el.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3) texto += n.nodeValue;
+    }
+    return texto.trim();
+}
+
+function resaltada(el) {
+    var estilo = el.getAttribute('style') || '';
+    var fondo = el.style.background || el.style.backgroundColor || el.getAttribute('bgcolor') || '';
+    var clase = el.className || '';
+    if (!fondo && /background/i.test(estilo)) fondo = estilo;
+    if (!fondo && /coral|orange/i.test(clase)) fondo = clase;
+    return fondo ? fondo.trim() : null;
+}
+
+var todos = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < todos.length; i++) {
+    var el = todos[i];
+    var propio = textoPropio(el);
+    var mes = propio ? propio.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').match(patronMes) : null;
+    if (mes) {
+        mesActual = mes[1].toUpperCase();
+        if (mes[2]) anoActual = mes[2];
+        continue;
+    }
+    
+    if (!el.matches(selectorDias)) continue;
+    // Una td que contiene un div.boton se cuenta por el div
+    if (el.querySelector(selectorDias)) continue;
+    
+    var dia = (el.innerText || el.textContent || '').trim();
+    if (!/^\\d{1,2}$/.test(dia)) continue;
+    
+    var color = resaltada(el);
+    if (!color) continue;
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) continue;
+    
+    resultado.push({
+        elemento: el,
+        dia: parseInt(dia, 10),
+        mes: mesActual,
+        ano: anoActual,
+        color: color,
+        identificador: el.getAttribute('onclick') || ''
+    });
+}
+return resultado;
+"""
+
+
+def _patron_meses() -> str:
+    """Regex (para JS) de un título de mes, con el año opcional"""
+    nombres = MESES + ["SETIEMBRE"]
+    return r'^(' + '|'.join(nombres) + r')\b(?:\D*(\d{4}))?'
+
+
+def _sin_acentos(texto: str) -> str:
+    """Quita los acentos de un texto"""
+    return ''.join(c for c in unicodedata.normalize('NFD', texto) if unicodedata.category(c) != 'Mn')
+
+
+def numero_mes(nombre: Optional[str]) -> Optional[int]:
+    """
+    Número de un mes a partir de su nombre
+    
+    Args:
+        nombre: Nombre del mes en español (mayúsculas o minúsculas)
+    
+    Returns:
+        1..12 o None si no se reconoce
+    """
+    if not nombre:
+        return None
+    nombre = _sin_acentos(nombre).upper()
+    if nombre == "SETIEMBRE":
+        nombre = "SEPTIEMBRE"
+    return MESES.index(nombre) + 1 if nombre in MESES else None
+
+
+def leer_calendario(driver, ano: Optional[str] = None, color: Optional[str] = None,
+                    selector_dias: str = SELECTOR_DIAS, estricto: bool = False) -> List[Dict]:
+    """
+    Lee todas las fechas resaltadas del calendario en una sola llamada
+    
+    Args:
+        driver: Driver de Selenium (en el frame del calendario)
+        ano: Año del calendario (si el título del mes no lo trae)
+        color: Si se indica, solo las celdas cuyo fondo lo contiene (ej. 'coral')
+        selector_dias: Selector CSS de las celdas de día
+        estricto: Con color, no aceptar las demás celdas resaltadas si
+                  ninguna tiene ese color
+    
+    Returns:
+        Lista en orden de documento de {indice, dia, mes, ano, fecha,
+        identificador, color, elemento}; 'fecha' es DD/MM/YYYY si se conoce
+        el mes y el año, o el número de día si no
+    """
+    celdas = driver.execute_script(SCRIPT_CALENDARIO, selector_dias, _patron_meses()) or []
+    
+    if color:
+        filtradas = [celda for celda in celdas if color.lower() in (celda.get('color') or '').lower()]
+        # Si ninguna celda tiene ese color se aceptan todas las resaltadas (salvo en modo estricto)
+        celdas = filtradas if filtradas or estricto else celdas
+    
+    fechas = [
+        _fecha_celda(
+            indice, celda['dia'], celda.get('mes'), celda.get('ano') or ano,
+            celda.get('identificador', ''), celda.get('color'), celda['elemento']
+        )
+        for indice, celda in enumerate(celdas)
+    ]
+    
+    sin_mes = sum(1 for fecha in fechas if not fecha['mes'])
+    if sin_mes:
+        logger.debug(f"{sin_mes} fechas del calendario sin título de mes reconocido")
+    
+    return fechas
+
+
+def _fecha_celda(indice: int, dia: int, nombre_mes: Optional[str], ano: Optional[str],
+                 identificador: str, color: Optional[str], elemento) -> Dict:
+    """Arma el diccionario de una celda de día (DD/MM/YYYY si se conoce mes y año)"""
+    mes = numero_mes(nombre_mes)
+    fecha = f"{dia:02d}/{mes:02d}/{ano}" if mes and ano else str(dia)
+    return {
+        'indice': indice,
+        'dia': dia,
+        'mes': mes,
+        'ano': ano,
+        'fecha': fecha,
+        'identificador': identificador,
+        'color': color,
+        'elemento': elemento
+    }
+
+
+def leer_calendario_html(soup, ano: Optional[str] = None, color: Optional[str] = None,
+                         selector_dias: str = SELECTOR_DIAS) -> List[Dict]:
+    """
+    Mismo recorrido que SCRIPT_CALENDARIO sobre el HTML ya parseado (motor
+    HTTP): los títulos de mes fijan el mes vigente de las celdas siguientes
+    
+    Args:
+        soup: BeautifulSoup de la página del calendario
+        ano: Año del calendario (si el título del mes no lo trae)
+        color: Si se indica, solo las celdas cuyo fondo lo contiene (ej. 'coral')
+        selector_dias: Selector CSS de las celdas de día
+    
+    Returns:
+        Lista con el mismo formato que leer_calendario(); 'elemento' es el tag
+    """
+    patron_mes = re.compile(_patron_meses(), re.IGNORECASE)
+    dias = {id(el) for el in soup.select(selector_dias)}
+    mes_actual, ano_actual = None, None
+    fechas = []
+    
+    for el in soup.find_all(True):
+        propio = ''.join(el.find_all(string=True, recursive=False)).strip()
+        titulo = patron_mes.match(_sin_acentos(propio)) if propio else None
+        if titulo:
+            mes_actual = titulo.group(1).upper()
+            ano_actual = titulo.group(2) or ano_actual
+            continue
+        
+        # Una td que contiene un div.boton se cuenta por el div
+        if id(el) not in dias or any(id(hijo) in dias for hijo in el.find_all(True)):
+            continue
+        
+        dia = el.get_text(strip=True)
+        if not dia.isdigit() or len(dia) > 2:
+            continue
+        
+        # Mismo criterio que resaltada() en SCRIPT_CALENDARIO
+        estilo = el.get('style') or ''
+        clase = ' '.join(el.get('class') or [])
+        fondo = (
+            (estilo if re.search('background', estilo, re.I) else '')
+            or el.get('bgcolor')
+            or (clase if re.search('coral|orange', clase, re.I) else '')
+        )
+        if not fondo or (color and color.lower() not in fondo.lower()):
+            continue
+        
+        fechas.append(_fecha_celda(
+            len(fechas), int(dia), mes_actual, ano_actual or ano,
+            el.get('onclick') or '', fondo, el
+        ))
+    
+    return fechas
+
+
+def resumen_por_mes(fechas: List[Dict]) -> Dict[str, int]:
+    """
+    Cantidad de fechas resaltadas por mes
+    
+    Args:
+        fechas: Resultado de leer_calendario()
+    
+    Returns:
+        Nombre del mes -> cantidad (en orden de calendario)
+    """
+    resumen = {}
+    for fecha in sorted(fechas, key=lambda f: (f['mes'] or 13, f['dia'])):
+        nombre = MESES[fecha['mes'] - 1] if fecha['mes'] else "SIN MES"
+        resumen[nombre] = resumen.get(nombre, 0) + 1
+    return resumen
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Campos de Evento - RPA Jano's Eventos
+======================================
+Esquema declarativo de los campos de la página ver_evento.php y extracción
+en una sola pasada sobre la lista de textos de la página (snapshot del DOM
+o HTML parseado)
+"""
+
+import re
+from typing import List, Dict, Optional, Iterable, Tuple
+
+
+# Esquema de campos:
+#   rotulo:         texto (regex) que identifica la celda del rótulo
+#   tag_rotulo:     tag que debe tener el rótulo (None = cualquiera)
+#   tag_valor:      tag que debe tener la celda del valor
+#   desplazamiento: posición del valor respecto del rótulo (0 = el propio rótulo)
+ESQUEMA_CAMPOS = {
+    'homenajeada':   {'rotulo': r'Homenajeada/o/os:', 'tag_rotulo': None, 'tag_valor': 'td', 'desplazamiento': 1},
+    'codigo_evento': {'rotulo': r'Codigo de Evento', 'tag_rotulo': None, 'tag_valor': 'td', 'desplazamiento': 1},
+    'tipo_evento':   {'rotulo': r'Tipo de Evento', 'tag_rotulo': None, 'tag_valor': 'td', 'desplazamiento': 1},
+    'fecha_evento':  {'rotulo': r'Fecha del Evento', 'tag_rotulo': None, 'tag_valor': 'td', 'desplazamiento': 1},
+    'salon':         {'rotulo': r'Salon', 'tag_rotulo': 'td', 'tag_valor': 'td', 'desplazamiento': 1},
+    'cliente':       {'rotulo': r'Cliente', 'tag_rotulo': 'td', 'tag_valor': 'td', 'desplazamiento': 1},
+    'horario':       {'rotulo': r'Horario', 'tag_rotulo': 'td', 'tag_valor': 'td', 'desplazamiento': 1},
+    'tipo_pack':     {'rotulo': r'Pack [12]', 'tag_rotulo': 'td', 'tag_valor': 'td', 'desplazamiento': 0},
+}
+
+
+def _compilar_esquema(esquema: Dict[str, Dict]) -> re.Pattern:
+    """Une los rótulos del esquema en una única regex con un grupo por campo"""
+    return re.compile('|'.join(
+        f"(?P<{campo}>{definicion['rotulo']})" for campo, definicion in esquema.items()
+    ))
+
+
+# Compilado una sola vez al importar el módulo
+PATRON_ROTULOS = _compilar_esquema(ESQUEMA_CAMPOS)
+
+
+def extraer_campos(elementos: List[Dict[str, str]],
+                   campos: Optional[Iterable[str]] = None) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Completa los campos del esquema recorriendo los elementos una sola vez
+    
+    Args:
+        elementos: Lista de {'tag', 'texto'} en orden de documento
+        campos: Campos a buscar (por defecto todos los del esquema)
+    
+    Returns:
+        (valores, faltantes): campo -> valor encontrado y lista de campos sin encontrar
+    """
+    campos = list(campos) if campos is not None else list(ESQUEMA_CAMPOS)
+    pendientes = set(campos)
+    valores = {}
+    
+    for i, elemento in enumerate(elementos):
+        if not pendientes:
+            break
+        
+        for coincidencia in PATRON_ROTULOS.finditer(elemento['texto']):
+            campo = coincidencia.lastgroup
+            if campo not in pendientes:
+                continue
+            
+            definicion = ESQUEMA_CAMPOS[campo]
+            if definicion['tag_rotulo'] and elemento['tag'] != definicion['tag_rotulo']:
+                continue
+            
+            posicion = i + definicion['desplazamiento']
+            if posicion >= len(elementos):
+                continue
+            
+            valor = elementos[posicion]
+            if valor['texto'] and valor['tag'] == definicion['tag_valor']:
+                valores[campo] = valor['texto']
+                pendientes.discard(campo)
+    
+    faltantes = [campo for campo in campos if campo not in valores]
+    return valores, faltantes
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Checkpoint de Extracción - RPA Jano's Eventos
+==============================================
+Diario append-only (JSONL) con cada fecha completada y sus eventos. Si la
+extracción se corta, la corrida siguiente con --resume retoma desde el
+último checkpoint en lugar de volver a recorrer todo el calendario
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+class CheckpointExtraccion:
+    """
+    Diario de fechas completadas de una extracción
+    """
+    
+    def __init__(self, reanudar: bool = False, path: Optional[Path] = None):
+        """
+        Abre el diario
+        
+        Args:
+            reanudar: Cargar las fechas completadas de la corrida interrumpida
+                      (si es False el diario anterior se descarta)
+            path: Archivo JSONL (por defecto config.checkpoint_path)
+        """
+        self.path = Path(path) if path else config.checkpoint_path
+        self.completadas: Dict[str, List[Dict]] = {}
+        self.reanudadas = 0
+        self._lock = threading.Lock()
+        
+        if reanudar:
+            self._cargar()
+        
+        modo = 'a' if reanudar else 'w'
+        self._archivo = open(self.path, modo, encoding='utf-8')
+        self._escribir({'tipo': 'inicio', 'reanudada': reanudar, 'timestamp': datetime.now().isoformat()})
+    
+    def _cargar(self):
+        """Lee las fechas completadas del diario existente"""
+        if not self.path.exists():
+            logger.warning("⚠️ No hay checkpoint para reanudar, se extrae desde el inicio")
+            return
+        
+        with open(self.path, encoding='utf-8') as f:
+            for numero, linea in enumerate(f, 1):
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Última línea a medio escribir si el proceso murió
+                    logger.debug(f"Línea {numero} del checkpoint incompleta, se ignora")
+                    continue
+                
+                if registro.get('tipo') == 'fecha':
+                    self.completadas[registro['clave']] = registro['eventos']
+        
+        total_eventos = sum(len(eventos) for eventos in self.completadas.values())
+        logger.info(f"⏯️ Reanudando: {len(self.completadas)} fechas y {total_eventos} eventos del checkpoint")
+    
+    def _escribir(self, registro: Dict):
+        """Agrega un registro al diario y lo fuerza a disco"""
+        linea = json.dumps(registro, ensure_ascii=False)
+        with self._lock:
+            self._archivo.write(linea + '\n')
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+    
+    def eventos_completados(self, clave: str) -> Optional[List[Dict]]:
+        """
+        Eventos de una fecha ya completada en la corrida interrumpida
+        
+        Args:
+            clave: Identificador de la fecha
+        
+        Returns:
+            Eventos de la fecha o None si hay que procesarla
+        """
+        eventos = self.completadas.get(clave)
+        if eventos is not None:
+            with self._lock:
+                self.reanudadas += 1
+        return eventos
+    
+    def registrar(self, clave: str, eventos: List[Dict]):
+        """
+        Registra una fecha completada
+        
+        Args:
+            clave: Identificador de la fecha
+            eventos: Eventos extraídos de la fecha
+        """
+        self._escribir({'tipo': 'fecha', 'clave': clave, 'eventos': eventos})
+    
+    def cerrar(self):
+        """Cierra el archivo del diario"""
+        with self._lock:
+            if not self._archivo.closed:
+                self._archivo.close()
+    
+    def finalizar(self):
+        """Elimina el diario cuando la extracción terminó y el CSV quedó guardado"""
+        self.cerrar()
+        try:
+            self.path.unlink()
+            logger.debug("Checkpoint de extracción eliminado")
+        except FileNotFoundError:
+            pass
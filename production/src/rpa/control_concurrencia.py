@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Control de Concurrencia - RPA Jano's Eventos
+=============================================
+Ajusta cuántas sesiones (o descargas HTTP) trabajan a la vez contra Janos
+con un esquema AIMD: suma una mientras la latencia y los errores se
+mantienen, y divide el límite cuando la latencia se dispara o aparecen
+errores/timeouts. Incluye un limitador de tasa por token bucket que
+reemplaza las pausas fijas entre pedidos
+"""
+
+import time
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+class LimiteTasa:
+    """
+    Token bucket: como máximo `tasa` pedidos por segundo con ráfagas de
+    hasta `rafaga` pedidos
+    """
+    
+    def __init__(self, tasa: Optional[float] = None, rafaga: Optional[int] = None):
+        """
+        Inicializa el limitador
+        
+        Args:
+            tasa: Pedidos por segundo (0 = sin límite, por defecto config.rate_limit_per_second)
+            rafaga: Capacidad del balde (por defecto config.rate_limit_burst)
+        """
+        self.tasa = config.rate_limit_per_second if tasa is None else tasa
+        self.rafaga = max(1, rafaga or config.rate_limit_burst)
+        self.tokens = float(self.rafaga)
+        self.ultimo = time.monotonic()
+        self.pedidos = 0
+        self.espera_total = 0.0
+        self._lock = threading.Lock()
+    
+    def tomar(self):
+        """Bloquea hasta que haya un token disponible y lo consume"""
+        if self.tasa <= 0:
+            with self._lock:
+                self.pedidos += 1
+            return
+        
+        inicio = time.monotonic()
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                self.tokens = min(self.rafaga, self.tokens + (ahora - self.ultimo) * self.tasa)
+                self.ultimo = ahora
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.pedidos += 1
+                    self.espera_total += ahora - inicio
+                    return
+                
+                faltante = (1 - self.tokens) / self.tasa
+            
+            time.sleep(faltante)
+    
+    def resumen(self) -> Dict:
+        """Tasa configurada y tiempo total esperado por el límite"""
+        return {
+            'tasa_por_segundo': self.tasa,
+            'rafaga': self.rafaga,
+            'pedidos': self.pedidos,
+            'espera_total': round(self.espera_total, 3)
+        }
+
+
+class ControlConcurrencia:
+    """
+    Límite de concurrencia AIMD según latencia y tasa de errores
+    """
+    
+    def __init__(self, maximo: int, minimo: Optional[int] = None, nombre: str = "sesiones"):
+        """
+        Inicializa el controlador
+        
+        Args:
+            maximo: Tope de trabajos simultáneos (sesiones abiertas o conexiones)
+            minimo: Piso del límite (por defecto config.concurrency_min)
+            nombre: Nombre para los logs
+        """
+        self.maximo = max(1, maximo)
+        self.minimo = min(self.maximo, max(1, minimo or config.concurrency_min))
+        self.nombre = nombre
+        self.limite = max(self.minimo, self.maximo // 2)
+        self.activos = 0
+        self.ventana = max(1, config.concurrency_window)
+        self.factor_latencia = config.concurrency_latency_factor
+        self.tasa_error_maxima = config.concurrency_max_error_rate
+        self.suavizado_base = config.concurrency_baseline_alpha
+        
+        self.latencia_base: Optional[float] = None
+        self.observaciones: List[tuple] = []
+        self.aumentos = 0
+        self.reducciones = 0
+        self.total_observaciones = 0
+        self.total_errores = 0
+        self.historial: List[int] = [self.limite]
+        self._condicion = threading.Condition()
+    
+    @contextmanager
+    def permiso(self):
+        """
+        Ocupa un lugar dentro del límite actual mientras dura el bloque;
+        si el límite está completo espera a que se libere uno
+        """
+        with self._condicion:
+            while self.activos >= self.limite:
+                self._condicion.wait()
+            self.activos += 1
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self.activos -= 1
+                self._condicion.notify_all()
+    
+    def registrar(self, latencia: float, error: bool = False):
+        """
+        Registra el resultado de un trabajo y ajusta el límite al cerrar la ventana
+        
+        Args:
+            latencia: Duración por página cargada en segundos
+            error: True si terminó con error o timeout
+        """
+        with self._condicion:
+            self.total_observaciones += 1
+            if error:
+                self.total_errores += 1
+            self.observaciones.append((latencia, error))
+            if len(self.observaciones) >= self.ventana:
+                self._ajustar()
+    
+    def _ajustar(self):
+        """Aumento aditivo / reducción multiplicativa (con el lock tomado)"""
+        latencias = [latencia for latencia, error in self.observaciones if not error]
+        errores = sum(1 for _, error in self.observaciones if error)
+        tasa_error = errores / len(self.observaciones)
+        self.observaciones = []
+        
+        latencia = sum(latencias) / len(latencias) if latencias else None
+        if latencia is not None and self.latencia_base is None:
+            self.latencia_base = latencia
+        
+        saturado = (
+            tasa_error > self.tasa_error_maxima
+            or latencia is None
+            or latencia > self.latencia_base * self.factor_latencia
+        )
+        
+        # Base con media móvil exponencial: una ventana muy rápida (o muy lenta)
+        # no la fija para el resto de la corrida
+        if latencia is not None:
+            self.latencia_base += self.suavizado_base * (latencia - self.latencia_base)
+        
+        anterior = self.limite
+        if saturado:
+            self.limite = max(self.minimo, self.limite // 2)
+            if self.limite < anterior:
+                self.reducciones += 1
+        else:
+            self.limite = min(self.maximo, self.limite + 1)
+            if self.limite > anterior:
+                self.aumentos += 1
+        
+        if self.limite != anterior:
+            self.historial.append(self.limite)
+            latencia_texto = f"{latencia:.2f}s" if latencia is not None else "-"
+            logger.info(
+                f"🎚️ Concurrencia de {self.nombre}: {anterior} → {self.limite} "
+                f"(latencia {latencia_texto}, errores {tasa_error:.0%})"
+            )
+            self._condicion.notify_all()
+    
+    def resumen(self) -> Dict:
+        """Límite actual, cotas y ajustes realizados"""
+        with self._condicion:
+            return {
+                'nombre': self.nombre,
+                'limite_actual': self.limite,
+                'minimo': self.minimo,
+                'maximo': self.maximo,
+                'aumentos': self.aumentos,
+                'reducciones': self.reducciones,
+                'observaciones': self.total_observaciones,
+                'errores': self.total_errores,
+                'latencia_base': round(self.latencia_base, 3) if self.latencia_base is not None else None,
+                'historial': list(self.historial)
+            }
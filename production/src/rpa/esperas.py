@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de Esperas - RPA Jano's Eventos
+======================================
+Reemplaza los time.sleep fijos por esperas condicionadas al estado real
+de la página y registra cuánto tardó cada espera
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+# Selectores de los estados de página que se esperan
+SELECTOR_MODAL = (By.CSS_SELECTOR, "div.modal-content, div.eventos-lista")
+SELECTOR_CALENDARIO = (By.CSS_SELECTOR, "div.boton")
+SELECTOR_MENU_LATERAL = (By.CSS_SELECTOR, "#sideMenu a")
+SELECTOR_MAIN_FRAME = (By.ID, "mainFrame")
+
+
+class MotorEsperas:
+    """
+    Esperas por condición con métricas de duración
+    """
+    
+    def __init__(self, driver, timeout: Optional[int] = None, poll_frequency: float = 0.2):
+        """
+        Inicializa el motor
+        
+        Args:
+            driver: Driver de Selenium
+            timeout: Timeout por defecto en segundos (config.browser_timeout)
+            poll_frequency: Intervalo de sondeo en segundos
+        """
+        self.driver = driver
+        self.timeout = timeout or config.browser_timeout
+        self.poll_frequency = poll_frequency
+        self.tiempos: Dict[str, Dict] = {}
+    
+    def _registrar(self, nombre: str, duracion: float, timeout: bool):
+        """Acumula la duración de una espera"""
+        registro = self.tiempos.setdefault(nombre, {
+            'cantidad': 0,
+            'total': 0.0,
+            'maximo': 0.0,
+            'timeouts': 0
+        })
+        registro['cantidad'] += 1
+        registro['total'] += duracion
+        registro['maximo'] = max(registro['maximo'], duracion)
+        if timeout:
+            registro['timeouts'] += 1
+    
+    def hasta(self, nombre: str, condicion: Callable, timeout: Optional[float] = None,
+              obligatoria: bool = True):
+        """
+        Espera hasta que se cumpla una condición
+        
+        Args:
+            nombre: Nombre de la espera (clave de las métricas)
+            condicion: Condición de Selenium (expected_conditions o callable)
+            timeout: Timeout en segundos (por defecto el del motor)
+            obligatoria: Si es False, un timeout devuelve None en vez de propagarse
+        
+        Returns:
+            Resultado de la condición
+        """
+        inicio = time.time()
+        try:
+            resultado = WebDriverWait(
+                self.driver,
+                timeout or self.timeout,
+                poll_frequency=self.poll_frequency
+            ).until(condicion)
+            self._registrar(nombre, time.time() - inicio, timeout=False)
+            return resultado
+        
+        except TimeoutException:
+            duracion = time.time() - inicio
+            self._registrar(nombre, duracion, timeout=True)
+            if obligatoria:
+                raise
+            logger.debug(f"⏱️ Espera '{nombre}' sin cumplirse tras {duracion:.2f}s")
+            return None
+    
+    # ====== Estados de página de Janos ======
+    
+    def documento_listo(self, nombre: str = "documento_listo"):
+        """Espera a que el documento actual termine de cargar"""
+        return self.hasta(
+            nombre,
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    
+    def menu_lateral_abierto(self):
+        """Espera a que los enlaces del menú lateral sean visibles"""
+        return self.hasta("menu_lateral", EC.visibility_of_element_located(SELECTOR_MENU_LATERAL))
+    
+    def main_frame(self):
+        """Espera a que mainFrame esté disponible y cambia a él"""
+        resultado = self.hasta("main_frame", EC.frame_to_be_available_and_switch_to_it(SELECTOR_MAIN_FRAME))
+        self.documento_listo("main_frame_documento")
+        return resultado
+    
+    def calendario_redibujado(self, referencia=None):
+        """
+        Espera a que el calendario se redibuje tras Filtrar
+        
+        Args:
+            referencia: Elemento de la página anterior; se espera que quede stale
+        """
+        if referencia is not None:
+            # Tope corto: si el filtro no recarga el frame no se pierde el timeout completo
+            self.hasta("calendario_recarga", EC.staleness_of(referencia), timeout=5, obligatoria=False)
+        self.documento_listo("calendario_documento")
+        return self.hasta(
+            "calendario_redibujado",
+            EC.presence_of_all_elements_located(SELECTOR_CALENDARIO),
+            obligatoria=False
+        )
+    
+    def modal_visible(self, timeout: Optional[float] = None):
+        """Espera a que se muestre el modal/lista de eventos de una fecha"""
+        return self.hasta("modal_visible", EC.visibility_of_element_located(SELECTOR_MODAL), timeout=timeout)
+    
+    def modal_oculto(self):
+        """Espera a que se cierre el modal de eventos"""
+        return self.hasta("modal_oculto", EC.invisibility_of_element_located(SELECTOR_MODAL), obligatoria=False)
+    
+    # ====== Métricas ======
+    
+    def resumen(self) -> Dict[str, Dict]:
+        """
+        Retorna las métricas de cada espera
+        
+        Returns:
+            Diccionario nombre -> {cantidad, total, promedio, maximo, timeouts}
+        """
+        return {
+            nombre: dict(
+                registro,
+                total=round(registro['total'], 3),
+                maximo=round(registro['maximo'], 3),
+                promedio=round(registro['total'] / registro['cantidad'], 3)
+            )
+            for nombre, registro in self.tiempos.items()
+        }
@@ -9,10 +9,13 @@ Versión de producción con manejo robusto de errores y logging profesional
 
 import time
 import re
-import pandas as pd
+import itertools
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -23,7 +26,6 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import (
     NoSuchElementException, 
     TimeoutException, 
-    StaleElementReferenceException,
     WebDriverException
 )
 
@@ -32,6 +34,25 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.config import config
 from utils.logger import logger
+from utils.telefonos import extraer_celulares
+from utils.filtros_extraccion import (
+    CAMPOS_FILTRO, cargar_especificacion, requiere_opciones,
+    expandir_combinaciones, es_matriz, clave_particion
+)
+from rpa.sesion_cache import SesionCache, sesion_activa, sesion_vencida_en_frame
+from rpa.esperas import MotorEsperas, SELECTOR_MODAL
+from rpa.huellas_calendario import HuellasCalendario, calcular_huella
+from rpa.checkpoint import CheckpointExtraccion
+from rpa.selectores import (
+    ResolutorSelectores, SELECTOR_CERRAR_MODAL, SELECTOR_ITEMS_EVENTO, sin_espera_implicita
+)
+from rpa.control_concurrencia import ControlConcurrencia, LimiteTasa
+from rpa.pestanas import LectorPestanas, enlaces_evento
+from rpa.calendario import leer_calendario
+from rpa.salida_csv import SalidaCSV, guardar_eventos_csv
+from rpa.perfil_navegador import (
+    aplicar_perfil_scraping, bloquear_recursos, medir_navegacion, resumir_navegaciones
+)
 
 
 class ExtractorEventos:
@@ -40,15 +61,72 @@ class ExtractorEventos:
     Implementa RPA para extracción automatizada de eventos
     """
     
-    def __init__(self):
-        """Inicializa el extractor"""
+    def __init__(self, worker_id: Optional[int] = None, driver: Optional[webdriver.Chrome] = None,
+                 refresco_completo: bool = False, filtro: Optional[Dict[str, str]] = None,
+                 reanudar: bool = False, pool=None):
+        """
+        Inicializa el extractor
+        
+        Args:
+            worker_id: Identificador del worker cuando corre dentro del pool
+                       de extracción paralela (None para el extractor principal)
+            driver: Navegador prestado por el pool de navegadores; no se
+                    cierra al terminar la extracción
+            refresco_completo: Releer todas las fechas aunque no hayan cambiado
+            filtro: Combinación {salon, zona, ano} a extraer (por defecto la
+                    de la especificación de filtros)
+            reanudar: Retomar desde el checkpoint de una corrida interrumpida
+            pool: Pool de navegadores de Janos; el extractor y sus workers
+                  toman de él sus navegadores en lugar de abrir Chrome
+        """
         self.driver = None
+        self.driver_prestado = driver
+        self.pool = pool
+        self.navegador_pool = None
+        self.paginas_navegadas = 0
+        self._paginas_al_tomar = 0
         self.wait = None
+        self.esperas = None
         self.eventos_extraidos = []
         self.start_time = None
         self.errores = []
+        self.worker_id = worker_id
+        self.estadisticas_workers = []
+        self.navegaciones = []
+        self.filtro = filtro
+        self.filtro_activo = {}
+        self.filtros = ""
+        self.particiones = []
+        self.reanudar = reanudar
+        self.checkpoint = None
+        self.salida = None
+        self.relogins = 0
+        self.fechas_procesadas = 0
+        # Páginas/ítems de eventos leídos en la última fecha (0 si se reutilizó)
+        self.cargas_fecha = 0
+        
+        # Límite de tasa compartido por todas las sesiones; el control de
+        # concurrencia se crea al abrir sesiones en paralelo
+        self.limite_tasa = LimiteTasa() if worker_id is None else None
+        self.concurrencia = None
+        self.pestanas = None
+        
+        # Los workers del pool no comparten la caché: cada uno necesita su
+        # propia sesión PHP para no serializarse en el servidor
+        self.sesion_cache = SesionCache() if worker_id is None else None
         
-        logger.info("🎯 Inicializando Extractor de Eventos")
+        # Los workers reciben el almacén de huellas del extractor principal
+        self.huellas = None
+        if worker_id is None and config.incremental_enabled:
+            self.huellas = HuellasCalendario(refresco_completo=refresco_completo)
+        
+        # Métricas de selectores compartidas con los workers
+        self.selectores = ResolutorSelectores()
+        
+        if worker_id is None:
+            logger.info("🎯 Inicializando Extractor de Eventos")
+        else:
+            logger.debug(f"🎯 Inicializando worker de extracción #{worker_id}")
         
         # Validar configuración
         is_valid, errors = config.validate()
@@ -86,6 +164,9 @@ class ExtractorEventos:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Perfil liviano: sin imágenes y con la estrategia de carga configurada
+        aplicar_perfil_scraping(options)
+        
         try:
             service = Service()
             driver = webdriver.Chrome(service=service, options=options)
@@ -95,6 +176,9 @@ class ExtractorEventos:
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
             
+            # Bloquear fuentes, analytics y demás recursos configurados
+            bloquear_recursos(driver)
+            
             # Configurar timeouts
             driver.set_page_load_timeout(config.browser_timeout)
             driver.implicitly_wait(config.implicit_wait)
@@ -106,6 +190,30 @@ class ExtractorEventos:
             logger.exception(f"❌ Error configurando driver: {e}")
             raise
     
+    def _medir_navegacion(self, etiqueta: str):
+        """
+        Registra tiempo de carga y bytes transferidos de la página actual
+        
+        Args:
+            etiqueta: Nombre del paso de navegación
+        """
+        self.paginas_navegadas += 1
+        metricas = medir_navegacion(self.driver, etiqueta)
+        if metricas:
+            self.navegaciones.append(metricas)
+    
+    def _resumen_navegaciones(self) -> Dict:
+        """Totales de las navegaciones medidas (incluidas las de los workers)"""
+        navegaciones = list(self.navegaciones)
+        for estadisticas in self.estadisticas_workers + self.particiones:
+            navegaciones.extend(estadisticas.get('navegaciones') or [])
+        
+        eventos = [n for n in navegaciones if n['etiqueta'] == 'evento']
+        resumen = resumir_navegaciones(navegaciones)
+        resumen['eventos'] = resumir_navegaciones(eventos)
+        resumen['detalle'] = [n for n in navegaciones if n['etiqueta'] != 'evento']
+        return resumen
+    
     def _login(self) -> bool:
         """
         Realiza login en el sistema Janos
@@ -115,16 +223,22 @@ class ExtractorEventos:
         """
         logger.log_rpa_start("Login")
         
+        # Reutilizar la sesión guardada si sigue activa
+        if self.sesion_cache and self.sesion_cache.restaurar(self.driver):
+            logger.log_rpa_end("Login (sesión en caché)", success=True)
+            return True
+        
         try:
             # Navegar a la página de login
             logger.log_browser_action("Navegando a página de login")
             self.driver.get(config.url_origen)
-            time.sleep(3)
+            self.paginas_navegadas += 1
             
             # Ingresar usuario
             logger.log_browser_action("Ingresando usuario")
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
+            username_field = self.esperas.hasta(
+                "login_formulario",
+                EC.visibility_of_element_located((By.NAME, "username"))
             )
             username_field.clear()
             username_field.send_keys(config.user_origen)
@@ -143,8 +257,13 @@ class ExtractorEventos:
             login_button.click()
             
             # Esperar redirección
-            self.wait.until(lambda d: "login.php" not in d.current_url)
+            self.esperas.hasta("login_redireccion", lambda d: "login.php" not in d.current_url)
+            self.esperas.documento_listo("login_documento")
+            
+            if self.sesion_cache:
+                self.sesion_cache.guardar(self.driver)
             
+            self._medir_navegacion("login")
             logger.log_rpa_end("Login", success=True)
             return True
             
@@ -169,7 +288,7 @@ class ExtractorEventos:
                 EC.element_to_be_clickable((By.XPATH, "//*[@onclick='openNav()']"))
             )
             open_nav.click()
-            time.sleep(2)
+            self.esperas.menu_lateral_abierto()
             
             # Encontrar y hacer click en Adicionales
             logger.log_browser_action("Buscando enlace Adicionales")
@@ -180,15 +299,12 @@ class ExtractorEventos:
                 if "adicionales" in enlace.text.lower():
                     logger.log_browser_action("Click en Adicionales")
                     enlace.click()
-                    time.sleep(5)
                     break
             
-            # Cambiar al frame principal
+            # Cambiar al frame principal cuando esté cargado
             logger.log_browser_action("Cambiando a mainFrame")
-            main_frame = self.wait.until(
-                EC.presence_of_element_located((By.ID, "mainFrame"))
-            )
-            self.driver.switch_to.frame(main_frame)
+            self.esperas.main_frame()
+            self._medir_navegacion("adicionales")
             
             logger.log_rpa_end("Navegación a Adicionales", success=True)
             return True
@@ -229,13 +345,17 @@ class ExtractorEventos:
             logger.log_browser_action("Aplicando filtro Año", ano)
             ano_select = Select(self.driver.find_element(By.ID, "ano"))
             ano_select.select_by_visible_text(ano)
+            self.filtro_activo = {'salon': salon, 'zona': zona, 'ano': ano}
+            self.filtros = f"{salon}/{zona}/{ano}"
             
             # Hacer click en Filtrar
             logger.log_browser_action("Ejecutando filtro")
             filtrar_buttons = self.driver.find_elements(By.XPATH, "//input[@value='Filtrar']")
             if filtrar_buttons:
+                pagina_anterior = self.driver.find_element(By.TAG_NAME, "html")
                 filtrar_buttons[0].click()
-                time.sleep(5)
+                self.esperas.calendario_redibujado(pagina_anterior)
+                self._medir_navegacion("filtros")
             
             logger.log_rpa_end("Aplicación de filtros", success=True)
             return True
@@ -255,37 +375,15 @@ class ExtractorEventos:
         logger.log_rpa_start("Obtención de fechas con eventos")
         
         try:
-            # Buscar fechas coral (con eventos)
-            fechas_coral = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                "div.boton[style*='background: coral']"
+            # Un solo recorrido del calendario: días coral (con eventos) con su mes
+            fechas_info = leer_calendario(
+                self.driver,
+                ano=self.filtro_activo.get('ano'),
+                color='coral',
+                selector_dias="div.boton"
             )
             
-            if not fechas_coral:
-                # Búsqueda alternativa
-                logger.debug("Búsqueda alternativa de fechas con color")
-                todas_fechas = self.driver.find_elements(By.CSS_SELECTOR, "div.boton")
-                fechas_coral = [
-                    f for f in todas_fechas 
-                    if f.text.strip().isdigit() and f.is_displayed() and 
-                    'background:' in f.get_attribute('style')
-                ]
-            
-            logger.info(f"📅 Encontradas {len(fechas_coral)} fechas con eventos")
-            
-            # Extraer información
-            fechas_info = []
-            for i, fecha in enumerate(fechas_coral):
-                try:
-                    fecha_texto = fecha.text.strip()
-                    fechas_info.append({
-                        'indice': i,
-                        'fecha': fecha_texto,
-                        'elemento': fecha
-                    })
-                except StaleElementReferenceException:
-                    logger.warning(f"⚠️ Elemento stale para fecha {i}")
-                    continue
+            logger.info(f"📅 Encontradas {len(fechas_info)} fechas con eventos")
             
             logger.log_rpa_end("Obtención de fechas con eventos", success=True)
             return fechas_info
@@ -309,39 +407,81 @@ class ExtractorEventos:
         logger.info(f"📆 Procesando fecha: {fecha_texto}")
         
         eventos_fecha = []
+        self.cargas_fecha = 0
         
         try:
             # Hacer click en la fecha
             fecha_info['elemento'].click()
-            time.sleep(3)
+            self.paginas_navegadas += 1
             
             # Verificar si hay eventos
             try:
-                # Buscar lista de eventos
-                eventos_lista = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.modal-content, div.eventos-lista"))
-                )
+                # Esperar a que se muestre la lista de eventos
+                self.esperas.modal_visible()
                 
-                # Buscar todos los eventos de la fecha
-                items_eventos = self.driver.find_elements(By.CSS_SELECTOR, "div.evento-item, tr.evento")
+                # Extracción incremental: si la lista no cambió se reutilizan los eventos
+                clave, huella = self._huella_fecha(fecha_info)
+                eventos_previos = self.huellas.eventos_sin_cambios(clave, huella) if self.huellas else None
                 
-                logger.info(f"   Encontrados {len(items_eventos)} eventos")
-                
-                for idx, item in enumerate(items_eventos):
-                    try:
-                        evento_datos = self._extraer_datos_evento(item, fecha_texto)
-                        if evento_datos:
-                            eventos_fecha.append(evento_datos)
-                            logger.debug(f"   ✓ Evento {idx+1} extraído")
-                    except Exception as e:
-                        logger.warning(f"   ⚠️ Error extrayendo evento {idx+1}: {e}")
-                        continue
+                if eventos_previos is not None:
+                    logger.info(f"   ⏭️ Sin cambios ({len(eventos_previos)} eventos de la corrida anterior)")
+                    # Los eventos se vuelven a publicar con la fecha de esta extracción
+                    fecha_extraccion = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    eventos_fecha = [dict(evento, fecha_extraccion=fecha_extraccion) for evento in eventos_previos]
+                else:
+                    enlaces = enlaces_evento(self.driver, fecha_texto) if config.tab_batch_enabled else []
+                    
+                    if enlaces:
+                        # Modo por pestañas: las páginas de los eventos se cargan en paralelo
+                        eventos_fecha, fallidos = self._leer_eventos_en_pestanas(enlaces)
+                    else:
+                        # Todos los ítems en una sola llamada al navegador
+                        lote = self.selectores.campos_lote(self.driver)
+                        fallidos = 0
+                        
+                        if lote is not None:
+                            logger.info(f"   Encontrados {len(lote)} eventos")
+                            for idx, item in enumerate(lote):
+                                evento_datos = self._armar_evento(item['campos'], item['html'], fecha_texto)
+                                if evento_datos:
+                                    eventos_fecha.append(evento_datos)
+                                    logger.debug(f"   ✓ Evento {idx+1} extraído")
+                        else:
+                            # Respaldo: buscar todos los eventos de la fecha elemento por elemento
+                            items_eventos = self.driver.find_elements(By.CSS_SELECTOR, SELECTOR_ITEMS_EVENTO)
+                            
+                            logger.info(f"   Encontrados {len(items_eventos)} eventos")
+                            
+                            # Los ítems ya están cargados: los campos faltantes fallan sin esperar
+                            with sin_espera_implicita(self.driver):
+                                for idx, item in enumerate(items_eventos):
+                                    try:
+                                        evento_datos = self._extraer_datos_evento(item, fecha_texto)
+                                        if evento_datos:
+                                            eventos_fecha.append(evento_datos)
+                                            logger.debug(f"   ✓ Evento {idx+1} extraído")
+                                    except Exception as e:
+                                        logger.warning(f"   ⚠️ Error extrayendo evento {idx+1}: {e}")
+                                        fallidos += 1
+                                        continue
+                    
+                    # Páginas (pestañas) o ítems leídos: la latencia se reparte entre ellos
+                    self.cargas_fecha = max(1, len(enlaces) or len(eventos_fecha) + fallidos)
+                    
+                    # Un mismo código puede aparecer en varios ítems de la lista
+                    eventos_fecha = self._deduplicar_eventos(eventos_fecha)
+                    
+                    # Solo se guarda la huella de las fechas leídas sin errores
+                    if self.huellas and not fallidos:
+                        self.huellas.registrar(clave, huella, eventos_fecha)
                 
                 # Cerrar modal si existe
                 try:
-                    cerrar_btn = self.driver.find_element(By.CSS_SELECTOR, ".close, .cerrar, button.close")
-                    cerrar_btn.click()
-                    time.sleep(1)
+                    with sin_espera_implicita(self.driver):
+                        cerrar_btn = self.selectores.primero(self.driver, SELECTOR_CERRAR_MODAL)
+                    if cerrar_btn is not None:
+                        cerrar_btn.click()
+                        self.esperas.modal_oculto()
                 except:
                     pass
                     
@@ -354,6 +494,134 @@ class ExtractorEventos:
         
         return eventos_fecha
     
+    @staticmethod
+    def _deduplicar_eventos(eventos: List[Dict]) -> List[Dict]:
+        """
+        Une los eventos repetidos de una fecha por codigo_evento, completando
+        cada campo con el primer valor no vacío
+        
+        Args:
+            eventos: Eventos extraídos de la fecha
+        
+        Returns:
+            Un evento por código distinto (los que no tienen código se conservan)
+        """
+        unicos = {}
+        resultado = []
+        for evento in eventos:
+            codigo = evento.get('codigo_evento')
+            if not codigo:
+                resultado.append(evento)
+            elif codigo not in unicos:
+                unicos[codigo] = dict(evento)
+                resultado.append(unicos[codigo])
+            else:
+                existente = unicos[codigo]
+                for campo, valor in evento.items():
+                    if valor and not existente.get(campo):
+                        existente[campo] = valor
+        
+        if len(resultado) < len(eventos):
+            logger.debug(f"   {len(eventos) - len(resultado)} ítems repetidos unidos por código")
+        return resultado
+    
+    def _leer_eventos_en_pestanas(self, enlaces: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        Lee las páginas ver_evento.php de una fecha en pestañas del mismo
+        navegador; la pestaña del calendario (con la lista abierta) no se mueve
+        
+        Args:
+            enlaces: Enlaces de la lista de eventos de la fecha
+        
+        Returns:
+            (eventos, pestañas fallidas)
+        """
+        logger.info(f"   Encontrados {len(enlaces)} eventos (lectura en pestañas)")
+        
+        if self.pestanas is None:
+            self.pestanas = LectorPestanas(self.driver, esperas=self.esperas)
+        
+        for enlace in enlaces:
+            enlace['salon'] = self.filtro_activo.get('salon', '')
+        
+        fallidas_previas = self.pestanas.fallidas
+        abiertas_previas = self.pestanas.abiertas
+        medidas_previas = len(self.pestanas.navegaciones)
+        try:
+            resultados = self.pestanas.leer(enlaces)
+        finally:
+            # Cada pestaña es una página más que cargó el navegador
+            self.paginas_navegadas += self.pestanas.abiertas - abiertas_previas
+            self.navegaciones.extend(self.pestanas.navegaciones[medidas_previas:])
+            # Al volver a la pestaña del calendario hay que reingresar a mainFrame
+            self.esperas.main_frame()
+        
+        return [datos for datos in resultados if datos], self.pestanas.fallidas - fallidas_previas
+    
+    def _clave_fecha(self, fecha_info: Dict) -> str:
+        """Identificador estable de una fecha: filtros + fecha + celda del calendario
+        (sin la posición en la lista, que cambia cuando aparece una fecha anterior)"""
+        return f"{self.filtros}|{fecha_info['fecha']}|{fecha_info.get('identificador', '')}"
+    
+    def _huella_fecha(self, fecha_info: Dict) -> Tuple[str, Optional[Dict]]:
+        """
+        Calcula la clave y la huella de la fecha con la lista de eventos abierta
+        
+        Args:
+            fecha_info: Diccionario con información de la fecha
+        
+        Returns:
+            (clave, huella) de la fecha
+        """
+        clave = self._clave_fecha(fecha_info)
+        if not self.huellas:
+            return clave, None
+        
+        html = self.driver.execute_script(
+            "var m = document.querySelector(arguments[0]); return m ? m.innerHTML : '';",
+            SELECTOR_MODAL[1]
+        )
+        return clave, calcular_huella(html)
+    
+    def _armar_evento(self, campos: Dict[str, str], html: str, fecha: str) -> Optional[Dict]:
+        """
+        Arma el registro de un evento con los campos leídos de su ítem
+        
+        Args:
+            campos: Campo -> texto de los campos encontrados en el ítem
+            html: innerHTML del ítem (para los celulares)
+            fecha: Fecha del evento
+        
+        Returns:
+            Diccionario con datos del evento o None si no tiene código ni cliente
+        """
+        datos = {
+            'fecha_evento': fecha,
+            'cliente': '',
+            'homenajeada': '',
+            'tipo_evento': '',
+            'codigo_evento': '',
+            'salon': self.filtro_activo.get('salon', ''),
+            'horario': '',
+            'celular': '',
+            'celular_2': '',
+            'tipo_pack': '',
+            'fecha_extraccion': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        datos.update(campos)
+        
+        # Celulares junto a los rótulos "Celular" del ítem
+        celulares = extraer_celulares(html)
+        if celulares:
+            datos['celular'] = celulares[0]
+            datos['celular_2'] = celulares[1] if len(celulares) > 1 else ''
+        
+        # Validar que al menos tenga código o cliente
+        if datos['codigo_evento'] or datos['cliente']:
+            return datos
+        
+        return None
+    
     def _extraer_datos_evento(self, elemento, fecha: str) -> Optional[Dict]:
         """
         Extrae datos de un evento individual
@@ -366,62 +634,471 @@ class ExtractorEventos:
             Diccionario con datos del evento o None
         """
         try:
-            # Extraer campos según estructura HTML
-            # (Adaptar según la estructura real)
-            
-            datos = {
-                'fecha_evento': fecha,
-                'cliente': '',
-                'homenajeada': '',
-                'tipo_evento': '',
-                'codigo_evento': '',
-                'salon': '',
-                'horario': '',
-                'celular': '',
-                'celular_2': '',
-                'tipo_pack': '',
-                'fecha_extraccion': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            # Campos presentes en el ítem (los faltantes no esperan)
+            return self._armar_evento(
+                self.selectores.campos(elemento),
+                elemento.get_attribute('innerHTML') or '',
+                fecha
+            )
             
-            # Intentar extraer datos con diferentes selectores
+        except Exception as e:
+            logger.debug(f"Error extrayendo datos de evento: {e}")
+            return None
+    
+    def iniciar_sesion(self) -> bool:
+        """
+        Crea el driver (o toma el prestado) y deja la sesión de Janos iniciada
+        
+        Returns:
+            True si hay una sesión activa
+        """
+        if self.driver_prestado is None and self.pool is not None:
+            self._tomar_del_pool()
+        
+        self.driver = self.driver_prestado or self._configurar_driver()
+        self.wait = WebDriverWait(self.driver, config.browser_timeout)
+        self.esperas = MotorEsperas(self.driver)
+        
+        # Un navegador del pool ya viene logueado y parado en la página de inicio
+        if (self.driver_prestado is not None
+                and urlsplit(self.driver.current_url).netloc == urlsplit(config.url_origen).netloc
+                and sesion_activa(self.driver)):
+            logger.info("♻️ Usando navegador del pool con sesión activa")
+            return True
+        
+        return self._login()
+    
+    def _tomar_del_pool(self):
+        """Toma un navegador del pool (si no hay uno libre se abre Chrome)"""
+        self.navegador_pool = self.pool.tomar(timeout=config.browser_timeout)
+        if self.navegador_pool is None:
+            logger.warning("⚠️ Sin navegadores libres en el pool, se abre un Chrome propio")
+            return
+        self.driver_prestado = self.navegador_pool.driver
+        self._paginas_al_tomar = self.paginas_navegadas
+    
+    def _devolver_al_pool(self):
+        """Registra las páginas cargadas y devuelve el navegador al pool"""
+        navegador = self.navegador_pool
+        self.navegador_pool = None
+        self.driver_prestado = None
+        navegador.registrar_paginas(self.paginas_navegadas - self._paginas_al_tomar)
+        self.pool.devolver(navegador)
+    
+    def _preparar_sesion(self) -> bool:
+        """
+        Abre una sesión de navegador lista para recorrer el calendario:
+        driver, login, navegación a Adicionales y filtros
+        
+        Returns:
+            True si la sesión quedó lista
+        """
+        if not self.iniciar_sesion():
+            return False
+        
+        if not self._navegar_adicionales():
+            return False
+        
+        return self._aplicar_filtros(**self.filtro) if self.filtro else self._aplicar_filtros()
+    
+    def _restaurar_sesion(self, fechas: List[Dict]) -> bool:
+        """
+        Vuelve a hacer login tras el vencimiento de la sesión, restaura
+        Adicionales y los filtros activos, y actualiza los elementos de las
+        fechas (los anteriores quedaron stale)
+        
+        Args:
+            fechas: Fechas pendientes cuyos elementos se relocalizan
+        
+        Returns:
+            True si la sesión quedó lista para seguir con el calendario
+        """
+        self.relogins += 1
+        logger.warning(f"🔑 Sesión vencida, reingresando (reingreso #{self.relogins})")
+        
+        # Las cookies guardadas son las de la sesión vencida
+        if self.sesion_cache:
+            self.sesion_cache.invalidar()
+        
+        try:
+            self.driver.switch_to.default_content()
+        except WebDriverException:
+            pass
+        
+        if not self._login() or not self._navegar_adicionales():
+            return False
+        
+        filtro = self.filtro_activo or self.filtro
+        if not (self._aplicar_filtros(**filtro) if filtro else self._aplicar_filtros()):
+            return False
+        
+        # El calendario es el mismo: las fechas se relocalizan por índice
+        actuales = {f['indice']: f for f in self._obtener_fechas_con_eventos()}
+        for fecha_info in fechas:
+            actual = actuales.get(fecha_info['indice'])
+            if actual is None or actual['fecha'] != fecha_info['fecha']:
+                logger.warning(f"⚠️ Fecha {fecha_info['fecha']} no encontrada tras el reingreso")
+                continue
+            fecha_info['elemento'] = actual['elemento']
+        
+        logger.info("✅ Sesión restaurada, se continúa con la fecha interrumpida")
+        return True
+    
+    def _cerrar_driver(self):
+        """Cierra el driver si está abierto"""
+        if self.driver and self.driver is self.driver_prestado:
+            # El navegador vuelve al pool: solo se suelta la referencia
+            self.driver = None
+            if self.navegador_pool is not None:
+                self._devolver_al_pool()
+            return
+        
+        if self.driver:
             try:
-                datos['cliente'] = elemento.find_element(By.CSS_SELECTOR, ".cliente, .client-name").text.strip()
-            except:
-                pass
+                self.driver.quit()
+            except WebDriverException as e:
+                logger.debug(f"Error cerrando driver: {e}")
+            self.driver = None
+            logger.info("🔒 Driver cerrado")
+    
+    def _extraer_secuencial(self) -> bool:
+        """
+        Recorre todas las fechas con una única sesión de navegador
+        
+        Returns:
+            True si la extracción pudo ejecutarse
+        """
+        if not self._preparar_sesion():
+            return False
+        
+        # Obtener fechas con eventos
+        fechas = self._obtener_fechas_con_eventos()
+        if not fechas:
+            logger.warning("⚠️ No se encontraron fechas con eventos")
+            return False
+        
+        # Procesar cada fecha
+        self._procesar_fechas(fechas)
+        
+        return True
+    
+    def _procesar_fechas(self, fechas: List[Dict], indices=None):
+        """
+        Procesa las fechas registrando cada una en el checkpoint; las fechas
+        completadas en una corrida interrumpida se toman del checkpoint
+        
+        Args:
+            fechas: Fechas del calendario de esta sesión
+            indices: Índices a procesar (por defecto todas las fechas); los
+                     workers reciben los que van tomando de la cola compartida
+        """
+        for indice in (range(len(fechas)) if indices is None else indices):
+            fecha_info = fechas[indice]
+            clave = self._clave_fecha(fecha_info)
             
-            try:
-                datos['homenajeada'] = elemento.find_element(By.CSS_SELECTOR, ".homenajeada, .honoree").text.strip()
-            except:
-                pass
+            if self.checkpoint:
+                eventos = self.checkpoint.eventos_completados(clave)
+                if eventos is not None:
+                    logger.debug(f"⏯️ Fecha {fecha_info['fecha']} tomada del checkpoint")
+                    self._agregar_eventos(eventos)
+                    continue
             
-            try:
-                datos['tipo_evento'] = elemento.find_element(By.CSS_SELECTOR, ".tipo, .event-type").text.strip()
-            except:
-                pass
+            if self.limite_tasa:
+                self.limite_tasa.tomar()
             
-            try:
-                datos['codigo_evento'] = elemento.find_element(By.CSS_SELECTOR, ".codigo, .event-code").text.strip()
-            except:
-                pass
+            with self.concurrencia.permiso() if self.concurrencia else nullcontext():
+                inicio = time.time()
+                errores_previos = len(self.errores)
+                eventos = self._procesar_fecha(fecha_info)
+                
+                # Si la sesión venció durante la fecha se reingresa y se reintenta
+                intentos = 0
+                while sesion_vencida_en_frame(self.driver):
+                    # Lo leído con la sesión vencida no vale
+                    del self.errores[errores_previos:]
+                    eventos = []
+                    
+                    if intentos >= config.session_relogin_attempts:
+                        raise RuntimeError(f"Sesión vencida tras {intentos} reingresos")
+                    intentos += 1
+                    
+                    if not self._restaurar_sesion(fechas):
+                        raise RuntimeError("No se pudo restaurar la sesión de Janos")
+                    
+                    errores_previos = len(self.errores)
+                    # La latencia se mide sin el reingreso
+                    inicio = time.time()
+                    eventos = self._procesar_fecha(fecha_info)
+                
+                # Solo cuentan las fechas que cargaron páginas (no las omitidas por
+                # huella), con la latencia por página/ítem leído
+                error = bool(intentos) or len(self.errores) > errores_previos
+                if self.concurrencia and (self.cargas_fecha or error):
+                    self.concurrencia.registrar(
+                        (time.time() - inicio) / max(1, self.cargas_fecha),
+                        error=error
+                    )
             
-            try:
-                datos['salon'] = elemento.find_element(By.CSS_SELECTOR, ".salon, .venue").text.strip()
-            except:
-                pass
+            self.fechas_procesadas += 1
+            self._agregar_eventos(eventos)
             
-            try:
-                datos['horario'] = elemento.find_element(By.CSS_SELECTOR, ".horario, .time").text.strip()
-            except:
-                pass
+            # Solo las fechas sin errores cuentan como completadas
+            if self.checkpoint and len(self.errores) == errores_previos:
+                self.checkpoint.registrar(clave, eventos)
+    
+    def _agregar_eventos(self, eventos: List[Dict]):
+        """
+        Acumula los eventos de una fecha y los escribe en la salida CSV
+        
+        Args:
+            eventos: Eventos de la fecha
+        """
+        self.eventos_extraidos.extend(eventos)
+        if self.salida:
+            self.salida.escribir(eventos)
+    
+    @staticmethod
+    def _indices_pendientes(cola: itertools.count, total: int):
+        """
+        Toma índices de la cola compartida hasta agotar las fechas
+        
+        Args:
+            cola: Contador compartido por los workers
+            total: Cantidad de fechas del calendario
+        """
+        for indice in cola:
+            if indice >= total:
+                return
+            yield indice
+    
+    def _ejecutar_worker(self, worker_id: int, cola: itertools.count) -> Dict:
+        """
+        Ejecuta un worker del pool: abre su propia sesión y va tomando
+        fechas de la cola compartida mientras el control de concurrencia
+        le dé lugar
+        
+        Args:
+            worker_id: Índice del worker (0..N-1)
+            cola: Contador compartido con el próximo índice de fecha
             
-            # Validar que al menos tenga código o cliente
-            if datos['codigo_evento'] or datos['cliente']:
-                return datos
+        Returns:
+            Diccionario con eventos, errores y estadísticas del worker
+        """
+        inicio = time.time()
+        worker = ExtractorEventos(worker_id=worker_id, filtro=self.filtro, pool=self.pool)
+        worker.huellas = self.huellas
+        worker.checkpoint = self.checkpoint
+        worker.salida = self.salida
+        worker.selectores = self.selectores
+        worker.limite_tasa = self.limite_tasa
+        worker.concurrencia = self.concurrencia
+        exito = False
+        
+        try:
+            if worker._preparar_sesion():
+                # Cada sesión tiene sus propios elementos; el orden del
+                # calendario es el mismo en todas, por eso se reparte por índice
+                fechas = worker._obtener_fechas_con_eventos()
+                worker._procesar_fechas(fechas, self._indices_pendientes(cola, len(fechas)))
+                logger.info(f"👷 Worker #{worker_id}: {worker.fechas_procesadas} fechas procesadas")
+                exito = True
+                
+        except Exception as e:
+            logger.exception(f"❌ Error en worker #{worker_id}: {e}")
+            worker.errores.append({"paso": "worker", "error": str(e)})
             
-            return None
+        finally:
+            worker._cerrar_driver()
+        
+        return {
+            'eventos': worker.eventos_extraidos,
+            'errores': [dict(error, worker=worker_id) for error in worker.errores],
+            'estadisticas': {
+                'worker_id': worker_id,
+                'exito': exito,
+                'fechas_procesadas': worker.fechas_procesadas,
+                'total_eventos': len(worker.eventos_extraidos),
+                'total_errores': len(worker.errores),
+                'duracion': time.time() - inicio,
+                'relogins': worker.relogins,
+                'paginas_navegadas': worker.paginas_navegadas,
+                'navegaciones': worker.navegaciones,
+                'pestanas': worker.pestanas.resumen() if worker.pestanas else None,
+                'esperas': worker.esperas.resumen() if worker.esperas else {}
+            }
+        }
+    
+    def _extraer_en_paralelo(self, total_workers: int) -> bool:
+        """
+        Reparte las fechas entre varias sesiones de navegador en paralelo
+        
+        Args:
+            total_workers: Cantidad de sesiones a abrir
             
+        Returns:
+            True si al menos un worker completó su porción
+        """
+        if self.pool is not None and total_workers > self.pool.tamano:
+            # Más sesiones que navegadores calientes: las que sobran esperarían un navegador libre
+            logger.warning(f"⚠️ {total_workers} workers y {self.pool.tamano} navegadores en el pool, se usan {self.pool.tamano} sesiones")
+            total_workers = self.pool.tamano
+        
+        logger.info(f"👥 Extracción paralela con hasta {total_workers} sesiones")
+        
+        self.concurrencia = ControlConcurrencia(maximo=total_workers, nombre="sesiones")
+        cola = itertools.count()
+        
+        with ThreadPoolExecutor(max_workers=total_workers) as executor:
+            resultados = list(executor.map(
+                lambda worker_id: self._ejecutar_worker(worker_id, cola),
+                range(total_workers)
+            ))
+        
+        for resultado in resultados:
+            self.eventos_extraidos.extend(resultado['eventos'])
+            self.errores.extend(resultado['errores'])
+            self.estadisticas_workers.append(resultado['estadisticas'])
+        
+        return any(r['estadisticas']['exito'] for r in resultados)
+    
+    def _leer_opciones_filtros(self) -> Dict[str, List[str]]:
+        """
+        Lee en una sola llamada las opciones de los selects salon/cluster/ano
+        
+        Returns:
+            Clave del filtro -> textos de las opciones con valor
+        """
+        opciones = self.driver.execute_script("""
+            var resultado = {};
+            for (var clave in arguments[0]) {
+                var select = document.getElementById(arguments[0][clave]);
+                resultado[clave] = [];
+                if (!select) continue;
+                for (var i = 0; i < select.options.length; i++) {
+                    var opcion = select.options[i];
+                    var texto = opcion.text.trim();
+                    if (texto && opcion.value !== '') resultado[clave].push(texto);
+                }
+            }
+            return resultado;
+        """, CAMPOS_FILTRO) or {}
+        
+        for clave, valores in opciones.items():
+            logger.debug(f"Opciones del filtro {clave}: {valores}")
+        return opciones
+    
+    def _extraer_combinacion(self, indice: int, filtro: Dict[str, str]) -> Dict:
+        """
+        Extrae una combinación de filtros con su propia sesión y guarda su partición
+        
+        Args:
+            indice: Número de la combinación (se usa como id del worker)
+            filtro: Combinación {salon, zona, ano}
+        
+        Returns:
+            Diccionario con eventos, errores y estadísticas de la combinación
+        """
+        inicio = time.time()
+        clave = clave_particion(filtro)
+        worker = ExtractorEventos(worker_id=indice, filtro=filtro, pool=self.pool)
+        worker.huellas = self.huellas
+        worker.checkpoint = self.checkpoint
+        worker.salida = self.salida
+        worker.selectores = self.selectores
+        worker.limite_tasa = self.limite_tasa
+        worker.concurrencia = self.concurrencia
+        exito = False
+        
+        try:
+            exito = worker._extraer_secuencial()
         except Exception as e:
-            logger.debug(f"Error extrayendo datos de evento: {e}")
+            logger.exception(f"❌ Error en combinación {clave}: {e}")
+            worker.errores.append({"paso": "combinacion", "error": str(e)})
+        finally:
+            worker._cerrar_driver()
+        
+        ruta = self._guardar_particion(clave, worker.eventos_extraidos) if exito else None
+        
+        return {
+            'eventos': worker.eventos_extraidos,
+            'errores': [dict(error, combinacion=clave) for error in worker.errores],
+            'estadisticas': {
+                'combinacion': clave,
+                'filtro': filtro,
+                'exito': exito,
+                'total_eventos': len(worker.eventos_extraidos),
+                'total_errores': len(worker.errores),
+                'duracion': time.time() - inicio,
+                'relogins': worker.relogins,
+                'paginas_navegadas': worker.paginas_navegadas,
+                'navegaciones': worker.navegaciones,
+                'pestanas': worker.pestanas.resumen() if worker.pestanas else None,
+                'archivo': str(ruta) if ruta else None
+            }
+        }
+    
+    def _extraer_matriz(self, especificacion: Dict) -> bool:
+        """
+        Extrae en paralelo todas las combinaciones de la especificación de filtros
+        
+        Args:
+            especificacion: Especificación cargada con cargar_especificacion()
+        
+        Returns:
+            True si al menos una combinación se extrajo
+        """
+        opciones = None
+        if requiere_opciones(especificacion):
+            # Una sesión corta solo para leer las opciones de los selects
+            if not (self.iniciar_sesion() and self._navegar_adicionales()):
+                return False
+            opciones = self._leer_opciones_filtros()
+            self._cerrar_driver()
+        
+        combinaciones = expandir_combinaciones(especificacion['combinaciones'], opciones)
+        if not combinaciones:
+            logger.warning("⚠️ La especificación de filtros no produjo combinaciones")
+            return False
+        
+        total_workers = min(config.extraction_workers, len(combinaciones))
+        if self.pool is not None:
+            total_workers = min(total_workers, self.pool.tamano)
+        logger.info(f"🧮 Matriz de filtros: {len(combinaciones)} combinaciones con {total_workers} sesiones")
+        
+        # Las sesiones de las combinaciones comparten el control de concurrencia
+        self.concurrencia = ControlConcurrencia(maximo=total_workers, nombre="sesiones")
+        
+        with ThreadPoolExecutor(max_workers=total_workers) as executor:
+            resultados = list(executor.map(
+                lambda par: self._extraer_combinacion(*par),
+                enumerate(combinaciones)
+            ))
+        
+        for resultado in resultados:
+            self.eventos_extraidos.extend(resultado['eventos'])
+            self.errores.extend(resultado['errores'])
+            self.particiones.append(resultado['estadisticas'])
+        
+        return any(r['estadisticas']['exito'] for r in resultados)
+    
+    def _guardar_particion(self, clave: str, eventos: List[Dict]) -> Optional[Path]:
+        """
+        Guarda los eventos de una combinación en su propio CSV
+        
+        Args:
+            clave: Clave de la partición (salon_zona_ano)
+            eventos: Eventos de la combinación
+        
+        Returns:
+            Ruta del CSV o None si hubo error
+        """
+        try:
+            config.partitions_dir.mkdir(parents=True, exist_ok=True)
+            ruta = guardar_eventos_csv(config.partitions_dir / f"eventos_{clave}.csv", eventos)
+            logger.info(f"💾 Partición {clave}: {ruta} ({len(eventos)} registros)")
+            return ruta
+        except Exception as e:
+            logger.exception(f"❌ Error guardando partición {clave}: {e}")
             return None
     
     def extraer_todos_eventos(self) -> bool:
@@ -435,40 +1112,51 @@ class ExtractorEventos:
         logger.log_rpa_start("EXTRACCIÓN COMPLETA DE EVENTOS")
         
         try:
-            # Configurar driver
-            self.driver = self._configurar_driver()
-            self.wait = WebDriverWait(self.driver, config.browser_timeout)
+            if config.checkpoint_enabled and self.worker_id is None:
+                self.checkpoint = CheckpointExtraccion(reanudar=self.reanudar)
             
-            # Login
-            if not self._login():
-                return False
+            # Los eventos se escriben en el CSV temporal fecha por fecha
+            self.salida = SalidaCSV(config.csv_output_path)
             
-            # Navegar a Adicionales
-            if not self._navegar_adicionales():
-                return False
+            total_workers = config.extraction_workers
+            especificacion = cargar_especificacion()
             
-            # Aplicar filtros
-            if not self._aplicar_filtros():
-                return False
+            if self.filtro is None and es_matriz(especificacion):
+                exito = self._extraer_matriz(especificacion)
+            else:
+                if self.filtro is None:
+                    combinaciones = expandir_combinaciones(especificacion['combinaciones'])
+                    self.filtro = combinaciones[0] if combinaciones else None
+                
+                if total_workers > 1:
+                    exito = self._extraer_en_paralelo(total_workers)
+                else:
+                    exito = self._extraer_secuencial()
             
-            # Obtener fechas con eventos
-            fechas = self._obtener_fechas_con_eventos()
-            if not fechas:
-                logger.warning("⚠️ No se encontraron fechas con eventos")
+            if not exito:
                 return False
             
-            # Procesar cada fecha
-            total_eventos = 0
-            for fecha_info in fechas:
-                eventos = self._procesar_fecha(fecha_info)
-                self.eventos_extraidos.extend(eventos)
-                total_eventos += len(eventos)
+            logger.log_extraction(len(self.eventos_extraidos), "Sistema Janos")
+            
+            if self.huellas:
+                resumen = self.huellas.resumen()
+                logger.info(
+                    f"⏭️ Fechas sin cambios omitidas: {resumen['fechas_omitidas']} "
+                    f"(releídas: {resumen['fechas_releidas']})"
+                )
+                self.huellas.guardar()
             
-            logger.log_extraction(total_eventos, "Sistema Janos")
+            self.selectores.registrar_resumen()
             
             # Guardar resultados
-            if self.eventos_extraidos:
-                self._guardar_csv()
+            guardado = self._guardar_csv() if self.eventos_extraidos else True
+            
+            # El checkpoint solo se descarta cuando el CSV quedó guardado
+            if self.checkpoint:
+                if self.checkpoint.reanudadas:
+                    logger.info(f"⏯️ Fechas tomadas del checkpoint: {self.checkpoint.reanudadas}")
+                if guardado:
+                    self.checkpoint.finalizar()
             
             duration = time.time() - self.start_time
             logger.log_rpa_end("EXTRACCIÓN COMPLETA", duration=duration, success=True)
@@ -480,27 +1168,56 @@ class ExtractorEventos:
             return False
             
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("🔒 Driver cerrado")
+            if self.checkpoint:
+                self.checkpoint.cerrar()
+            # Si la corrida no terminó, el CSV anterior queda intacto
+            if self.salida:
+                self.salida.descartar()
+            self._cerrar_driver()
     
-    def _guardar_csv(self):
-        """Guarda los eventos extraídos en CSV"""
+    def _guardar_csv(self) -> bool:
+        """
+        Publica el CSV escrito durante la extracción
+        
+        Returns:
+            True si el CSV se guardó
+        """
         try:
-            df = pd.DataFrame(self.eventos_extraidos)
-            csv_path = config.csv_output_path
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+            csv_path = self.salida.cerrar()
+            if csv_path is None:
+                logger.warning("⚠️ La salida CSV no tiene filas, se conserva el CSV anterior")
+                return True
             
-            logger.info(f"💾 CSV guardado: {csv_path} ({len(df)} registros)")
+            logger.info(f"💾 CSV guardado: {csv_path} ({self.salida.filas} registros)")
             
             # Backup si está habilitado
             if config.backup_enabled:
                 backup_path = config.BACKUP_DIR / f"eventos_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                df.to_csv(backup_path, index=False, encoding='utf-8-sig')
+                self.salida.respaldar(backup_path)
                 logger.info(f"💾 Backup guardado: {backup_path}")
+            
+            return True
                 
         except Exception as e:
             logger.exception(f"❌ Error guardando CSV: {e}")
+            return False
+    
+    def _resumen_pestanas(self) -> Optional[Dict]:
+        """Totales de las pestañas propias y de las de los workers"""
+        resumenes = [self.pestanas.resumen()] if self.pestanas else []
+        resumenes += [
+            e['pestanas'] for e in self.estadisticas_workers + self.particiones if e.get('pestanas')
+        ]
+        if not resumenes:
+            return None
+        
+        return {
+            'tamano': resumenes[0]['tamano'],
+            'abiertas': sum(r['abiertas'] for r in resumenes),
+            'leidas': sum(r['leidas'] for r in resumenes),
+            'fallidas': sum(r['fallidas'] for r in resumenes),
+            'duracion': round(sum(r['duracion'] for r in resumenes), 3)
+        }
     
     def obtener_estadisticas(self) -> Dict:
         """Retorna estadísticas de la extracción"""
@@ -508,10 +1225,46 @@ class ExtractorEventos:
             'total_eventos': len(self.eventos_extraidos),
             'total_errores': len(self.errores),
             'duracion': time.time() - self.start_time if self.start_time else 0,
+            'workers': self.estadisticas_workers,
+            'particiones': self.particiones,
+            'esperas': self.esperas.resumen() if self.esperas else {},
+            'selectores': self.selectores.resumen(),
+            'navegaciones': self._resumen_navegaciones(),
+            'incremental': self.huellas.resumen() if self.huellas else None,
+            'fechas_omitidas': self.huellas.omitidas if self.huellas else 0,
+            'fechas_reanudadas': self.checkpoint.reanudadas if self.checkpoint else 0,
+            'concurrencia': self.concurrencia.resumen() if self.concurrencia else None,
+            'limite_tasa': self.limite_tasa.resumen() if self.limite_tasa else None,
+            'pestanas': self._resumen_pestanas(),
+            'relogins': self.relogins + sum(
+                e.get('relogins', 0) for e in self.estadisticas_workers + self.particiones
+            ),
+            'paginas_navegadas': self.paginas_navegadas + sum(
+                e.get('paginas_navegadas', 0) for e in self.estadisticas_workers + self.particiones
+            ),
             'timestamp': datetime.now().isoformat()
         }
 
 
+def crear_extractor(refresco_completo: bool = False, reanudar: bool = False, pool=None) -> ExtractorEventos:
+    """
+    Crea el extractor según config.extraction_engine
+    
+    Args:
+        refresco_completo: Releer todas las fechas (ignora la extracción incremental)
+        reanudar: Retomar desde el checkpoint de una corrida interrumpida
+        pool: Pool de navegadores de Janos para las sesiones de Selenium
+    
+    Returns:
+        ExtractorHTTP si el motor es 'http', ExtractorEventos en otro caso
+    """
+    if config.extraction_engine == 'http':
+        # Import diferido: beautifulsoup4 solo hace falta con el motor HTTP
+        from rpa.extractor_http import ExtractorHTTP
+        return ExtractorHTTP(refresco_completo=refresco_completo, reanudar=reanudar, pool=pool)
+    return ExtractorEventos(refresco_completo=refresco_completo, reanudar=reanudar, pool=pool)
+
+
 if __name__ == "__main__":
     # Ejecución directa
     extractor = ExtractorEventos()
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extractor HTTP - RPA Jano's Eventos
+====================================
+Motor de extracción sin navegador: las páginas de Janos se generan del lado
+del servidor (PHP), así que se pueden leer con requests y parsear el HTML.
+Expone la misma interfaz que ExtractorEventos y usa Selenium como respaldo.
+"""
+
+import re
+import time
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+from rpa.extractor_eventos import ExtractorEventos
+from rpa.control_concurrencia import ControlConcurrencia
+from rpa.salida_csv import SalidaCSV
+from rpa.calendario import leer_calendario_html
+from rpa.checkpoint import CheckpointExtraccion
+from rpa.huellas_calendario import calcular_huella
+from rpa.campos_evento import extraer_campos
+from utils.telefonos import extraer_celulares
+from utils.filtros_extraccion import (
+    CAMPOS_FILTRO, cargar_especificacion, requiere_opciones,
+    expandir_combinaciones, clave_particion
+)
+
+
+PATRON_URL_ONCLICK = re.compile(r"""['"]([^'"]+\.php[^'"]*)['"]""")
+PATRON_CODIGO = re.compile(r'^\d{5}$')
+
+
+def celdas_texto(html: str) -> List[Dict[str, str]]:
+    """
+    Convierte el HTML en la secuencia de {'tag', 'texto'} de los elementos con
+    texto propio, el mismo formato que devuelve snapshot_texto con Selenium
+    
+    Args:
+        html: HTML de la página
+    
+    Returns:
+        Lista de {'tag', 'texto'} en orden de documento
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for oculto in soup(['script', 'style', 'head']):
+        oculto.decompose()
+    
+    celdas = []
+    for elemento in soup.find_all(True):
+        texto = ''.join(elemento.find_all(string=True, recursive=False)).strip()
+        if texto and len(texto) < 500:
+            celdas.append({'tag': elemento.name, 'texto': texto})
+    return celdas
+
+
+def parsear_evento(html: str) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Extrae los campos de una página ver_evento.php
+    
+    Args:
+        html: HTML de la página del evento
+    
+    Returns:
+        (valores, faltantes) según el esquema de campos_evento
+    """
+    return extraer_campos(celdas_texto(html))
+
+
+class ExtractorHTTP(ExtractorEventos):
+    """
+    Extractor de eventos por HTTP (sin navegador)
+    """
+    
+    def __init__(self, refresco_completo: bool = False, reanudar: bool = False, pool=None):
+        """
+        Inicializa el extractor HTTP
+        
+        Args:
+            refresco_completo: Se pasa al extractor Selenium de respaldo
+            reanudar: Se pasa al extractor Selenium de respaldo
+            pool: Pool de navegadores para el extractor Selenium de respaldo
+        """
+        super().__init__(refresco_completo=refresco_completo, reanudar=reanudar, pool=pool)
+        self.session = None
+        self.motor = 'http'
+        self.paginas_descargadas = 0
+        self.campos_faltantes = {}
+        # Los contadores se actualizan desde los hilos de descarga
+        self._lock_contadores = threading.Lock()
+    
+    def _crear_sesion_http(self) -> requests.Session:
+        """
+        Crea una sesión HTTP con pool de conexiones y reintentos
+        
+        Returns:
+            Sesión de requests configurada
+        """
+        session = requests.Session()
+        reintentos = Retry(
+            total=config.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=['GET', 'POST']
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config.http_workers,
+            pool_maxsize=config.http_workers,
+            max_retries=reintentos
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = (
+            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+            '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+        )
+        return session
+    
+    def _get(self, url: str, limitar: bool = True, **kwargs) -> requests.Response:
+        """GET con timeout, límite de tasa y control de sesión vencida"""
+        if limitar and self.limite_tasa:
+            self.limite_tasa.tomar()
+        response = self.session.get(url, timeout=config.browser_timeout, **kwargs)
+        response.raise_for_status()
+        with self._lock_contadores:
+            self.paginas_descargadas += 1
+        if 'login.php' in response.url and 'login.php' not in url:
+            raise requests.exceptions.RequestException(f"Sesión vencida al pedir {url}")
+        return response
+    
+    def _login_http(self) -> Optional[requests.Response]:
+        """
+        Realiza login por HTTP
+        
+        Returns:
+            Respuesta de la página de inicio o None si el login falla
+        """
+        logger.log_rpa_start("Login HTTP")
+        
+        pagina_login = self._get(config.url_origen)
+        soup = BeautifulSoup(pagina_login.text, 'html.parser')
+        formulario = soup.find('input', attrs={'name': 'username'}).find_parent('form')
+        
+        payload = self._campos_formulario(formulario)
+        payload['username'] = config.user_origen
+        payload['password'] = config.pass_origen
+        
+        accion = urljoin(pagina_login.url, formulario.get('action') or pagina_login.url)
+        response = self.session.post(accion, data=payload, timeout=config.browser_timeout)
+        response.raise_for_status()
+        
+        if 'login.php' in response.url:
+            logger.error("❌ Login HTTP rechazado")
+            self.errores.append({"paso": "login_http", "error": "Credenciales rechazadas"})
+            return None
+        
+        logger.log_rpa_end("Login HTTP", success=True)
+        return response
+    
+    @staticmethod
+    def _campos_formulario(formulario) -> Dict[str, str]:
+        """Valores por defecto de los inputs y selects de un formulario"""
+        campos = {}
+        for campo in formulario.find_all(['input', 'select']):
+            nombre = campo.get('name')
+            if not nombre or campo.get('type') in ('submit', 'button'):
+                continue
+            if campo.name == 'select':
+                opcion = campo.find('option', selected=True) or campo.find('option')
+                campos[nombre] = opcion.get('value', opcion.get_text(strip=True)) if opcion else ''
+            else:
+                campos[nombre] = campo.get('value', '')
+        return campos
+    
+    def _url_adicionales(self, inicio: requests.Response) -> str:
+        """
+        Obtiene la URL del calendario de Adicionales (contenido de mainFrame)
+        
+        Args:
+            inicio: Respuesta de la página de inicio
+        
+        Returns:
+            URL absoluta del calendario
+        """
+        soup = BeautifulSoup(inicio.text, 'html.parser')
+        menu = soup.find(id='sideMenu') or soup
+        enlace = next(
+            (a for a in menu.find_all('a') if 'adicionales' in a.get_text().lower()),
+            None
+        )
+        if enlace is None:
+            raise ValueError("No se encontró el enlace a Adicionales")
+        
+        url = urljoin(inicio.url, enlace.get('href'))
+        pagina = self._get(url)
+        
+        # El calendario vive dentro del iframe mainFrame
+        frame = BeautifulSoup(pagina.text, 'html.parser').find(id='mainFrame')
+        return urljoin(pagina.url, frame.get('src')) if frame else pagina.url
+    
+    def _filtrar_calendario(self, url_calendario: str, salon: str = "DOT",
+                            zona: str = "CABA", ano: str = "2025") -> requests.Response:
+        """
+        Envía el formulario de filtros salon/cluster/ano
+        
+        Returns:
+            Respuesta con el calendario filtrado
+        """
+        logger.log_rpa_start(f"Aplicando filtros HTTP: {salon}, {zona}, {ano}")
+        
+        pagina = self._get(url_calendario)
+        soup = BeautifulSoup(pagina.text, 'html.parser')
+        formulario = soup.find('select', id='salon').find_parent('form')
+        
+        payload = self._campos_formulario(formulario)
+        for campo_id, texto in (('salon', salon), ('cluster', zona), ('ano', ano)):
+            select = formulario.find('select', id=campo_id)
+            opcion = select.find('option', string=lambda s: s and s.strip() == texto)
+            if opcion is None:
+                raise ValueError(f"Opción '{texto}' no disponible en filtro {campo_id}")
+            payload[select.get('name') or campo_id] = opcion.get('value', texto)
+        
+        boton = formulario.find('input', attrs={'value': 'Filtrar'})
+        if boton is not None and boton.get('name'):
+            payload[boton['name']] = 'Filtrar'
+        
+        accion = urljoin(pagina.url, formulario.get('action') or pagina.url)
+        if (formulario.get('method') or 'get').lower() == 'post':
+            response = self.session.post(accion, data=payload, timeout=config.browser_timeout)
+        else:
+            response = self.session.get(accion, params=payload, timeout=config.browser_timeout)
+        response.raise_for_status()
+        with self._lock_contadores:
+            self.paginas_descargadas += 1
+        
+        logger.log_rpa_end("Aplicación de filtros HTTP", success=True)
+        return response
+    
+    def _combinaciones_filtros(self, url_calendario: str) -> List[Dict[str, str]]:
+        """
+        Combinaciones a extraer según la especificación de filtros (los
+        comodines se expanden con las opciones del formulario)
+        
+        Returns:
+            Lista de {salon, zona, ano}
+        """
+        if self.filtro:
+            return [self.filtro]
+        
+        especificacion = cargar_especificacion()
+        opciones = None
+        if requiere_opciones(especificacion):
+            soup = BeautifulSoup(self._get(url_calendario).text, 'html.parser')
+            opciones = {}
+            for clave, campo_id in CAMPOS_FILTRO.items():
+                select = soup.find('select', id=campo_id)
+                opciones[clave] = [
+                    opcion.get_text(strip=True)
+                    for opcion in (select.find_all('option') if select else [])
+                    if opcion.get_text(strip=True) and opcion.get('value', '') != ''
+                ]
+        
+        combinaciones = expandir_combinaciones(especificacion['combinaciones'], opciones)
+        if len(combinaciones) > 1:
+            logger.info(f"🧮 Matriz de filtros HTTP: {len(combinaciones)} combinaciones")
+        return combinaciones
+    
+    def _fechas_eventos(self, calendario: requests.Response, filtro: Dict[str, str]) -> List[Dict]:
+        """
+        Obtiene las fechas coral del calendario con sus enlaces ver_evento.php
+        
+        Args:
+            calendario: Respuesta con el calendario filtrado
+            filtro: Combinación {salon, zona, ano} del calendario
+        
+        Returns:
+            Lista de {clave, fecha, huella, enlaces}; cada enlace es
+            {fecha, codigo, url, filtro} sin URLs repetidas. Los enlaces que
+            no están dentro de una fecha van en un grupo sin clave
+        """
+        soup = BeautifulSoup(calendario.text, 'html.parser')
+        vistas = set()
+        
+        def enlaces_de(html_soup, base_url, fecha):
+            enlaces = []
+            for a in html_soup.select("a[href*='ver_evento.php']"):
+                url = urljoin(base_url, a['href'])
+                if url in vistas:
+                    continue
+                vistas.add(url)
+                texto = a.get_text(strip=True)
+                enlaces.append({
+                    'fecha': fecha,
+                    'codigo': texto if PATRON_CODIGO.match(texto) else '',
+                    'url': url,
+                    'filtro': filtro
+                })
+            return enlaces
+        
+        # Mismo recorrido que el motor Selenium: días coral con el mes de su título
+        fechas_coral = leer_calendario_html(soup, ano=filtro.get('ano'), color='coral', selector_dias='div.boton')
+        logger.info(f"📅 Encontradas {len(fechas_coral)} fechas con eventos")
+        self.filtros = f"{filtro.get('salon')}/{filtro.get('zona')}/{filtro.get('ano')}"
+        
+        grupos = []
+        for fecha_info in fechas_coral:
+            boton = fecha_info['elemento']
+            html_fecha = str(boton)
+            enlaces = enlaces_de(boton, calendario.url, fecha_info['fecha'])
+            
+            # Las fechas que abren otra página tienen la URL en el onclick
+            destino = PATRON_URL_ONCLICK.search(boton.get('onclick') or '')
+            if destino:
+                detalle = self._get(urljoin(calendario.url, destino.group(1)))
+                html_fecha = detalle.text
+                enlaces += enlaces_de(BeautifulSoup(detalle.text, 'html.parser'), detalle.url, fecha_info['fecha'])
+            
+            grupos.append({
+                'clave': self._clave_fecha(fecha_info),
+                'fecha': fecha_info['fecha'],
+                'huella': calcular_huella(html_fecha),
+                'enlaces': enlaces
+            })
+        
+        # Enlaces ya presentes en el calendario filtrado, fuera de las fechas
+        sueltos = enlaces_de(soup, calendario.url, '')
+        if sueltos:
+            grupos.append({'clave': None, 'fecha': '', 'huella': None, 'enlaces': sueltos})
+        
+        return grupos
+    
+    def _eventos_previos(self, grupo: Dict) -> Optional[List[Dict]]:
+        """
+        Eventos de una fecha que no hace falta descargar: completada en el
+        checkpoint o sin cambios según su huella
+        
+        Args:
+            grupo: Fecha de _fechas_eventos()
+        
+        Returns:
+            Eventos a reutilizar o None si hay que descargar la fecha
+        """
+        if grupo['clave'] is None:
+            return None
+        
+        if self.checkpoint:
+            eventos = self.checkpoint.eventos_completados(grupo['clave'])
+            if eventos is not None:
+                logger.debug(f"⏯️ Fecha {grupo['fecha']} tomada del checkpoint")
+                return eventos
+        
+        if self.huellas:
+            eventos = self.huellas.eventos_sin_cambios(grupo['clave'], grupo['huella'])
+            if eventos is not None:
+                # Los eventos se vuelven a publicar con la fecha de esta extracción
+                fecha_extraccion = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                return [dict(evento, fecha_extraccion=fecha_extraccion) for evento in eventos]
+        
+        return None
+    
+    def _completar_fecha(self, grupo: Dict):
+        """Registra huella y checkpoint de una fecha descargada sin fallas"""
+        if grupo['clave'] is None or grupo['fallidos']:
+            return
+        if self.huellas:
+            self.huellas.registrar(grupo['clave'], grupo['huella'], grupo['eventos'])
+        if self.checkpoint:
+            self.checkpoint.registrar(grupo['clave'], grupo['eventos'])
+    
+    def _obtener_evento(self, enlace: Dict) -> Optional[Dict]:
+        """
+        Descarga y parsea la página de un evento
+        
+        Args:
+            enlace: Diccionario {fecha, codigo, url}
+        
+        Returns:
+            Diccionario con datos del evento o None
+        """
+        if self.limite_tasa:
+            self.limite_tasa.tomar()
+        
+        inicio = time.time()
+        latencia = None
+        try:
+            with self.concurrencia.permiso():
+                # La latencia se mide sin la espera por un lugar libre
+                inicio = time.time()
+                response = self._get(enlace['url'], limitar=False)
+            latencia = time.time() - inicio
+            campos, faltantes = parsear_evento(response.text)
+            celulares = extraer_celulares(response.text)
+            # La descarga cuenta como exitosa recién cuando la página se pudo parsear
+            self.concurrencia.registrar(latencia)
+            with self._lock_contadores:
+                for campo in faltantes:
+                    self.campos_faltantes[campo] = self.campos_faltantes.get(campo, 0) + 1
+            if faltantes:
+                logger.debug(f"Campos sin encontrar en {enlace['url']}: {', '.join(faltantes)}")
+            
+            datos = {
+                'fecha_evento': campos.get('fecha_evento') or enlace['fecha'],
+                'cliente': campos.get('cliente', ''),
+                'homenajeada': campos.get('homenajeada', ''),
+                'tipo_evento': campos.get('tipo_evento', ''),
+                'codigo_evento': enlace['codigo'] or campos.get('codigo_evento', ''),
+                'salon': campos.get('salon') or enlace.get('filtro', {}).get('salon', ''),
+                'horario': campos.get('horario', ''),
+                'celular': celulares[0] if celulares else '',
+                'celular_2': celulares[1] if len(celulares) > 1 else '',
+                'tipo_pack': campos.get('tipo_pack', ''),
+                'fecha_extraccion': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            
+            if datos['codigo_evento'] or datos['cliente']:
+                return datos
+            return None
+        
+        except requests.exceptions.RequestException as e:
+            self.concurrencia.registrar(time.time() - inicio, error=True)
+            logger.warning(f"⚠️ Error descargando evento {enlace['url']}: {e}")
+            self.errores.append({"paso": f"evento_http_{enlace['codigo'] or enlace['url']}", "error": str(e)})
+            return None
+        
+        except Exception as e:
+            # Una página que no se pudo parsear también baja el límite de concurrencia
+            self.concurrencia.registrar(latencia if latencia is not None else time.time() - inicio, error=True)
+            logger.warning(f"⚠️ Error descargando evento {enlace['url']}: {e}")
+            self.errores.append({"paso": f"evento_http_{enlace['codigo'] or enlace['url']}", "error": str(e)})
+            return None
+    
+    def _extraer_http(self) -> bool:
+        """
+        Ejecuta la extracción completa por HTTP
+        
+        Returns:
+            True si la extracción pudo ejecutarse
+        """
+        self.session = self._crear_sesion_http()
+        
+        try:
+            inicio = self._login_http()
+            if inicio is None:
+                return False
+            
+            url_calendario = self._url_adicionales(inicio)
+            combinaciones = self._combinaciones_filtros(url_calendario)
+            
+            # Fechas de todas las combinaciones; cada una recuerda su combinación
+            grupos = []
+            for filtro in combinaciones:
+                calendario = self._filtrar_calendario(url_calendario, **filtro)
+                for grupo in self._fechas_eventos(calendario, filtro):
+                    grupo['filtro'] = filtro
+                    grupos.append(grupo)
+            
+            if not any(grupo['enlaces'] for grupo in grupos):
+                logger.warning("⚠️ No se encontraron enlaces a eventos en el HTML")
+                return False
+            
+            # Las fechas del checkpoint o sin cambios no se descargan
+            enlaces = []
+            for grupo in grupos:
+                grupo['fallidos'] = 0
+                previos = self._eventos_previos(grupo)
+                if previos is not None:
+                    grupo['eventos'] = previos
+                    grupo['restantes'] = 0
+                    self._agregar_eventos(previos)
+                    continue
+                
+                grupo['eventos'] = []
+                grupo['restantes'] = len(grupo['enlaces'])
+                if not grupo['enlaces']:
+                    self._completar_fecha(grupo)
+                enlaces += [(grupo, enlace) for enlace in grupo['enlaces']]
+            
+            omitidas = sum(1 for grupo in grupos if grupo['clave'] and grupo['restantes'] == 0 and grupo['enlaces'])
+            logger.info(
+                f"🌐 Descargando {len(enlaces)} eventos con hasta {config.http_workers} conexiones "
+                f"({omitidas} fechas reutilizadas)"
+            )
+            self.concurrencia = ControlConcurrencia(maximo=config.http_workers, nombre="descargas HTTP")
+            # Cada evento se escribe en la salida apenas termina su descarga y
+            # cada fecha queda en el checkpoint cuando terminan todos sus eventos
+            with ThreadPoolExecutor(max_workers=config.http_workers) as executor:
+                descargas = executor.map(lambda par: self._obtener_evento(par[1]), enlaces)
+                for (grupo, _), evento in zip(enlaces, descargas):
+                    if evento:
+                        grupo['eventos'].append(evento)
+                        self._agregar_eventos([evento])
+                    else:
+                        grupo['fallidos'] += 1
+                    
+                    grupo['restantes'] -= 1
+                    if grupo['restantes'] == 0:
+                        self._completar_fecha(grupo)
+            
+            if len(combinaciones) > 1:
+                for filtro in combinaciones:
+                    clave = clave_particion(filtro)
+                    eventos_filtro = [
+                        evento for grupo in grupos if grupo['filtro'] is filtro
+                        for evento in grupo['eventos']
+                    ]
+                    ruta = self._guardar_particion(clave, eventos_filtro)
+                    self.particiones.append({
+                        'combinacion': clave,
+                        'filtro': filtro,
+                        'exito': ruta is not None,
+                        'total_eventos': len(eventos_filtro),
+                        'archivo': str(ruta) if ruta else None
+                    })
+            return True
+        
+        finally:
+            self.session.close()
+    
+    def extraer_todos_eventos(self) -> bool:
+        """
+        Ejecuta la extracción por HTTP y, si falla, recurre a Selenium
+        
+        Returns:
+            True si extracción exitosa
+        """
+        self.start_time = time.time()
+        logger.log_rpa_start("EXTRACCIÓN HTTP DE EVENTOS")
+        self.salida = SalidaCSV(config.csv_output_path)
+        
+        # Mismo checkpoint por fecha que el motor Selenium (--resume)
+        if config.checkpoint_enabled and self.worker_id is None:
+            self.checkpoint = CheckpointExtraccion(reanudar=self.reanudar)
+        
+        try:
+            exito = self._extraer_http()
+        except Exception as e:
+            logger.exception(f"❌ Error en extracción HTTP: {e}")
+            self.errores.append({"paso": "extraccion_http", "error": str(e)})
+            exito = False
+        
+        if not exito:
+            self.salida.descartar()
+            if self.checkpoint:
+                # Selenium retoma las fechas que el motor HTTP ya completó
+                self.checkpoint.cerrar()
+                self.checkpoint = None
+                self.reanudar = True
+            if not config.http_fallback_selenium:
+                return False
+            logger.warning("⚠️ Extracción HTTP fallida, usando Selenium como respaldo")
+            self.motor = 'selenium'
+            self.eventos_extraidos = []
+            self.concurrencia = None
+            return super().extraer_todos_eventos()
+        
+        logger.log_extraction(len(self.eventos_extraidos), "Sistema Janos (HTTP)")
+        
+        if self.huellas:
+            resumen = self.huellas.resumen()
+            logger.info(
+                f"⏭️ Fechas sin cambios omitidas: {resumen['fechas_omitidas']} "
+                f"(releídas: {resumen['fechas_releidas']})"
+            )
+            self.huellas.guardar()
+        
+        guardado = self._guardar_csv() if self.eventos_extraidos else True
+        self.salida.descartar()
+        
+        # El checkpoint solo se descarta cuando el CSV quedó guardado
+        if self.checkpoint:
+            if self.checkpoint.reanudadas:
+                logger.info(f"⏯️ Fechas tomadas del checkpoint: {self.checkpoint.reanudadas}")
+            if guardado:
+                self.checkpoint.finalizar()
+            else:
+                self.checkpoint.cerrar()
+        
+        duration = time.time() - self.start_time
+        logger.log_rpa_end("EXTRACCIÓN HTTP", duration=duration, success=True)
+        return True
+    
+    def obtener_estadisticas(self) -> Dict:
+        """Retorna estadísticas de la extracción"""
+        estadisticas = super().obtener_estadisticas()
+        estadisticas['motor'] = self.motor
+        estadisticas['paginas_descargadas'] = self.paginas_descargadas
+        estadisticas['campos_faltantes'] = self.campos_faltantes
+        return estadisticas
+
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formulario de COORDIS - RPA Jano's Eventos
+===========================================
+Completa todos los campos del formulario de coordinación en una sola
+llamada execute_script: cada valor se asigna con el setter nativo de
+value y se disparan los eventos input/change para que React actualice su
+estado. La misma llamada verifica los valores, sin find_element por campo
+(ni la espera implícita de cada selector que falla), clear/send_keys ni
+pausas entre campos
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.logger import logger
+
+
+# arguments[0]: campo -> {selectores: [...], valor}. Devuelve los campos
+# completados, los que no tienen elemento y los que quedaron con otro valor
+SCRIPT_LLENAR_FORMULARIO = """
+var campos = arguments[0];
+var resultado = {llenados: [], faltantes: [], diferentes: {}};
+
+function setterNativo(el) {
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+              : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+              : HTMLInputElement.prototype;
+    return Object.getOwnPropertyDescriptor(proto, 'value').set;
+}
+
+for (var campo in campos) {
+    var el = null;
+    var selectores = campos[campo].selectores;
+    for (var i = 0; i < selectores.length && !el; i++) {
+        el = document.querySelector(selectores[i]);
+    }
+    if (!el) {
+        resultado.faltantes.push(campo);
+        continue;
+    }
+    
+    var valor = campos[campo].valor;
+    setterNativo(el).call(el, valor);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    
+    if (el.value === valor) {
+        resultado.llenados.push(campo);
+    } else {
+        resultado.diferentes[campo] = el.value;
+    }
+}
+return resultado;
+"""
+
+
+def llenar_formulario(driver, selectores: Dict[str, List[str]], valores: Dict[str, str]) -> Dict:
+    """
+    Completa y verifica los campos del formulario en una sola llamada
+    
+    Args:
+        driver: Driver de Selenium parado en el formulario
+        selectores: Campo -> selectores CSS a probar en orden
+        valores: Campo -> valor (se ignoran los campos sin selectores)
+    
+    Returns:
+        {llenados, faltantes, diferentes, pendientes, duracion}; 'pendientes'
+        son los campos a completar por otra vía (sin elemento o con otro valor)
+    """
+    campos = {
+        campo: {'selectores': selectores[campo], 'valor': str(valor)}
+        for campo, valor in valores.items() if campo in selectores
+    }
+    
+    inicio = time.time()
+    resultado = driver.execute_script(SCRIPT_LLENAR_FORMULARIO, campos) or {}
+    duracion = time.time() - inicio
+    
+    llenados = resultado.get('llenados', [])
+    faltantes = resultado.get('faltantes', [])
+    diferentes = resultado.get('diferentes', {})
+    for campo, actual in diferentes.items():
+        logger.debug(f"Campo '{campo}' quedó con '{actual}' en lugar de '{campos[campo]['valor']}'")
+    
+    return {
+        'llenados': llenados,
+        'faltantes': faltantes,
+        'diferentes': diferentes,
+        'pendientes': faltantes + list(diferentes),
+        'duracion': round(duracion, 3)
+    }
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Huellas del Calendario - RPA Jano's Eventos
+============================================
+Guarda por cada fecha del calendario una huella (códigos visibles y hash del
+HTML de la lista de eventos) junto con los eventos extraídos. En la corrida
+siguiente las fechas con la misma huella reutilizan esos eventos en lugar de
+releer cada evento
+"""
+
+import re
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+# Códigos de evento de 5 dígitos que muestra la lista de una fecha
+PATRON_CODIGO = re.compile(r'(?<!\d)\d{5}(?!\d)')
+PATRON_ESPACIOS = re.compile(r'\s+')
+
+
+def calcular_huella(html: str) -> Dict:
+    """
+    Calcula la huella de la lista de eventos de una fecha
+    
+    Args:
+        html: HTML del modal o de la lista de eventos
+    
+    Returns:
+        Diccionario con los códigos visibles y el hash del HTML normalizado
+    """
+    html = PATRON_ESPACIOS.sub(' ', html or '').strip()
+    return {
+        'codigos': sorted(set(PATRON_CODIGO.findall(html))),
+        'hash': hashlib.sha256(html.encode('utf-8')).hexdigest()
+    }
+
+
+class HuellasCalendario:
+    """
+    Almacén de huellas por fecha para la extracción incremental
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, refresco_completo: bool = False, path: Optional[Path] = None):
+        """
+        Carga el almacén
+        
+        Args:
+            refresco_completo: Forzar la relectura de todas las fechas
+            path: Archivo JSON del almacén (por defecto config.fingerprint_store_path)
+        """
+        self.path = path or config.fingerprint_store_path
+        self.fechas = {}
+        self.ultima_completa = 0
+        self.vistas = set()
+        self.omitidas = 0
+        self.releidas = 0
+        self._lock = threading.Lock()
+        
+        self._cargar()
+        
+        vencida = time.time() - self.ultima_completa > config.full_refresh_hours * 3600
+        self.completa = refresco_completo or vencida
+        if self.completa:
+            motivo = "forzado" if refresco_completo else "refresco periódico"
+            logger.info(f"🔄 Extracción completa ({motivo}): se releen todas las fechas")
+        else:
+            logger.info(f"⚡ Extracción incremental ({len(self.fechas)} fechas con huella)")
+    
+    def _cargar(self):
+        """Lee el almacén si existe y es de la versión actual"""
+        if not self.path.exists():
+            return
+        
+        try:
+            datos = json.loads(self.path.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"⚠️ Almacén de huellas inválido, se descarta: {e}")
+            return
+        
+        if datos.get('version') != self.VERSION:
+            return
+        
+        self.fechas = datos.get('fechas', {})
+        self.ultima_completa = datos.get('ultima_completa', 0)
+    
+    def eventos_sin_cambios(self, clave: str, huella: Dict) -> Optional[List[Dict]]:
+        """
+        Devuelve los eventos guardados si la fecha no cambió
+        
+        Args:
+            clave: Identificador de la fecha (filtros + celda)
+            huella: Huella actual de la fecha
+        
+        Returns:
+            Eventos de la corrida anterior o None si hay que releer la fecha
+        """
+        with self._lock:
+            self.vistas.add(clave)
+            anterior = self.fechas.get(clave)
+            
+            if self.completa or not anterior or anterior['huella'] != huella:
+                self.releidas += 1
+                return None
+            
+            self.omitidas += 1
+            return anterior['eventos']
+    
+    def registrar(self, clave: str, huella: Dict, eventos: List[Dict]):
+        """
+        Guarda la huella y los eventos de una fecha leída completa
+        
+        Args:
+            clave: Identificador de la fecha
+            huella: Huella de la fecha
+            eventos: Eventos extraídos de la fecha
+        """
+        with self._lock:
+            self.vistas.add(clave)
+            self.fechas[clave] = {
+                'huella': huella,
+                'eventos': eventos,
+                'actualizada': time.time()
+            }
+    
+    def guardar(self):
+        """
+        Persiste el almacén (escritura atómica); las fechas que ya no
+        aparecen en el calendario se descartan
+        """
+        with self._lock:
+            fechas = {clave: datos for clave, datos in self.fechas.items() if clave in self.vistas}
+            datos = {
+                'version': self.VERSION,
+                'ultima_completa': time.time() if self.completa else self.ultima_completa,
+                'fechas': fechas
+            }
+        
+        try:
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            tmp_path.write_text(json.dumps(datos, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            logger.debug(f"💾 Huellas guardadas: {len(fechas)} fechas")
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo guardar el almacén de huellas: {e}")
+    
+    def resumen(self) -> Dict:
+        """Fechas omitidas y releídas en la corrida"""
+        return {
+            'completa': self.completa,
+            'fechas_omitidas': self.omitidas,
+            'fechas_releidas': self.releidas
+        }
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perfil de Scraping - RPA Jano's Eventos
+========================================
+Configuración liviana de Chrome para leer texto de Janos: sin imágenes,
+fuentes, analytics (y opcionalmente CSS), más la medición del tiempo de
+carga y los bytes transferidos en cada navegación
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+PATRONES_HOJAS_ESTILO = ["*.css", "*.css?*"]
+PATRONES_FUENTES = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+PATRONES_ANALYTICS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+]
+
+# Tiempo de carga y bytes de la navegación actual y sus recursos
+SCRIPT_METRICAS_NAVEGACION = """
+var nav = performance.getEntriesByType('navigation')[0];
+var recursos = performance.getEntriesByType('resource');
+var bytes = nav ? (nav.transferSize || 0) : 0;
+for (var i = 0; i < recursos.length; i++) { bytes += recursos[i].transferSize || 0; }
+return {
+    url: location.href,
+    duracion_ms: nav ? Math.round(nav.duration || (nav.loadEventEnd - nav.startTime)) : null,
+    bytes: bytes,
+    recursos: recursos.length
+};
+"""
+
+
+def aplicar_perfil_scraping(options):
+    """
+    Agrega al Options de Chrome las preferencias del perfil de scraping
+    
+    Args:
+        options: selenium.webdriver.chrome.options.Options
+    """
+    if config.scrape_block_images:
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    
+    if config.page_load_strategy in ('eager', 'none', 'normal'):
+        options.page_load_strategy = config.page_load_strategy
+
+
+def patrones_bloqueados() -> List[str]:
+    """Patrones de URL a bloquear según la configuración"""
+    patrones = []
+    if config.scrape_block_stylesheets:
+        patrones.extend(PATRONES_HOJAS_ESTILO)
+    if config.scrape_block_fonts:
+        patrones.extend(PATRONES_FUENTES)
+    if config.scrape_block_analytics:
+        patrones.extend(PATRONES_ANALYTICS)
+    patrones.extend(config.scrape_blocked_urls)
+    return patrones
+
+
+def bloquear_recursos(driver) -> bool:
+    """
+    Bloquea por CDP (Network.setBlockedURLs) los recursos configurados
+    
+    Args:
+        driver: Driver de Chrome ya creado
+    
+    Returns:
+        True si se aplicó el bloqueo
+    """
+    patrones = patrones_bloqueados()
+    if not patrones:
+        return False
+    
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patrones})
+        logger.debug(f"Recursos bloqueados: {patrones}")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo aplicar el bloqueo de recursos: {e}")
+        return False
+
+
+def medir_navegacion(driver, etiqueta: str, detalle: bool = True) -> Optional[Dict]:
+    """
+    Registra en el log el tiempo de carga y los bytes de la página actual
+    
+    Args:
+        driver: Driver de Selenium
+        etiqueta: Nombre de la navegación (login, adicionales, evento, ...)
+        detalle: Registrar en INFO; las páginas de eventos van en DEBUG y
+            se resumen con resumir_navegaciones()
+    
+    Returns:
+        Métricas de la navegación o None si no se pudieron leer
+    """
+    try:
+        metricas = driver.execute_script(SCRIPT_METRICAS_NAVEGACION)
+    except Exception as e:
+        logger.debug(f"No se pudieron leer las métricas de navegación: {e}")
+        return None
+    
+    metricas['etiqueta'] = etiqueta
+    registrar = logger.info if detalle else logger.debug
+    registrar(
+        f"📶 Navegación {etiqueta}: {metricas['duracion_ms']} ms, "
+        f"{metricas['bytes'] / 1024:.1f} KB en {metricas['recursos']} recursos",
+        event='navegacion', **metricas
+    )
+    return metricas
+
+
+def resumir_navegaciones(navegaciones: List[Dict]) -> Dict:
+    """
+    Totales de un grupo de navegaciones medidas
+    
+    Args:
+        navegaciones: Métricas devueltas por medir_navegacion()
+    
+    Returns:
+        Diccionario con cantidad, bytes, duración total y promedio (ms)
+    """
+    duracion = sum(n.get('duracion_ms') or 0 for n in navegaciones)
+    return {
+        'cantidad': len(navegaciones),
+        'bytes': sum(n.get('bytes') or 0 for n in navegaciones),
+        'duracion_ms': duracion,
+        'promedio_ms': round(duracion / len(navegaciones)) if navegaciones else 0
+    }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura en Pestañas - RPA Jano's Eventos
+=========================================
+Abre las páginas ver_evento.php en un grupo de pestañas del mismo navegador
+logueado y las lee a medida que terminan de cargar. Las cargas se solapan
+sin logins ni procesos de navegador adicionales, y la pestaña del
+calendario no se mueve (no hace falta driver.back() ni volver a mainFrame
+entre eventos)
+"""
+
+import re
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+from utils.telefonos import extraer_celulares
+from rpa.esperas import MotorEsperas, SELECTOR_MODAL
+from rpa.snapshot_dom import snapshot_texto
+from rpa.campos_evento import extraer_campos
+from rpa.perfil_navegador import medir_navegacion, resumir_navegaciones
+
+
+# Enlaces a ver_evento.php dentro de la lista de eventos abierta (arguments[0]
+# es el selector del modal); los de otras fechas que sigan en el DOM no cuentan
+SCRIPT_ENLACES_EVENTO = """
+var enlaces = [];
+var modales = document.querySelectorAll(arguments[0]);
+for (var m = 0; m < modales.length; m++) {
+    if (!modales[m].getClientRects().length) continue;
+    var anclas = modales[m].querySelectorAll("a[href*='ver_evento.php']");
+    for (var i = 0; i < anclas.length; i++) {
+        enlaces.push({url: anclas[i].href, texto: (anclas[i].innerText || '').trim()});
+    }
+}
+return enlaces;
+"""
+
+PATRON_CODIGO = re.compile(r'(?<!\d)\d{5}(?!\d)')
+
+
+def enlaces_evento(driver, fecha: str = '') -> List[Dict]:
+    """
+    Lee en una sola llamada los enlaces a ver_evento.php de la lista de
+    eventos abierta (el modal visible que espera MotorEsperas.modal_visible)
+    
+    Args:
+        driver: Driver de Selenium (en el frame donde están los enlaces)
+        fecha: Fecha del calendario a la que pertenecen
+    
+    Returns:
+        Lista de {url, codigo, fecha} sin URLs repetidas
+    """
+    resultado = {}
+    for enlace in driver.execute_script(SCRIPT_ENLACES_EVENTO, SELECTOR_MODAL[1]) or []:
+        if enlace['url'] in resultado:
+            continue
+        codigo = PATRON_CODIGO.search(enlace['texto']) or PATRON_CODIGO.search(enlace['url'])
+        resultado[enlace['url']] = {
+            'url': enlace['url'],
+            'codigo': codigo.group(0) if codigo else '',
+            'fecha': fecha
+        }
+    return list(resultado.values())
+
+
+def datos_pagina_evento(driver, enlace: Dict) -> Optional[Dict]:
+    """
+    Extrae los datos de la página ver_evento.php cargada en la pestaña actual
+    
+    Args:
+        driver: Driver de Selenium parado en la página del evento
+        enlace: Diccionario {url, codigo, fecha, salon}
+    
+    Returns:
+        Diccionario con datos del evento o None
+    """
+    campos, faltantes = extraer_campos(snapshot_texto(driver))
+    if faltantes:
+        logger.debug(f"Campos sin encontrar en {enlace['url']}: {', '.join(faltantes)}")
+    celulares = extraer_celulares(driver.page_source)
+    
+    datos = {
+        'fecha_evento': campos.get('fecha_evento') or enlace.get('fecha', ''),
+        'cliente': campos.get('cliente', ''),
+        'homenajeada': campos.get('homenajeada', ''),
+        'tipo_evento': campos.get('tipo_evento', ''),
+        'codigo_evento': enlace.get('codigo') or campos.get('codigo_evento', ''),
+        'salon': campos.get('salon') or enlace.get('salon', ''),
+        'horario': campos.get('horario', ''),
+        'celular': celulares[0] if celulares else '',
+        'celular_2': celulares[1] if len(celulares) > 1 else '',
+        'tipo_pack': campos.get('tipo_pack', ''),
+        'fecha_extraccion': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    if datos['codigo_evento'] or datos['cliente']:
+        return datos
+    return None
+
+
+class LectorPestanas:
+    """
+    Grupo de pestañas para leer páginas de eventos con cargas solapadas
+    """
+    
+    def __init__(self, driver, tamano: Optional[int] = None, esperas: Optional[MotorEsperas] = None):
+        """
+        Inicializa el lector
+        
+        Args:
+            driver: Driver de Selenium con la sesión de Janos iniciada
+            tamano: Pestañas abiertas a la vez (por defecto config.tab_pool_size)
+            esperas: Motor de esperas del driver (para registrar las cargas)
+        """
+        self.driver = driver
+        self.tamano = max(1, tamano or config.tab_pool_size)
+        self.esperas = esperas or MotorEsperas(driver)
+        self.abiertas = 0
+        self.leidas = 0
+        self.fallidas = 0
+        self.duracion = 0.0
+        self.navegaciones: List[Dict] = []
+    
+    def _abrir(self, principal: str, url: str) -> str:
+        """
+        Abre una URL en una pestaña nueva sin esperar la carga
+        
+        Args:
+            principal: Handle de la pestaña del calendario
+            url: URL a abrir
+        
+        Returns:
+            Handle de la pestaña nueva
+        """
+        self.driver.switch_to.window(principal)
+        antes = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        
+        nuevas = [handle for handle in self.driver.window_handles if handle not in antes]
+        if not nuevas:
+            raise WebDriverException(f"No se pudo abrir una pestaña para {url}")
+        
+        self.abiertas += 1
+        return nuevas[0]
+    
+    def _leer_pestana(self, handle: str, enlace: Dict, extraer: Callable) -> Optional[Dict]:
+        """Espera la carga de una pestaña, extrae sus datos y la cierra"""
+        try:
+            self.driver.switch_to.window(handle)
+            self.esperas.documento_listo("pestana_evento")
+            metricas = medir_navegacion(self.driver, "evento", detalle=False)
+            if metricas:
+                self.navegaciones.append(metricas)
+            datos = extraer(self.driver, enlace)
+            self.leidas += 1
+            return datos
+        
+        except Exception as e:
+            logger.warning(f"⚠️ Error leyendo pestaña de {enlace['url']}: {e}")
+            self.fallidas += 1
+            return None
+        
+        finally:
+            try:
+                self.driver.close()
+            except WebDriverException as e:
+                logger.debug(f"Error cerrando pestaña: {e}")
+    
+    def leer(self, enlaces: List[Dict], extraer: Callable = datos_pagina_evento) -> List[Optional[Dict]]:
+        """
+        Lee todas las páginas manteniendo hasta `tamano` pestañas cargando
+        
+        Al terminar el driver vuelve a la pestaña original, en el documento
+        principal (si se estaba dentro de un frame hay que volver a entrar)
+        
+        Args:
+            enlaces: Lista de diccionarios con al menos 'url'
+            extraer: Función (driver, enlace) -> datos de la página
+        
+        Returns:
+            Resultado de extraer() por enlace, en el mismo orden (None si falló)
+        """
+        resultados: List[Optional[Dict]] = [None] * len(enlaces)
+        if not enlaces:
+            return resultados
+        
+        inicio = time.time()
+        medidas_previas = len(self.navegaciones)
+        principal = self.driver.current_window_handle
+        pendientes = deque(enumerate(enlaces))
+        abiertas = deque()
+        
+        try:
+            while pendientes or abiertas:
+                # Mantener el grupo lleno: las cargas avanzan mientras se lee la más antigua
+                while pendientes and len(abiertas) < self.tamano:
+                    indice, enlace = pendientes.popleft()
+                    try:
+                        abiertas.append((indice, self._abrir(principal, enlace['url'])))
+                    except WebDriverException as e:
+                        logger.warning(f"⚠️ {e}")
+                        self.fallidas += 1
+                
+                if abiertas:
+                    indice, handle = abiertas.popleft()
+                    resultados[indice] = self._leer_pestana(handle, enlaces[indice], extraer)
+        
+        finally:
+            for _, handle in abiertas:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+            self.driver.switch_to.window(principal)
+            self.duracion += time.time() - inicio
+        
+        logger.debug(f"🗂️ {len(enlaces)} páginas leídas en pestañas ({time.time() - inicio:.2f}s)")
+        medidas = resumir_navegaciones(self.navegaciones[medidas_previas:])
+        if medidas['cantidad']:
+            logger.info(
+                f"📶 Navegación eventos: {medidas['cantidad']} páginas, promedio {medidas['promedio_ms']} ms, "
+                f"{medidas['bytes'] / 1024:.1f} KB en total",
+                event='navegacion_eventos', **medidas
+            )
+        return resultados
+    
+    def resumen(self) -> Dict:
+        """Pestañas abiertas, leídas y fallidas"""
+        return {
+            'tamano': self.tamano,
+            'abiertas': self.abiertas,
+            'leidas': self.leidas,
+            'fallidas': self.fallidas,
+            'duracion': round(self.duracion, 3),
+            'navegaciones': resumir_navegaciones(self.navegaciones)
+        }
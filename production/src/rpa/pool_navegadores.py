@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pool de Navegadores - RPA Jano's Eventos
+=========================================
+Mantiene K navegadores abiertos (y logueados) en un proceso de larga vida
+para prestarlos a los trabajos, evitando el arranque en frío de Chrome y el
+login en cada ejecución. Un hilo de vigilancia revisa los navegadores libres
+y los recicla después de N páginas o si su memoria supera el límite
+"""
+
+import time
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+from rpa.extractor_eventos import ExtractorEventos
+from rpa.sesion_cache import sesion_activa
+
+
+class NavegadorPool:
+    """Navegador del pool con sus contadores de uso"""
+    
+    def __init__(self, id_navegador: int, driver):
+        self.id = id_navegador
+        self.driver = driver
+        self.creado = time.time()
+        self.paginas = 0
+        self.usos = 0
+        self.url_inicio = driver.current_url
+    
+    def registrar_paginas(self, cantidad: int = 1):
+        """Suma páginas cargadas por el trabajo que tiene el navegador"""
+        self.paginas += cantidad
+
+
+class PoolNavegadores:
+    """
+    Pool de navegadores calientes
+    
+    Uso:
+        pool = crear_pool_janos()
+        pool.iniciar()
+        with pool.prestar() as navegador:
+            ExtractorEventos(driver=navegador.driver).extraer_todos_eventos()
+    """
+    
+    def __init__(self,
+                 fabrica: Callable[[int], object],
+                 verificar: Optional[Callable[[object], bool]] = None,
+                 nombre: str = "navegadores",
+                 tamano: Optional[int] = None,
+                 max_paginas: Optional[int] = None,
+                 max_rss_mb: Optional[int] = None,
+                 intervalo_salud: Optional[int] = None):
+        """
+        Args:
+            fabrica: Crea un driver listo para usar (o None si falla); recibe el id del navegador
+            verificar: Chequeo de la página de inicio (por ejemplo, sesión activa)
+            nombre: Nombre del pool para los logs
+            tamano: Navegadores a mantener abiertos
+            max_paginas: Páginas tras las cuales se recicla un navegador
+            max_rss_mb: Memoria tras la cual se recicla un navegador
+            intervalo_salud: Segundos entre chequeos de los navegadores libres
+        """
+        self.fabrica = fabrica
+        self.verificar = verificar
+        self.nombre = nombre
+        self.tamano = tamano or config.driver_pool_size
+        self.max_paginas = max_paginas if max_paginas is not None else config.driver_pool_max_pages
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else config.driver_pool_max_rss_mb
+        self.intervalo_salud = intervalo_salud or config.driver_pool_health_interval
+        
+        self._libres = queue.Queue()
+        self._navegadores: Dict[int, NavegadorPool] = {}
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self._siguiente_id = 1
+        self.reciclados = 0
+        self.prestamos = 0
+    
+    def iniciar(self):
+        """Abre los navegadores y arranca el hilo de vigilancia"""
+        logger.info(f"🏊 Iniciando pool de {self.nombre} ({self.tamano} navegadores)")
+        self._completar()
+        
+        self._hilo = threading.Thread(target=self._vigilar, name=f"pool-{self.nombre}", daemon=True)
+        self._hilo.start()
+    
+    def _crear(self) -> Optional[NavegadorPool]:
+        """Abre un navegador nuevo con la fábrica del pool"""
+        with self._lock:
+            id_navegador = self._siguiente_id
+            self._siguiente_id += 1
+        
+        inicio = time.time()
+        try:
+            driver = self.fabrica(id_navegador)
+        except Exception as e:
+            logger.exception(f"❌ Error abriendo navegador #{id_navegador} del pool {self.nombre}: {e}")
+            return None
+        
+        if driver is None:
+            logger.error(f"❌ No se pudo preparar el navegador #{id_navegador} del pool {self.nombre}")
+            return None
+        
+        navegador = NavegadorPool(id_navegador, driver)
+        with self._lock:
+            self._navegadores[id_navegador] = navegador
+        
+        logger.info(f"✅ Navegador #{id_navegador} listo en {time.time() - inicio:.1f}s")
+        return navegador
+    
+    def _completar(self):
+        """Abre navegadores hasta llegar al tamaño del pool"""
+        with self._lock:
+            faltantes = self.tamano - len(self._navegadores)
+        
+        for _ in range(max(0, faltantes)):
+            navegador = self._crear()
+            if navegador:
+                self._libres.put(navegador)
+    
+    def _cerrar(self, navegador: NavegadorPool):
+        """Cierra un navegador y lo quita del pool"""
+        with self._lock:
+            self._navegadores.pop(navegador.id, None)
+        try:
+            navegador.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error cerrando navegador #{navegador.id}: {e}")
+    
+    def memoria_mb(self, navegador: NavegadorPool) -> Optional[float]:
+        """
+        Memoria residente del chromedriver y sus procesos hijos (Chrome)
+        
+        Returns:
+            MB usados o None si psutil no está instalado
+        """
+        try:
+            import psutil
+        except ImportError:
+            return None
+        
+        try:
+            proceso = psutil.Process(navegador.driver.service.process.pid)
+            procesos = [proceso] + proceso.children(recursive=True)
+            total = 0
+            for p in procesos:
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except Exception as e:
+            logger.debug(f"No se pudo medir la memoria del navegador #{navegador.id}: {e}")
+            return None
+    
+    def _motivo_reciclaje(self, navegador: NavegadorPool) -> Optional[str]:
+        """Indica por qué hay que reciclar el navegador (None si no hace falta)"""
+        if self.max_paginas and navegador.paginas >= self.max_paginas:
+            return f"{navegador.paginas} páginas"
+        
+        memoria = self.memoria_mb(navegador)
+        if memoria is not None and self.max_rss_mb and memoria > self.max_rss_mb:
+            return f"{memoria:.0f} MB de memoria"
+        
+        return None
+    
+    def _saludable(self, navegador: NavegadorPool) -> bool:
+        """
+        Vuelve el navegador a su página de inicio y verifica que responda
+        (esto además mantiene viva la sesión del servidor)
+        """
+        try:
+            driver = navegador.driver
+            driver.switch_to.default_content()
+            driver.get(navegador.url_inicio)
+            navegador.registrar_paginas()
+            
+            if driver.execute_script("return document.readyState") == "loading":
+                return False
+            
+            return self.verificar(driver) if self.verificar else True
+        except Exception as e:
+            logger.debug(f"Navegador #{navegador.id} no responde: {e}")
+            return False
+    
+    def _revisar(self, navegador: NavegadorPool) -> Optional[NavegadorPool]:
+        """
+        Recicla el navegador si hace falta
+        
+        Returns:
+            El mismo navegador, uno nuevo que lo reemplaza o None si no se pudo abrir
+        """
+        motivo = self._motivo_reciclaje(navegador)
+        if motivo is None and not self._saludable(navegador):
+            motivo = "falló el chequeo de salud"
+        
+        if motivo is None:
+            return navegador
+        
+        logger.info(f"♻️ Reciclando navegador #{navegador.id} ({motivo})")
+        self._cerrar(navegador)
+        self.reciclados += 1
+        return self._crear()
+    
+    def tomar(self, timeout: Optional[float] = None) -> Optional[NavegadorPool]:
+        """
+        Toma un navegador libre y sano
+        
+        Args:
+            timeout: Segundos máximos de espera por un navegador libre
+        
+        Returns:
+            Navegador prestado o None si no hubo uno disponible
+        """
+        limite = time.time() + timeout if timeout is not None else None
+        
+        while True:
+            restante = max(0, limite - time.time()) if limite is not None else None
+            try:
+                navegador = self._libres.get(timeout=restante)
+            except queue.Empty:
+                logger.warning(f"⚠️ No hay navegadores libres en el pool {self.nombre}")
+                return None
+            
+            navegador = self._revisar(navegador)
+            if navegador:
+                navegador.usos += 1
+                self.prestamos += 1
+                return navegador
+            
+            # No se pudo reemplazar: se intenta con otro navegador libre
+            if limite is not None and time.time() >= limite:
+                return None
+            if not self._navegadores and self._libres.empty():
+                logger.error(f"❌ El pool {self.nombre} se quedó sin navegadores")
+                return None
+    
+    def devolver(self, navegador: NavegadorPool):
+        """Devuelve un navegador al pool"""
+        motivo = self._motivo_reciclaje(navegador)
+        if motivo:
+            logger.info(f"♻️ Reciclando navegador #{navegador.id} ({motivo})")
+            self._cerrar(navegador)
+            self.reciclados += 1
+            navegador = self._crear()
+        
+        if navegador:
+            self._libres.put(navegador)
+    
+    @contextmanager
+    def prestar(self, timeout: Optional[float] = None):
+        """
+        Presta un navegador durante el bloque with y lo devuelve al salir
+        
+        Raises:
+            RuntimeError: Si no hay navegadores disponibles
+        """
+        navegador = self.tomar(timeout)
+        if navegador is None:
+            raise RuntimeError(f"Pool {self.nombre} sin navegadores disponibles")
+        try:
+            yield navegador
+        finally:
+            self.devolver(navegador)
+    
+    def _vigilar(self):
+        """Hilo de vigilancia: revisa los navegadores libres y repone los que faltan"""
+        while not self._detener.wait(self.intervalo_salud):
+            for _ in range(self._libres.qsize()):
+                try:
+                    navegador = self._libres.get_nowait()
+                except queue.Empty:
+                    break
+                
+                navegador = self._revisar(navegador)
+                if navegador:
+                    self._libres.put(navegador)
+            
+            self._completar()
+    
+    def estado(self) -> Dict:
+        """Estado del pool para monitoreo"""
+        with self._lock:
+            navegadores = list(self._navegadores.values())
+        
+        return {
+            'nombre': self.nombre,
+            'tamano': self.tamano,
+            'abiertos': len(navegadores),
+            'libres': self._libres.qsize(),
+            'prestamos': self.prestamos,
+            'reciclados': self.reciclados,
+            'navegadores': [
+                {
+                    'id': n.id,
+                    'paginas': n.paginas,
+                    'usos': n.usos,
+                    'edad': round(time.time() - n.creado, 1),
+                    'memoria_mb': self.memoria_mb(n)
+                }
+                for n in navegadores
+            ]
+        }
+    
+    def cerrar(self):
+        """Detiene la vigilancia y cierra todos los navegadores"""
+        self._detener.set()
+        if self._hilo:
+            self._hilo.join(timeout=5)
+        
+        with self._lock:
+            navegadores: List[NavegadorPool] = list(self._navegadores.values())
+        for navegador in navegadores:
+            self._cerrar(navegador)
+        
+        logger.info(f"🔒 Pool de {self.nombre} cerrado")
+
+
+def _abrir_navegador_janos(id_navegador: int):
+    """Abre Chrome con el perfil del extractor y deja la sesión de Janos iniciada"""
+    # Con worker_id cada navegador tiene su propia sesión PHP (sin caché compartida)
+    extractor = ExtractorEventos(worker_id=id_navegador)
+    if not extractor.iniciar_sesion():
+        extractor._cerrar_driver()
+        return None
+    return extractor.driver
+
+
+def crear_pool_janos(tamano: Optional[int] = None) -> PoolNavegadores:
+    """
+    Crea el pool de navegadores logueados en Janos
+    
+    Args:
+        tamano: Navegadores a mantener (por defecto DRIVER_POOL_SIZE)
+    
+    Returns:
+        Pool sin iniciar
+    """
+    return PoolNavegadores(
+        fabrica=_abrir_navegador_janos,
+        verificar=sesion_activa,
+        nombre="janos",
+        tamano=tamano
+    )
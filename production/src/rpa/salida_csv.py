@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Salida CSV Incremental - RPA Jano's Eventos
+============================================
+Escribe los eventos en el CSV a medida que se extraen: el encabezado una
+sola vez, las filas de cada fecha apenas se leen (con flush por fecha) en
+un archivo temporal que se renombra de forma atómica al terminar. El backup
+es un hard link al CSV final (o una copia si el sistema de archivos no lo
+permite) en lugar de volver a serializar los eventos
+"""
+
+import os
+import csv
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.logger import logger
+
+
+# Columnas del CSV de eventos, en el orden de los registros del extractor
+COLUMNAS_EVENTO = [
+    'fecha_evento', 'cliente', 'homenajeada', 'tipo_evento', 'codigo_evento',
+    'salon', 'horario', 'celular', 'celular_2', 'tipo_pack', 'fecha_extraccion'
+]
+
+
+class SalidaCSV:
+    """
+    CSV de eventos escrito fila a fila sobre un archivo temporal
+    """
+    
+    def __init__(self, path: Path, columnas: Optional[List[str]] = None):
+        """
+        Prepara la salida (el archivo se crea con la primera fila)
+        
+        Args:
+            path: Ruta final del CSV
+            columnas: Columnas del encabezado (por defecto COLUMNAS_EVENTO más
+                      las claves extra de la primera fila)
+        """
+        self.path = Path(path)
+        self.tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        self.columnas = list(columnas) if columnas else None
+        self.filas = 0
+        self.lotes = 0
+        self.cerrada = False
+        self._archivo = None
+        self._escritor = None
+        self._lock = threading.Lock()
+    
+    def _abrir(self, primera: Dict):
+        """Crea el archivo temporal y escribe el encabezado"""
+        if self.columnas is None:
+            self.columnas = COLUMNAS_EVENTO + [clave for clave in primera if clave not in COLUMNAS_EVENTO]
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._archivo = open(self.tmp_path, 'w', newline='', encoding='utf-8-sig')
+        self._escritor = csv.DictWriter(self._archivo, fieldnames=self.columnas, restval='', extrasaction='ignore')
+        self._escritor.writeheader()
+    
+    def escribir(self, eventos: List[Dict]):
+        """
+        Agrega las filas de una fecha y las fuerza al archivo
+        
+        Args:
+            eventos: Eventos de la fecha
+        """
+        if not eventos:
+            return
+        
+        with self._lock:
+            if self.cerrada:
+                raise RuntimeError(f"La salida {self.path} ya está cerrada")
+            if self._archivo is None:
+                self._abrir(eventos[0])
+            
+            self._escritor.writerows(eventos)
+            self._archivo.flush()
+            self.filas += len(eventos)
+            self.lotes += 1
+    
+    def cerrar(self, publicar_vacio: bool = False) -> Optional[Path]:
+        """
+        Cierra el archivo temporal y lo renombra al CSV final
+        
+        Args:
+            publicar_vacio: Publicar un CSV solo con el encabezado si no
+                            se escribió ninguna fila
+        
+        Returns:
+            Ruta del CSV o None si no se publicó (el CSV anterior queda intacto)
+        """
+        with self._lock:
+            if self.cerrada:
+                return None
+            self.cerrada = True
+            
+            if self._archivo is None:
+                if not publicar_vacio:
+                    return None
+                self._abrir({})
+            
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._archivo.close()
+            os.replace(self.tmp_path, self.path)
+            return self.path
+    
+    def descartar(self):
+        """Cierra sin publicar: elimina el archivo temporal si quedó abierto"""
+        with self._lock:
+            if self.cerrada:
+                return
+            self.cerrada = True
+            
+            if self._archivo is not None:
+                self._archivo.close()
+                try:
+                    self.tmp_path.unlink()
+                except FileNotFoundError:
+                    pass
+                logger.debug(f"Salida CSV descartada: {self.tmp_path}")
+    
+    def respaldar(self, destino: Path) -> Path:
+        """
+        Backup del CSV final sin volver a escribirlo
+        
+        El CSV siguiente se publica con os.replace (un inodo nuevo), así que
+        el hard link conserva el contenido de esta corrida
+        
+        Args:
+            destino: Ruta del backup
+        
+        Returns:
+            Ruta del backup
+        """
+        destino = Path(destino)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(self.path, destino)
+        except OSError as e:
+            logger.debug(f"Hard link no disponible para el backup ({e}), se copia el archivo")
+            shutil.copy2(self.path, destino)
+        return destino
+    
+    def resumen(self) -> Dict:
+        """Filas y fechas escritas"""
+        return {
+            'archivo': str(self.path),
+            'filas': self.filas,
+            'lotes': self.lotes
+        }
+
+
+def guardar_eventos_csv(path: Path, eventos: List[Dict]) -> Optional[Path]:
+    """
+    Escribe una lista completa de eventos con la misma salida atómica
+    
+    Args:
+        path: Ruta del CSV
+        eventos: Eventos a escribir
+    
+    Returns:
+        Ruta del CSV
+    """
+    salida = SalidaCSV(path)
+    try:
+        salida.escribir(eventos)
+        return salida.cerrar(publicar_vacio=True)
+    finally:
+        salida.descartar()
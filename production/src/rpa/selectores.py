@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resolutor de Selectores - RPA Jano's Eventos
+=============================================
+Busca los campos opcionales de cada evento con find_elements y la espera
+implícita en cero: un campo que no existe falla al instante en lugar de
+bloquear config.implicit_wait segundos. Registra la tasa de fallos de cada
+selector. Los campos de todos los ítems de una lista también pueden leerse
+en una sola llamada execute_script generada a partir de los mismos selectores
+"""
+
+import threading
+import importlib.util
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+# Campo del evento -> selector CSS dentro del ítem de la lista
+SELECTORES_EVENTO = {
+    'cliente': ".cliente, .client-name",
+    'homenajeada': ".homenajeada, .honoree",
+    'tipo_evento': ".tipo, .event-type",
+    'codigo_evento': ".codigo, .event-code",
+    'salon': ".salon, .venue",
+    'horario': ".horario, .time",
+}
+
+SELECTOR_CERRAR_MODAL = ".close, .cerrar, button.close"
+
+SELECTOR_ITEMS_EVENTO = "div.evento-item, tr.evento"
+
+# configuracion_selectores.py (raíz del proyecto): campo -> clave de EXTRACCION_EVENTOS
+RUTA_CONFIGURACION_SELECTORES = Path(__file__).resolve().parents[3] / 'configuracion_selectores.py'
+CLAVES_CONFIGURACION = {
+    'cliente': 'cliente_nombre',
+    'homenajeada': 'agasajado',
+    'tipo_evento': 'tipo_evento',
+    'salon': 'salon',
+    'horario': 'horario_evento',
+}
+
+# Devuelve por cada ítem {campo: texto o null} y su innerHTML
+SCRIPT_CAMPOS_ITEMS = """
+var items = document.querySelectorAll(arguments[0]);
+var selectores = arguments[1];
+var resultado = [];
+for (var i = 0; i < items.length; i++) {
+    var campos = {};
+    for (var campo in selectores) {
+        var el = items[i].querySelector(selectores[campo]);
+        campos[campo] = el ? (el.innerText || el.textContent || '').trim() : null;
+    }
+    resultado.push({campos: campos, html: items[i].innerHTML});
+}
+return resultado;
+"""
+
+
+def _unir_selectores(*selectores: str) -> str:
+    """Une listas de selectores CSS sin repetir ninguno"""
+    partes = []
+    for selector in selectores:
+        for parte in selector.split(','):
+            parte = parte.strip()
+            if parte and parte not in partes:
+                partes.append(parte)
+    return ', '.join(partes)
+
+
+def selectores_evento() -> Dict[str, str]:
+    """
+    Selectores de los campos del ítem: los propios más las clases de
+    EXTRACCION_EVENTOS en configuracion_selectores.py, si el archivo existe
+    
+    Returns:
+        Campo -> selector CSS
+    """
+    selectores = dict(SELECTORES_EVENTO)
+    if not RUTA_CONFIGURACION_SELECTORES.exists():
+        return selectores
+    
+    try:
+        spec = importlib.util.spec_from_file_location('configuracion_selectores', RUTA_CONFIGURACION_SELECTORES)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        configurados = getattr(modulo, 'EXTRACCION_EVENTOS', {})
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo leer configuracion_selectores.py: {e}")
+        return selectores
+    
+    for campo, clave in CLAVES_CONFIGURACION.items():
+        clase = configurados.get(clave)
+        if clase:
+            selectores[campo] = _unir_selectores(selectores[campo], f".{clase}")
+    return selectores
+
+
+@contextmanager
+def sin_espera_implicita(driver):
+    """
+    Pone la espera implícita del driver en cero y la restaura al salir
+    
+    Args:
+        driver: Driver de Selenium
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(config.implicit_wait)
+
+
+class ResolutorSelectores:
+    """
+    Búsqueda sin espera de selectores opcionales con métricas de aciertos
+    """
+    
+    def __init__(self, selectores: Optional[Dict[str, str]] = None):
+        """
+        Inicializa las métricas
+        
+        Args:
+            selectores: Campo -> selector CSS (por defecto selectores_evento())
+        """
+        self.selectores = selectores or selectores_evento()
+        self.consultas: Dict[str, Dict] = {}
+        self.lotes_fallidos = 0
+        self._lock = threading.Lock()
+    
+    def _registrar(self, selector: str, encontrado: bool):
+        """Acumula una consulta del selector"""
+        with self._lock:
+            registro = self.consultas.setdefault(selector, {'consultas': 0, 'fallos': 0})
+            registro['consultas'] += 1
+            if not encontrado:
+                registro['fallos'] += 1
+    
+    def primero(self, contexto, selector: str):
+        """
+        Primer elemento que coincide con el selector
+        
+        La espera implícita del driver debe estar en cero (ver
+        sin_espera_implicita); find_elements no lanza excepción si no hay
+        coincidencias
+        
+        Args:
+            contexto: Driver o elemento donde buscar
+            selector: Selector CSS
+        
+        Returns:
+            WebElement o None si no existe
+        """
+        elementos = contexto.find_elements(By.CSS_SELECTOR, selector)
+        self._registrar(selector, bool(elementos))
+        return elementos[0] if elementos else None
+    
+    def texto(self, contexto, selector: str) -> Optional[str]:
+        """
+        Texto del primer elemento que coincide con el selector
+        
+        Args:
+            contexto: Driver o elemento donde buscar
+            selector: Selector CSS
+        
+        Returns:
+            Texto sin espacios extremos o None si no existe
+        """
+        elemento = self.primero(contexto, selector)
+        return elemento.text.strip() if elemento is not None else None
+    
+    def campos(self, elemento) -> Dict[str, str]:
+        """
+        Textos de los campos presentes en un ítem
+        
+        Args:
+            elemento: Ítem de la lista de eventos
+        
+        Returns:
+            Campo -> texto, solo para los campos encontrados
+        """
+        resultado = {}
+        for campo, selector in self.selectores.items():
+            texto = self.texto(elemento, selector)
+            if texto is not None:
+                resultado[campo] = texto
+        return resultado
+    
+    def campos_lote(self, driver, selector_items: str = SELECTOR_ITEMS_EVENTO) -> Optional[List[Dict]]:
+        """
+        Lee los campos de todos los ítems de la lista en una sola llamada
+        
+        Args:
+            driver: Driver de Selenium (en el frame de la lista)
+            selector_items: Selector CSS de los ítems
+        
+        Returns:
+            Por ítem {'campos': campo -> texto (solo los encontrados), 'html'},
+            o None si el script falló y hay que leer elemento por elemento
+        """
+        try:
+            items = driver.execute_script(SCRIPT_CAMPOS_ITEMS, selector_items, self.selectores)
+        except Exception as e:
+            with self._lock:
+                self.lotes_fallidos += 1
+            logger.debug(f"Extracción por lote fallida, se lee ítem por ítem: {e}")
+            return None
+        
+        if not isinstance(items, list):
+            return None
+        
+        resultado = []
+        for item in items:
+            campos = {}
+            for campo, selector in self.selectores.items():
+                texto = (item.get('campos') or {}).get(campo)
+                self._registrar(selector, texto is not None)
+                if texto is not None:
+                    campos[campo] = texto
+            resultado.append({'campos': campos, 'html': item.get('html') or ''})
+        return resultado
+    
+    def resumen(self) -> Dict[str, Dict]:
+        """
+        Retorna las métricas de cada selector
+        
+        Returns:
+            Diccionario selector -> {consultas, fallos, tasa_fallos}
+        """
+        with self._lock:
+            return {
+                selector: dict(
+                    registro,
+                    tasa_fallos=round(registro['fallos'] / registro['consultas'], 3)
+                )
+                for selector, registro in self.consultas.items()
+            }
+    
+    def registrar_resumen(self):
+        """Loguea los selectores que fallan siempre (probablemente obsoletos)"""
+        for selector, registro in self.resumen().items():
+            if registro['tasa_fallos'] == 1:
+                logger.warning(f"⚠️ Selector sin coincidencias en {registro['consultas']} consultas: {selector}")
+            else:
+                logger.debug(f"Selector {selector}: {registro['tasa_fallos']:.0%} de fallos")
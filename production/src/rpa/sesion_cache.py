@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché de Sesión - RPA Jano's Eventos
+=====================================
+Guarda las cookies de una sesión autenticada de Janos (cifradas) para
+reutilizarlas en la siguiente ejecución y evitar el login completo
+"""
+
+import json
+import os
+import time
+import base64
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+
+# Importar configuración y logger del sistema
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+from rpa.esperas import SELECTOR_MAIN_FRAME
+
+
+# Indicadores de sesión vencida en la página o en la URL
+INDICADORES_SESION_VENCIDA = [
+    "sesion vencida",
+    "sesión vencida",
+    "sesion expirada",
+    "sesión expirada",
+    "volve a ingresar",
+    "vuelve a ingresar",
+]
+
+
+def sesion_activa(driver) -> bool:
+    """
+    Verifica de forma barata si la sesión del driver sigue activa
+    
+    Args:
+        driver: Driver de Selenium
+    
+    Returns:
+        True si la sesión está activa
+    """
+    try:
+        current_url = driver.current_url.lower()
+        if "login.php" in current_url:
+            logger.debug("Redirigido a login.php - sesión vencida")
+            return False
+        
+        page_source = driver.page_source.lower()
+        for indicador in INDICADORES_SESION_VENCIDA:
+            if indicador in page_source:
+                logger.debug(f"Sesión vencida detectada: {indicador}")
+                return False
+        
+        return True
+    
+    except Exception as e:
+        logger.debug(f"Error verificando sesión: {e}")
+        return False
+
+
+# Ubicación del frame actual y de la página, y texto visible del frame
+SCRIPT_ESTADO_SESION = """
+var top_url = '';
+try { top_url = window.top.location.href; } catch (e) {}
+return {
+    frame: document.location.href,
+    top: top_url,
+    texto: document.body ? document.body.innerText.slice(0, 2000) : ''
+};
+"""
+
+
+def sesion_vencida_en_frame(driver) -> bool:
+    """
+    Detecta el vencimiento de la sesión sin transferir el HTML completo:
+    revisa la URL del frame actual, la de la página y el texto visible
+    
+    Args:
+        driver: Driver de Selenium (puede estar dentro de mainFrame)
+    
+    Returns:
+        True si la sesión venció
+    """
+    try:
+        estado = driver.execute_script(SCRIPT_ESTADO_SESION) or {}
+    except Exception as e:
+        # Un frame descartado por la redirección también indica sesión perdida
+        logger.debug(f"No se pudo leer el estado de la sesión: {e}")
+        try:
+            driver.switch_to.default_content()
+            if not sesion_activa(driver):
+                return True
+            # Sesión viva: se vuelve a mainFrame para que el recorrido siga en el calendario
+            driver.switch_to.frame(driver.find_element(*SELECTOR_MAIN_FRAME))
+            return False
+        except Exception:
+            # Sin mainFrame no se puede seguir: se trata como vencida para reconstruir frame y filtros
+            return True
+    
+    if "login.php" in (estado.get('frame') or '').lower() or "login.php" in (estado.get('top') or '').lower():
+        logger.debug("Redirigido a login.php - sesión vencida")
+        return True
+    
+    texto = (estado.get('texto') or '').lower()
+    for indicador in INDICADORES_SESION_VENCIDA:
+        if indicador in texto:
+            logger.debug(f"Sesión vencida detectada: {indicador}")
+            return True
+    
+    return False
+
+
+class SesionCache:
+    """
+    Almacén cifrado de cookies de la sesión de Janos
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Inicializa la caché
+        
+        Args:
+            path: Ruta del archivo de caché (por defecto config.session_cache_path)
+        """
+        self.path = Path(path) if path else config.session_cache_path
+        self.max_age = config.session_cache_max_age
+        self._fernet = self._crear_cifrador()
+    
+    def _crear_cifrador(self):
+        """
+        Crea el cifrador Fernet con la clave configurada
+        
+        Returns:
+            Instancia de Fernet o None si cryptography no está instalado
+        """
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            logger.warning("⚠️ 'cryptography' no está instalado: caché de sesión deshabilitada")
+            return None
+        
+        # Sin clave explícita se deriva de las credenciales: si cambian,
+        # la caché anterior deja de poder descifrarse y se descarta
+        secreto = config.session_cache_key or f"{config.user_origen}:{config.pass_origen}"
+        clave = base64.urlsafe_b64encode(hashlib.sha256(secreto.encode('utf-8')).digest())
+        return Fernet(clave)
+    
+    @property
+    def habilitada(self) -> bool:
+        """Indica si la caché puede usarse"""
+        return config.session_cache_enabled and self._fernet is not None
+    
+    def guardar(self, driver) -> bool:
+        """
+        Guarda las cookies de la sesión actual del driver
+        
+        Args:
+            driver: Driver de Selenium con sesión autenticada
+        
+        Returns:
+            True si la caché se guardó
+        """
+        if not self.habilitada:
+            return False
+        
+        try:
+            datos = {
+                'creada': time.time(),
+                'url_inicio': driver.current_url,
+                'cookies': driver.get_cookies()
+            }
+            contenido = self._fernet.encrypt(json.dumps(datos).encode('utf-8'))
+            
+            # Escritura atómica con permisos restringidos
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(contenido)
+            os.replace(tmp_path, self.path)
+            
+            logger.debug(f"💾 Sesión guardada en caché ({len(datos['cookies'])} cookies)")
+            return True
+        
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo guardar la caché de sesión: {e}")
+            return False
+    
+    def _leer(self) -> Optional[Dict]:
+        """
+        Lee y descifra la caché
+        
+        Returns:
+            Datos de la caché o None si no existe, expiró o es inválida
+        """
+        if not self.path.exists():
+            return None
+        
+        try:
+            datos = json.loads(self._fernet.decrypt(self.path.read_bytes()))
+        except Exception as e:
+            logger.debug(f"Caché de sesión inválida: {e}")
+            self.invalidar()
+            return None
+        
+        if time.time() - datos.get('creada', 0) > self.max_age:
+            logger.debug("Caché de sesión expirada por antigüedad")
+            self.invalidar()
+            return None
+        
+        return datos
+    
+    def restaurar(self, driver) -> bool:
+        """
+        Restaura la sesión guardada en el driver y verifica que siga activa
+        
+        Args:
+            driver: Driver de Selenium recién creado
+        
+        Returns:
+            True si la sesión restaurada está activa
+        """
+        if not self.habilitada:
+            return False
+        
+        datos = self._leer()
+        if not datos:
+            return False
+        
+        try:
+            # Selenium solo acepta cookies del dominio cargado
+            partes = urlsplit(config.url_origen)
+            driver.get(f"{partes.scheme}://{partes.netloc}/")
+            
+            ahora = time.time()
+            for cookie in self._cookies_vigentes(datos['cookies'], ahora):
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    logger.debug(f"Cookie descartada {cookie.get('name')}: {e}")
+            
+            driver.get(datos['url_inicio'])
+            
+            if sesion_activa(driver):
+                logger.info("♻️ Sesión restaurada desde caché")
+                return True
+            
+            logger.info("⌛ Sesión en caché vencida, se requiere login")
+            self.invalidar()
+            return False
+        
+        except Exception as e:
+            logger.warning(f"⚠️ Error restaurando sesión: {e}")
+            return False
+    
+    @staticmethod
+    def _cookies_vigentes(cookies: List[Dict], ahora: float) -> List[Dict]:
+        """Filtra las cookies con fecha de expiración ya cumplida"""
+        return [c for c in cookies if not c.get('expiry') or c['expiry'] > ahora]
+    
+    def invalidar(self):
+        """Elimina la caché de sesión"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Snapshot del DOM - RPA Jano's Eventos
+======================================
+Obtiene en una sola llamada execute_script los textos visibles de la página
+(equivalente a recorrer //*[text()] con is_displayed/.text/.tag_name, que
+cuesta un round trip de WebDriver por elemento y por propiedad)
+"""
+
+from typing import List, Dict
+
+
+# Devuelve [tag, texto] de cada elemento visible con texto propio
+SCRIPT_SNAPSHOT = """
+var maxLargo = arguments[0];
+var resultado = [];
+var todos = document.getElementsByTagName('*');
+for (var i = 0; i < todos.length; i++) {
+    var el = todos[i];
+    var tieneTexto = false;
+    for (var n = el.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3 && n.nodeValue.trim()) { tieneTexto = true; break; }
+    }
+    if (!tieneTexto) continue;
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) continue;
+    if (window.getComputedStyle(el).visibility === 'hidden') continue;
+    var texto = (el.innerText || '').trim();
+    if (!texto || texto.length >= maxLargo) continue;
+    resultado.push([el.tagName.toLowerCase(), texto]);
+}
+return resultado;
+"""
+
+
+def snapshot_texto(driver, max_largo: int = 500) -> List[Dict[str, str]]:
+    """
+    Toma el snapshot de textos visibles de la página actual
+    
+    Args:
+        driver: Driver de Selenium
+        max_largo: Los textos de este largo o más se descartan
+    
+    Returns:
+        Lista de {'tag', 'texto'} en orden de documento
+    """
+    filas = driver.execute_script(SCRIPT_SNAPSHOT, max_largo) or []
+    return [{'tag': tag, 'texto': texto} for tag, texto in filas]
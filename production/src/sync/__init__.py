@@ -3,6 +3,7 @@ Módulos de sincronización
 """
 
 from .sincronizador import Sincronizador
+from .indice_coordinaciones import IndiceCoordinaciones
 
-__all__ = ['Sincronizador']
+__all__ = ['Sincronizador', 'IndiceCoordinaciones']
 
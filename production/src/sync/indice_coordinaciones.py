@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de Coordinaciones - RPA Jano's Eventos
+==============================================
+Índice de las coordinaciones que ya están en el API, con los mismos hashes
+que server.js (generarHashIdentidad / generarHashDatos). Los cargadores lo
+consultan antes de enviar cada fila del CSV y descartan las que el API
+contaría como "sin cambios", sin gastar un POST ni un formulario
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+# Importar configuración y logger
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.config import config
+from utils.logger import logger
+
+
+# Mismos campos y orden que generarHashIdentidad / generarHashDatos en server.js
+CAMPOS_HASH_IDENTIDAD = ['codigo_evento', 'client_name', 'honoree_name', 'event_date', 'salon']
+CAMPOS_HASH_DATOS = ['celular', 'celular_2', 'pack', 'event_type']
+
+
+def _texto(valor) -> str:
+    """Valor de un campo como lo concatena JavaScript (`valor || ''`)"""
+    if hasattr(valor, 'item'):
+        # Escalares de numpy/pandas
+        valor = valor.item()
+    if valor is None or valor is False or valor == '' or valor != valor:
+        return ''
+    if isinstance(valor, float):
+        if valor == 0:
+            return ''
+        return str(int(valor)) if valor.is_integer() else str(valor)
+    if isinstance(valor, int) and valor == 0:
+        return ''
+    return str(valor)
+
+
+def _hash(coord: Dict, campos: List[str]) -> str:
+    """MD5 de los campos unidos por '|'"""
+    return hashlib.md5('|'.join(_texto(coord.get(campo)) for campo in campos).encode('utf-8')).hexdigest()
+
+
+def normalizar_coordinacion(coord: Dict) -> Dict:
+    """
+    Aplica los valores por defecto de normalizarCoordinacion que afectan a
+    los hashes (el API guarda event_type 'corporativo' si no viene)
+    
+    Args:
+        coord: Coordinación tal como se va a enviar
+    
+    Returns:
+        Copia normalizada
+    """
+    return dict(coord, event_type=_texto(coord.get('event_type')) or 'corporativo')
+
+
+def hash_identidad(coord: Dict) -> str:
+    """Hash de los campos que identifican la coordinación"""
+    return _hash(coord, CAMPOS_HASH_IDENTIDAD)
+
+
+def hash_datos(coord: Dict) -> str:
+    """Hash de los campos que pueden cambiar"""
+    return _hash(coord, CAMPOS_HASH_DATOS)
+
+
+class IndiceCoordinaciones:
+    """
+    Coordinaciones existentes indexadas por (codigo_evento, hash de datos)
+    """
+    
+    def __init__(self, coordinaciones: List[Dict]):
+        """
+        Construye el índice
+        
+        Args:
+            coordinaciones: Coordinaciones devueltas por GET /api/coordinations
+        """
+        self.indice: Dict[Tuple[str, str], str] = {}
+        self.omitidas = 0
+        
+        for coord in coordinaciones:
+            codigo = _texto(coord.get('codigo_evento'))
+            if codigo:
+                self.indice[(codigo, hash_datos(coord))] = hash_identidad(coord)
+    
+    @classmethod
+    def desde_api(cls, api_url: Optional[str] = None, timeout: Optional[int] = None) -> Optional['IndiceCoordinaciones']:
+        """
+        Descarga las coordinaciones existentes (una sola vez) y arma el índice
+        
+        Args:
+            api_url: URL base del API (por defecto config.api_coordis)
+            timeout: Timeout del pedido en segundos
+        
+        Returns:
+            Índice o None si el API no respondió (hay que enviar todo)
+        """
+        url = f"{api_url or config.api_coordis}/api/coordinations"
+        try:
+            response = requests.get(url, timeout=timeout or config.browser_timeout)
+            logger.log_api_request("GET", url, response.status_code)
+            response.raise_for_status()
+            coordinaciones = response.json().get('data', [])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.log_api_error("GET", url, str(e))
+            return None
+        
+        indice = cls(coordinaciones)
+        logger.info(f"🗂️ Índice de coordinaciones: {len(indice.indice)} existentes con código")
+        return indice
+    
+    def sin_cambios(self, coord: Dict) -> bool:
+        """
+        Indica si el API ya tiene la coordinación con los mismos datos
+        
+        Args:
+            coord: Coordinación tal como se va a enviar
+        
+        Returns:
+            True si se puede omitir
+        """
+        codigo = _texto(coord.get('codigo_evento'))
+        if not codigo:
+            return False
+        
+        coord = normalizar_coordinacion(coord)
+        identidad = self.indice.get((codigo, hash_datos(coord)))
+        omitir = identidad is not None and identidad == hash_identidad(coord)
+        if omitir:
+            self.omitidas += 1
+        return omitir
@@ -20,6 +20,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.config import config
 from utils.logger import logger
+from utils.filtros_extraccion import cargar_especificacion, salon_id
 
 
 class Sincronizador:
@@ -33,6 +34,9 @@ class Sincronizador:
         self.coordis_url = config.url_coordis
         self.timeout = config.browser_timeout
         
+        # Nombre del salón en Janos -> id de salón en COORDIS
+        self.salones = cargar_especificacion()['salones']
+        
         logger.info("🔄 Inicializando Sincronizador")
     
     def _obtener_coordinaciones_api(self) -> Optional[List[Dict]]:
@@ -142,6 +146,12 @@ class Sincronizador:
                 # Mapear tipo de evento
                 event_type = self._mapear_tipo_evento(coord.get('event_type', ''))
                 
+                # Salón: sin dato se asume el primero de la especificación
+                salon_name = coord.get('salon') or next(iter(self.salones))
+                id_salon = salon_id(salon_name, self.salones)
+                if id_salon is None:
+                    logger.warning(f"⚠️ Salón sin id de COORDIS: '{salon_name}' (coordinación {coord.get('id')})")
+                
                 # Crear objeto en formato COORDIS
                 coordis_coord = {
                     "id": coord.get('id'),
@@ -160,8 +170,8 @@ class Sincronizador:
                     "created_at": coord.get('created_at', ''),
                     "updated_at": coord.get('updated_at', ''),
                     # Campos específicos de COORDIS
-                    "salon_id": 1,  # DOT
-                    "salon_name": "DOT"
+                    "salon_id": id_salon,
+                    "salon_name": salon_name
                 }
                 
                 coordis_data.append(coordis_coord)
@@ -185,6 +195,8 @@ class Sincronizador:
         """
         logger.info("📝 Generando script de sincronización")
         
+        salones_ids = sorted({c['salon_id'] for c in coordinations if c.get('salon_id') is not None})
+        
         script = f"""
 // ========================================
 // Script de Sincronización Automática
@@ -195,13 +207,17 @@ class Sincronizador:
 console.log('🔄 Iniciando sincronización de coordinaciones...');
 
 const coordinaciones = {json.dumps(coordinations, ensure_ascii=False, indent=2)};
+const salonesIds = {json.dumps(salones_ids)};
 
 try {{
     // Guardar en localStorage
     localStorage.setItem('coordinations', JSON.stringify(coordinaciones));
     
     // Guardar también en formato de salón específico
-    localStorage.setItem('salon_1_coordinations', JSON.stringify(coordinaciones));
+    salonesIds.forEach(salonId => {{
+        const delSalon = coordinaciones.filter(c => c.salon_id === salonId);
+        localStorage.setItem(`salon_${{salonId}}_coordinations`, JSON.stringify(delSalon));
+    }});
     
     console.log(`✅ ${{coordinaciones.length}} coordinaciones sincronizadas exitosamente`);
     console.log('📊 Datos guardados en localStorage');
@@ -4,6 +4,9 @@ Utilidades del sistema
 
 from .config import config, Config
 from .logger import logger, RPALogger
+from .telefonos import normalizar_celular, extraer_celulares
+from .filtros_extraccion import cargar_especificacion, expandir_combinaciones
 
-__all__ = ['config', 'Config', 'logger', 'RPALogger']
+__all__ = ['config', 'Config', 'logger', 'RPALogger', 'normalizar_celular', 'extraer_celulares',
+           'cargar_especificacion', 'expandir_combinaciones']
 
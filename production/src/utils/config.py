@@ -74,6 +74,36 @@ class Config:
         """URL del API COORDIS"""
         return os.getenv('API_COORDIS', 'http://localhost:3002')
     
+    @property
+    def coordis_load_mode(self) -> str:
+        """Modo del cargador masivo: 'api' (carga por lotes) o 'ui' (formulario)"""
+        return os.getenv('COORDIS_LOAD_MODE', 'api').lower()
+    
+    @property
+    def bulk_chunk_size(self) -> int:
+        """Coordinaciones por pedido a /api/coordinations/bulk"""
+        return max(1, int(os.getenv('BULK_CHUNK_SIZE', '100')))
+    
+    @property
+    def bulk_ui_fallback(self) -> bool:
+        """Cargar por el formulario de COORDIS los lotes que el API no aceptó"""
+        return os.getenv('BULK_UI_FALLBACK', 'false').lower() == 'true'
+    
+    @property
+    def coordis_ui_workers(self) -> int:
+        """Navegadores que completan el formulario de COORDIS en paralelo"""
+        return max(1, int(os.getenv('COORDIS_UI_WORKERS', '1')))
+    
+    @property
+    def coordis_fill_strategy(self) -> str:
+        """Llenado del formulario: 'script' (una llamada JS) o 'teclado' (send_keys por campo)"""
+        return os.getenv('COORDIS_FILL_STRATEGY', 'script').lower()
+    
+    @property
+    def coordis_skip_unchanged(self) -> bool:
+        """Omitir las filas que el API ya tiene sin cambios antes de cargarlas"""
+        return os.getenv('COORDIS_SKIP_UNCHANGED', 'true').lower() == 'true'
+    
     # ====== CONFIGURACIÓN APIs ======
     
     @property
@@ -113,6 +143,211 @@ class Config:
         """Espera implícita del navegador en segundos"""
         return int(os.getenv('IMPLICIT_WAIT', '10'))
     
+    @property
+    def page_load_strategy(self) -> str:
+        """Estrategia de carga de página: 'normal' o 'eager' (no espera imágenes/subrecursos)"""
+        return os.getenv('PAGE_LOAD_STRATEGY', 'normal').lower()
+    
+    # ====== PERFIL DE SCRAPING (recursos bloqueados) ======
+    
+    @property
+    def scrape_block_images(self) -> bool:
+        """Deshabilitar la carga de imágenes"""
+        return os.getenv('SCRAPE_BLOCK_IMAGES', 'true').lower() == 'true'
+    
+    @property
+    def scrape_block_stylesheets(self) -> bool:
+        """Bloquear hojas de estilo (los modales de Janos dependen del CSS)"""
+        return os.getenv('SCRAPE_BLOCK_STYLESHEETS', 'false').lower() == 'true'
+    
+    @property
+    def scrape_block_fonts(self) -> bool:
+        """Bloquear fuentes web"""
+        return os.getenv('SCRAPE_BLOCK_FONTS', 'true').lower() == 'true'
+    
+    @property
+    def scrape_block_analytics(self) -> bool:
+        """Bloquear analytics y otros scripts de terceros conocidos"""
+        return os.getenv('SCRAPE_BLOCK_ANALYTICS', 'true').lower() == 'true'
+    
+    @property
+    def scrape_blocked_urls(self) -> list[str]:
+        """Patrones de URL adicionales a bloquear (separados por coma)"""
+        valor = os.getenv('SCRAPE_BLOCKED_URLS', '')
+        return [patron.strip() for patron in valor.split(',') if patron.strip()]
+    
+    # ====== CONFIGURACIÓN EXTRACCIÓN ======
+    
+    @property
+    def extraction_workers(self) -> int:
+        """Cantidad de sesiones de navegador en paralelo para la extracción"""
+        return max(1, int(os.getenv('EXTRACTION_WORKERS', '1')))
+    
+    @property
+    def extraction_engine(self) -> str:
+        """Motor de extracción: 'selenium' (navegador) o 'http' (sin navegador)"""
+        return os.getenv('EXTRACTION_ENGINE', 'selenium').lower()
+    
+    @property
+    def http_workers(self) -> int:
+        """Cantidad de descargas concurrentes del motor HTTP"""
+        return max(1, int(os.getenv('HTTP_WORKERS', '8')))
+    
+    @property
+    def http_fallback_selenium(self) -> bool:
+        """Usar Selenium si la extracción HTTP falla"""
+        return os.getenv('HTTP_FALLBACK_SELENIUM', 'true').lower() == 'true'
+    
+    @property
+    def tab_batch_enabled(self) -> bool:
+        """Leer las páginas ver_evento.php en pestañas del mismo navegador"""
+        return os.getenv('TAB_BATCH_ENABLED', 'false').lower() == 'true'
+    
+    @property
+    def tab_pool_size(self) -> int:
+        """Pestañas cargando a la vez en el modo por pestañas"""
+        return max(1, int(os.getenv('TAB_POOL_SIZE', '4')))
+    
+    @property
+    def extraction_filters_path(self) -> Path:
+        """Especificación de las combinaciones salón/zona/año a extraer"""
+        return self.CONFIG_DIR / os.getenv('EXTRACTION_FILTERS_FILE', 'filtros_extraccion.json')
+    
+    @property
+    def partitions_dir(self) -> Path:
+        """Directorio de los CSV por combinación de filtros"""
+        return self.DATA_DIR / 'particiones'
+    
+    @property
+    def checkpoint_enabled(self) -> bool:
+        """Registrar cada fecha completada para poder reanudar con --resume"""
+        return os.getenv('CHECKPOINT_ENABLED', 'true').lower() == 'true'
+    
+    @property
+    def checkpoint_path(self) -> Path:
+        """Ruta del diario de checkpoints de la extracción"""
+        return self.DATA_DIR / os.getenv('CHECKPOINT_FILE', 'checkpoint_extraccion.jsonl')
+    
+    # ====== CONTROL DE CONCURRENCIA Y TASA ======
+    
+    @property
+    def concurrency_min(self) -> int:
+        """Piso de sesiones/descargas simultáneas (el techo es EXTRACTION_WORKERS o HTTP_WORKERS)"""
+        return max(1, int(os.getenv('CONCURRENCY_MIN', '1')))
+    
+    @property
+    def concurrency_window(self) -> int:
+        """Trabajos observados antes de cada ajuste de la concurrencia"""
+        return int(os.getenv('CONCURRENCY_WINDOW', '10'))
+    
+    @property
+    def concurrency_latency_factor(self) -> float:
+        """Latencia relativa a la mejor observada a partir de la cual se reduce la concurrencia"""
+        return float(os.getenv('CONCURRENCY_LATENCY_FACTOR', '2.0'))
+    
+    @property
+    def concurrency_max_error_rate(self) -> float:
+        """Tasa de errores/timeouts a partir de la cual se reduce la concurrencia"""
+        return float(os.getenv('CONCURRENCY_MAX_ERROR_RATE', '0.1'))
+    
+    @property
+    def concurrency_baseline_alpha(self) -> float:
+        """Peso de cada ventana en la latencia base (media móvil exponencial, 0-1)"""
+        return min(1.0, max(0.0, float(os.getenv('CONCURRENCY_BASELINE_ALPHA', '0.2'))))
+    
+    @property
+    def rate_limit_per_second(self) -> float:
+        """Pedidos por segundo a Janos entre todas las sesiones (0 = sin límite); 0.5 equivale a la pausa de 2s entre fechas"""
+        return float(os.getenv('RATE_LIMIT_PER_SECOND', '0.5'))
+    
+    @property
+    def rate_limit_burst(self) -> int:
+        """Pedidos que pueden salir en ráfaga antes de aplicar el límite"""
+        return int(os.getenv('RATE_LIMIT_BURST', '1'))
+    
+    # ====== CONFIGURACIÓN EXTRACCIÓN INCREMENTAL ======
+    
+    @property
+    def incremental_enabled(self) -> bool:
+        """Omitir las fechas cuya lista de eventos no cambió desde la última corrida"""
+        return os.getenv('INCREMENTAL_EXTRACTION', 'true').lower() == 'true'
+    
+    @property
+    def fingerprint_store_path(self) -> Path:
+        """Ruta del almacén de huellas del calendario"""
+        return self.DATA_DIR / os.getenv('FINGERPRINT_STORE_FILE', 'huellas_calendario.json')
+    
+    @property
+    def full_refresh_hours(self) -> int:
+        """Horas entre extracciones completas (se releen todas las fechas)"""
+        return int(os.getenv('FULL_REFRESH_HOURS', '24'))
+    
+    # ====== CONFIGURACIÓN CACHÉ DE URLS DE EVENTOS ======
+    
+    @property
+    def event_url_cache_enabled(self) -> bool:
+        """Ir directo a ver_evento.php con las URLs capturadas en corridas anteriores"""
+        return os.getenv('EVENT_URL_CACHE_ENABLED', 'true').lower() == 'true'
+    
+    @property
+    def event_url_cache_path(self) -> Path:
+        """Ruta del archivo con el mapa codigo_evento -> URL"""
+        return self.DATA_DIR / os.getenv('EVENT_URL_CACHE_FILE', 'urls_eventos.json')
+    
+    # ====== CONFIGURACIÓN CACHÉ DE SESIÓN ======
+    
+    @property
+    def session_cache_enabled(self) -> bool:
+        """Reutilizar las cookies de la última sesión de Janos"""
+        return os.getenv('SESSION_CACHE_ENABLED', 'true').lower() == 'true'
+    
+    @property
+    def session_cache_path(self) -> Path:
+        """Ruta del archivo cifrado con las cookies de sesión"""
+        return self.DATA_DIR / os.getenv('SESSION_CACHE_FILE', 'sesion_janos.bin')
+    
+    @property
+    def session_cache_key(self) -> str:
+        """Clave para cifrar la caché de sesión (por defecto se deriva de las credenciales)"""
+        return os.getenv('SESSION_CACHE_KEY', '')
+    
+    @property
+    def session_cache_max_age(self) -> int:
+        """Antigüedad máxima de la caché de sesión en segundos"""
+        return int(os.getenv('SESSION_CACHE_MAX_AGE', '28800'))  # 8 horas
+    
+    @property
+    def session_relogin_attempts(self) -> int:
+        """Reingresos permitidos por fecha si la sesión vence durante la extracción"""
+        return int(os.getenv('SESSION_RELOGIN_ATTEMPTS', '2'))
+    
+    # ====== CONFIGURACIÓN POOL DE NAVEGADORES ======
+    
+    @property
+    def driver_pool_enabled(self) -> bool:
+        """Mantener navegadores abiertos y logueados entre ejecuciones"""
+        return os.getenv('DRIVER_POOL_ENABLED', 'false').lower() == 'true'
+    
+    @property
+    def driver_pool_size(self) -> int:
+        """Cantidad de navegadores que se mantienen calientes"""
+        return max(1, int(os.getenv('DRIVER_POOL_SIZE', '2')))
+    
+    @property
+    def driver_pool_max_pages(self) -> int:
+        """Páginas cargadas tras las cuales se recicla un navegador"""
+        return int(os.getenv('DRIVER_POOL_MAX_PAGES', '500'))
+    
+    @property
+    def driver_pool_max_rss_mb(self) -> int:
+        """Memoria (MB) del árbol de procesos de Chrome tras la cual se recicla"""
+        return int(os.getenv('DRIVER_POOL_MAX_RSS_MB', '1500'))
+    
+    @property
+    def driver_pool_health_interval(self) -> int:
+        """Segundos entre chequeos de salud de los navegadores libres"""
+        return int(os.getenv('DRIVER_POOL_HEALTH_INTERVAL', '120'))
+    
     # ====== CONFIGURACIÓN LOGS ======
     
     @property
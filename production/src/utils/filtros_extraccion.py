@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtros de Extracción
+======================
+Especificación de las combinaciones salón/zona/año a extraer del calendario
+de Janos y del id de COORDIS de cada salón. Los valores "*" se expanden con
+las opciones que ofrece cada select del formulario de filtros
+
+Formato (JSON):
+    {
+        "combinaciones": [
+            {"salon": "*", "zona": "CABA", "ano": ["2025", "2026"]}
+        ],
+        "salones": {"DOT": 1}
+    }
+"""
+
+import re
+import json
+import itertools
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import config
+from .logger import logger
+
+
+# Clave de la especificación -> id del select en el formulario de Janos
+CAMPOS_FILTRO = {
+    'salon': 'salon',
+    'zona': 'cluster',
+    'ano': 'ano',
+}
+
+COMODIN = '*'
+
+ESPECIFICACION_POR_DEFECTO = {
+    'combinaciones': [{'salon': 'DOT', 'zona': 'CABA', 'ano': '2025'}],
+    'salones': {'DOT': 1},
+}
+
+
+def cargar_especificacion(path: Optional[Path] = None) -> Dict:
+    """
+    Lee la especificación de filtros
+    
+    Args:
+        path: Archivo JSON (por defecto config.extraction_filters_path)
+    
+    Returns:
+        Diccionario con 'combinaciones' y 'salones'
+    """
+    path = Path(path) if path else config.extraction_filters_path
+    if not path.exists():
+        return dict(ESPECIFICACION_POR_DEFECTO)
+    
+    try:
+        datos = json.loads(path.read_text(encoding='utf-8'))
+    except Exception as e:
+        logger.error(f"❌ Especificación de filtros inválida ({path}): {e}")
+        return dict(ESPECIFICACION_POR_DEFECTO)
+    
+    return {
+        'combinaciones': datos.get('combinaciones') or ESPECIFICACION_POR_DEFECTO['combinaciones'],
+        'salones': datos.get('salones') or ESPECIFICACION_POR_DEFECTO['salones'],
+    }
+
+
+def _valores(valor) -> List[str]:
+    """Normaliza el valor de un filtro a una lista"""
+    if isinstance(valor, (list, tuple)):
+        return [str(v) for v in valor]
+    return [str(valor)]
+
+
+def requiere_opciones(especificacion: Dict) -> bool:
+    """Indica si alguna combinación usa el comodín y hay que leer los selects"""
+    return any(
+        COMODIN in _valores(combinacion.get(campo, COMODIN))
+        for combinacion in especificacion['combinaciones']
+        for campo in CAMPOS_FILTRO
+    )
+
+
+def expandir_combinaciones(combinaciones: List[Dict],
+                           opciones: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, str]]:
+    """
+    Expande comodines y listas en combinaciones simples salon/zona/ano
+    
+    Args:
+        combinaciones: Combinaciones de la especificación
+        opciones: Opciones de cada select (clave de CAMPOS_FILTRO -> textos)
+    
+    Returns:
+        Combinaciones sin repetir, en el orden de la especificación
+    """
+    resultado = []
+    vistas = set()
+    
+    for combinacion in combinaciones:
+        valores_campo = []
+        for campo in CAMPOS_FILTRO:
+            valores = _valores(combinacion.get(campo, COMODIN))
+            disponibles = (opciones or {}).get(campo)
+            
+            if COMODIN in valores:
+                if not disponibles:
+                    logger.warning(f"⚠️ Sin opciones para expandir '{COMODIN}' en el filtro {campo}")
+                valores = list(disponibles or [])
+            elif disponibles:
+                faltantes = [v for v in valores if v not in disponibles]
+                if faltantes:
+                    logger.warning(f"⚠️ Opciones no disponibles en el filtro {campo}: {faltantes}")
+                valores = [v for v in valores if v in disponibles]
+            
+            valores_campo.append(valores)
+        
+        for salon, zona, ano in itertools.product(*valores_campo):
+            clave = (salon, zona, ano)
+            if clave not in vistas:
+                vistas.add(clave)
+                resultado.append({'salon': salon, 'zona': zona, 'ano': ano})
+    
+    return resultado
+
+
+def es_matriz(especificacion: Dict) -> bool:
+    """Indica si la especificación produce más de una combinación"""
+    if requiere_opciones(especificacion):
+        return True
+    return len(expandir_combinaciones(especificacion['combinaciones'])) > 1
+
+
+def clave_particion(filtro: Dict[str, str]) -> str:
+    """
+    Nombre de archivo seguro para la partición de una combinación
+    
+    Args:
+        filtro: Combinación salon/zona/ano
+    
+    Returns:
+        Por ejemplo 'DOT_CABA_2025'
+    """
+    partes = [filtro.get(campo, '') for campo in CAMPOS_FILTRO]
+    return '_'.join(re.sub(r'[^0-9A-Za-z]+', '-', parte).strip('-') for parte in partes)
+
+
+def salon_id(nombre: str, salones: Dict[str, int]) -> Optional[int]:
+    """
+    Id de COORDIS de un salón
+    
+    Args:
+        nombre: Nombre del salón tal como aparece en Janos
+        salones: Mapa nombre -> id de la especificación
+    
+    Returns:
+        Id del salón o None si no está en el mapa
+    """
+    nombre = (nombre or '').strip()
+    if nombre in salones:
+        return salones[nombre]
+    
+    # Janos a veces muestra el salón con otro formato ("Salon DOT", "dot")
+    for conocido, id_salon in salones.items():
+        if conocido.lower() in nombre.lower():
+            return id_salon
+    return None
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extracción de Teléfonos
+========================
+Búsqueda de celulares de CABA/AMBA en el texto o HTML de las páginas de Janos.
+Se buscan solo cerca de los rótulos "Celular" con una regex precompilada y
+se normalizan a la forma canónica 5411XXXXXXXX
+"""
+
+import re
+from typing import Iterable, List, Optional
+
+
+# Rótulo que marca el comienzo de la zona donde se buscan los números
+PATRON_ROTULO = re.compile(r'celular', re.IGNORECASE)
+
+# Una sola regex para todas las variantes:
+#   5411XXXXXXXX, +54 11 XXXX XXXX, +54 9 11 XXXX-XXXX, 011 15 XXXX XXXX, 11 XXXXXXXX
+PATRON_CELULAR = re.compile(
+    r'(?<!\d)'
+    r'(?:\+?\s*54[\s\-]*(?:9[\s\-]*)?|0)?'
+    r'11[\s\-]*'
+    r'(?:15[\s\-]*)?'
+    r'(\d{4})[\s\-]*(\d{4})'
+    r'(?!\d)'
+)
+
+PATRON_TAG_HTML = re.compile(r'<[^>]+>')
+
+# Caracteres que se miran después de cada rótulo (cubre la celda siguiente)
+VENTANA_ROTULO = 300
+
+
+def normalizar_celular(texto: str) -> Optional[str]:
+    """
+    Normaliza un celular a la forma canónica 5411XXXXXXXX
+    
+    Args:
+        texto: Número en cualquiera de los formatos soportados
+    
+    Returns:
+        Número normalizado o None si no es un celular reconocible
+    """
+    coincidencia = PATRON_CELULAR.search(texto or '')
+    if not coincidencia:
+        return None
+    return f"5411{coincidencia.group(1)}{coincidencia.group(2)}"
+
+
+def formato_local(celular: str) -> str:
+    """
+    Convierte la forma canónica al formato local de 10 dígitos (11XXXXXXXX)
+    
+    Args:
+        celular: Número normalizado (5411XXXXXXXX)
+    
+    Returns:
+        Número sin el código de país
+    """
+    return celular[2:] if celular.startswith('54') else celular
+
+
+def extraer_celulares(contenido: str, ventana: int = VENTANA_ROTULO) -> List[str]:
+    """
+    Extrae los celulares que aparecen a continuación de los rótulos "Celular"
+    
+    Args:
+        contenido: Texto plano o HTML de la página
+        ventana: Caracteres a revisar después de cada rótulo
+    
+    Returns:
+        Celulares normalizados, sin repetir y en orden de aparición
+    """
+    encontrados = []
+    vistos = set()
+    
+    for rotulo in PATRON_ROTULO.finditer(contenido or ''):
+        zona = contenido[rotulo.end():rotulo.end() + ventana]
+        zona = PATRON_TAG_HTML.sub(' ', zona)
+        
+        for coincidencia in PATRON_CELULAR.finditer(zona):
+            celular = f"5411{coincidencia.group(1)}{coincidencia.group(2)}"
+            if celular not in vistos:
+                vistos.add(celular)
+                encontrados.append(celular)
+    
+    return encontrados
+
+
+def extraer_celulares_lote(paginas: Iterable[str]) -> List[List[str]]:
+    """
+    Extrae los celulares de muchas páginas (por ejemplo, HTML archivado)
+    
+    Args:
+        paginas: Contenidos de las páginas
+    
+    Returns:
+        Lista con los celulares de cada página
+    """
+    return [extraer_celulares(pagina) for pagina in paginas]
@@ -8,6 +8,8 @@ Incluye todos los datos requeridos: Homenajeada/o, Código, Tipo evento, Fecha,
 import time
 import re
 import pandas as pd
+import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -16,6 +18,10 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+# Módulos compartidos del sistema de producción
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production', 'src'))
+from rpa.snapshot_dom import snapshot_texto
+
 def extraer_datos_evento_completo():
     """Extraer todos los datos del evento de manera completa y precisa"""
     
@@ -211,19 +217,8 @@ def extraer_datos_evento_completo():
             'tipo_pack': None,
         }
         
-        # Obtener todos los elementos de texto de la página
-        todos_elementos = driver.find_elements(By.XPATH, "//*[text()]")
-        elementos_relevantes = []
-        
-        for elem in todos_elementos:
-            if elem.is_displayed() and elem.text.strip():
-                texto = elem.text.strip()
-                if len(texto) > 0 and len(texto) < 500:
-                    elementos_relevantes.append({
-                        'tag': elem.tag_name,
-                        'texto': texto,
-                        'elemento': elem
-                    })
+        # Snapshot de todos los textos visibles en una sola llamada al navegador
+        elementos_relevantes = snapshot_texto(driver)
         
         print(f"Total de elementos con texto: {len(elementos_relevantes)}")
         